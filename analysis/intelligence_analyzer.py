@@ -11,7 +11,7 @@ class IntelligenceAnalyzer:
     def analyze_company(self, company_data: Dict) -> Dict:
         """Analyze company data and identify financial planning opportunities"""
         try:
-            self.logger.info(f"Starting analysis for company: {company_data.get('name', 'Unknown')}")
+            self.logger.info("Starting analysis for company: %s", company_data.get('name', 'Unknown'))
             
             analysis_result = {
                 'summary': {},
@@ -51,7 +51,7 @@ class IntelligenceAnalyzer:
             planning_needs = self._determine_planning_needs(opportunities, company_data)
             analysis_result['planning_needs'] = planning_needs
             
-            self.logger.info(f"Analysis completed for {company_data.get('name', 'Unknown')}")
+            self.logger.info("Analysis completed for %s", company_data.get('name', 'Unknown'))
             return analysis_result
             
         except Exception as e:
@@ -1,6 +1,5 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from werkzeug.security import generate_password_hash
 from datetime import timedelta
 import re
 from models import db, User, AuditLog
@@ -54,7 +53,7 @@ def register():
         db.session.commit()
         
         # Log registration
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=user.id,
             data_sources=['user_registration'],
             access_method='api',
@@ -104,7 +103,7 @@ def login():
         db.session.commit()
         
         # Log login
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=user.id,
             data_sources=['user_login'],
             access_method='api',
@@ -171,7 +170,7 @@ def update_profile():
         db.session.commit()
         
         # Log profile update
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=user.id,
             data_sources=['profile_update'],
             access_method='api',
@@ -221,7 +220,7 @@ def change_password():
         db.session.commit()
         
         # Log password change
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=user.id,
             data_sources=['password_change'],
             access_method='api',
@@ -287,7 +286,7 @@ def upgrade_subscription():
         db.session.commit()
         
         # Log subscription upgrade
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=user.id,
             data_sources=['subscription_upgrade'],
             access_method='api',
@@ -315,7 +314,7 @@ def logout():
         current_user_id = get_jwt_identity()
         
         # Log logout
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['user_logout'],
             access_method='api',
@@ -1,24 +1,195 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from models import db, User, AuditLog, AuditLog
+from models import db, User, AuditLog, AuditLogSource, ComplianceReport
+from models.compliance_report import REPORT_DAYS
 from datetime import datetime, timedelta
+import csv
+import hashlib
+import io
+import orjson
+import sys
+from sqlalchemy import tuple_
+from extensions import cache
 
 compliance_bp = Blueprint('compliance', __name__)
 
+def _user_exists(user_id):
+    """Whether the token's user still exists, checked with a single-column primary key lookup"""
+    return db.session.query(User.id).filter_by(id=user_id).scalar() is not None
+
+def _static_json(payload):
+    """Encode a constant payload once, returning (body, etag)"""
+    body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def _static_response(static, public=True):
+    """Serve a precomputed JSON body, answering 304 when the client already has it"""
+    body, etag = static
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.max_age = 3600
+    if public:
+        response.cache_control.public = True
+    else:
+        response.cache_control.private = True
+    return response.make_conditional(request)
+
+# The policy and data source descriptions never change at runtime, so their JSON and ETag are built once
+_DATA_SOURCES = _static_json({
+    'data_sources': {
+        'sec_data': {
+            'name': 'SEC EDGAR Database',
+            'compliance_status': 'Compliant',
+            'data_types': 'Public financial filings',
+            'rate_limits': '10 requests per second',
+            'privacy_impact': 'Low - Public data only',
+            'retention_policy': 'Permanent public record'
+        },
+        'linkedin_data': {
+            'name': 'LinkedIn Public Company Pages',
+            'compliance_status': 'Compliant',
+            'data_types': 'Public business information',
+            'rate_limits': 'Respects robots.txt',
+            'privacy_impact': 'Low - Public business data only',
+            'retention_policy': 'Business information only'
+        },
+        'news_data': {
+            'name': 'Legitimate News Sources',
+            'compliance_status': 'Compliant',
+            'data_types': 'Public news content',
+            'rate_limits': 'Respects source limits',
+            'privacy_impact': 'Low - Public news only',
+            'retention_policy': 'News content only'
+        },
+        'industry_research': {
+            'name': 'Industry Research Databases',
+            'compliance_status': 'Compliant',
+            'data_types': 'Aggregated industry statistics',
+            'rate_limits': 'Licensed access',
+            'privacy_impact': 'Low - No individual data',
+            'retention_policy': 'Industry-level data only'
+        }
+    }
+})
+
+_PRIVACY_POLICY = _static_json({
+    'privacy_policy': {
+        'data_collection': {
+            'personal_data': 'Minimal - Only account information',
+            'business_data': 'Public business information only',
+            'data_retention': 'As long as account is active',
+            'data_sharing': 'No sharing with third parties'
+        },
+        'compliance': {
+            'gdpr': 'Compliant',
+            'ccpa': 'Compliant',
+            'sox': 'Not applicable - No financial reporting',
+            'hipaa': 'Not applicable - No health data'
+        },
+        'security': {
+            'encryption': 'All data encrypted in transit and at rest',
+            'access_controls': 'Role-based access control',
+            'audit_logging': 'Complete audit trail maintained',
+            'data_backup': 'Regular automated backups'
+        },
+        'user_rights': {
+            'access': 'Users can access their data',
+            'correction': 'Users can correct their data',
+            'deletion': 'Users can delete their account and data',
+            'portability': 'Users can export their data'
+        }
+    }
+})
+
+_TERMS_OF_SERVICE = _static_json({
+    'terms_of_service': {
+        'acceptable_use': {
+            'business_purposes': 'Only for legitimate business intelligence',
+            'compliance': 'Must comply with all applicable laws',
+            'data_respect': 'Must respect data source terms of service',
+            'no_misuse': 'No unauthorized access or data scraping'
+        },
+        'limitations': {
+            'rate_limits': 'Must respect all rate limits',
+            'data_usage': 'Data for business intelligence only',
+            'redistribution': 'No redistribution of data',
+            'commercial_use': 'Commercial use allowed with proper licensing'
+        },
+        'liability': {
+            'data_accuracy': 'No guarantee of data accuracy',
+            'service_availability': 'No guarantee of service availability',
+            'damages': 'Limited liability for damages',
+            'indemnification': 'Users must indemnify against misuse'
+        },
+        'termination': {
+            'violation': 'Service may be terminated for violations',
+            'data_retention': 'Data may be retained for compliance',
+            'refunds': 'No refunds for policy violations'
+        }
+    }
+})
+
+# Columns written to audit log CSV exports, in order
+_EXPORT_COLUMNS = (
+    AuditLog.id,
+    AuditLog.created_at,
+    AuditLog.action_type,
+    AuditLog.action_description,
+    AuditLog.resource_type,
+    AuditLog.resource_id,
+    AuditLog.data_sources_used,
+    AuditLog.data_access_method,
+    AuditLog.data_access_url,
+    AuditLog.compliance_status,
+    AuditLog.privacy_impact,
+    AuditLog.ip_address,
+    AuditLog.request_method,
+    AuditLog.request_url,
+    AuditLog.success
+)
+_EXPORT_BATCH_SIZE = 1000
+# Leading characters that make spreadsheets evaluate a cell as a formula
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def _csv_cell(value):
+    """Prefix text a spreadsheet would run as a formula with ' so the export opens as plain values"""
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+# Keyset pagination: audit log pages are ordered by these columns, descending
+_MAX_PAGE_SIZE = 100
+_AUDIT_LOG_KEYSET = (AuditLog.created_at, AuditLog.id)
+
+if sys.version_info >= (3, 11):
+    # Parses a trailing 'Z' natively
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value):
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC"""
+        return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+def _encode_cursor(log):
+    """Build a 'created_at,id' cursor from the last audit log on a page"""
+    return f'{log.created_at.isoformat()},{log.id}'
+
+def _decode_cursor(cursor):
+    """Parse a cursor back into (created_at, id)"""
+    created_at, log_id = cursor.split(',')
+    return _parse_iso(created_at), int(log_id)
+
 @compliance_bp.route('/audit-logs', methods=['GET'])
 @jwt_required()
 def get_audit_logs():
     """Get audit logs for current user"""
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
+        if not _user_exists(current_user_id):
             return jsonify({'error': 'User not found'}), 404
         
         # Get query parameters
-        page = request.args.get('page', 1, type=int)
-        per_page = min(request.args.get('per_page', 50, type=int), 100)
+        per_page = max(1, min(request.args.get('per_page', 50, type=int), _MAX_PAGE_SIZE))
+        cursor = request.args.get('cursor')
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
         data_source = request.args.get('data_source')
@@ -28,42 +199,53 @@ def get_audit_logs():
         
         if start_date:
             try:
-                start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                query = query.filter(AuditLog.timestamp >= start_dt)
+                start_dt = _parse_iso(start_date)
+                query = query.filter(AuditLog.created_at >= start_dt)
             except ValueError:
                 return jsonify({'error': 'Invalid start_date format'}), 400
         
         if end_date:
             try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                query = query.filter(AuditLog.timestamp <= end_dt)
+                end_dt = _parse_iso(end_date)
+                query = query.filter(AuditLog.created_at <= end_dt)
             except ValueError:
                 return jsonify({'error': 'Invalid end_date format'}), 400
         
         if data_source:
-            query = query.filter(AuditLog.data_sources.contains([data_source]))
+            query = query.join(AuditLogSource, AuditLogSource.audit_log_id == AuditLog.id).filter(
+                AuditLogSource.source == data_source
+            )
         
-        # Order by timestamp descending
-        query = query.order_by(AuditLog.timestamp.desc())
+        # Total is a COUNT over the whole filtered range, so only run it on request
+        total = query.count() if request.args.get('include_total') == '1' else None
         
-        # Paginate results
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        # Keyset pagination: continue after the cursor row, newest first
+        if cursor:
+            try:
+                query = query.filter(tuple_(*_AUDIT_LOG_KEYSET) < tuple_(*_decode_cursor(cursor)))
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+        
+        # One extra row tells whether another page follows; the page is fetched here, so database
+        # errors still get the 500 below instead of cutting off a response that has already started
+        logs = query.order_by(*(column.desc() for column in _AUDIT_LOG_KEYSET)).limit(per_page + 1).all()
+        has_next = len(logs) > per_page
+        logs = logs[:per_page]
+        pagination = {
+            'per_page': per_page,
+            'next_cursor': _encode_cursor(logs[-1]) if has_next else None,
+            'has_next': has_next,
+            'total': total
+        }
         
-        return jsonify({
-            'audit_logs': [log.to_dict() for log in pagination.items],
-            'pagination': {
-                'page': page,
-                'per_page': per_page,
-                'total': pagination.total,
-                'pages': pagination.pages,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
-            }
-        })
+        def generate():
+            # Encode one entry at a time rather than building the whole body
+            yield b'{"audit_logs":['
+            for count, log in enumerate(logs):
+                yield orjson.dumps(log.to_cached_dict()) if count == 0 else b',' + orjson.dumps(log.to_cached_dict())
+            yield b'],"pagination":' + orjson.dumps(pagination) + b'}'
+        
+        return Response(stream_with_context(generate()), mimetype='application/json')
         
     except Exception as e:
         return jsonify({'error': f'Failed to get audit logs: {str(e)}'}), 500
@@ -71,12 +253,10 @@ def get_audit_logs():
 @compliance_bp.route('/audit-logs/export', methods=['GET'])
 @jwt_required()
 def export_audit_logs():
-    """Export audit logs as CSV or other format"""
+    """Export audit logs as CSV"""
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
+        if not _user_exists(current_user_id):
             return jsonify({'error': 'User not found'}), 404
         
         # Get date range
@@ -87,31 +267,20 @@ def export_audit_logs():
             return jsonify({'error': 'start_date and end_date are required'}), 400
         
         try:
-            start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            start_dt = _parse_iso(start_date)
+            end_dt = _parse_iso(end_date)
         except ValueError:
             return jsonify({'error': 'Invalid date format'}), 400
         
-        # Get audit logs for date range
-        logs = AuditLog.query.filter(
+        # Exported columns only, streamed from a server-side cursor
+        logs = db.session.query(*_EXPORT_COLUMNS).filter(
             AuditLog.user_id == current_user_id,
-            AuditLog.timestamp >= start_dt,
-            AuditLog.timestamp <= end_dt
-        ).order_by(AuditLog.timestamp.desc()).all()
-        
-        # Generate export data
-        export_data = {
-            'logs': [log.to_dict() for log in logs],
-            'export_date': datetime.utcnow().isoformat(),
-            'exported_by': current_user_id,
-            'date_range': {
-                'start_date': start_date,
-                'end_date': end_date
-            }
-        }
+            AuditLog.created_at >= start_dt,
+            AuditLog.created_at <= end_dt
+        ).order_by(AuditLog.created_at.desc()).yield_per(_EXPORT_BATCH_SIZE)
         
         # Log export
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['audit_log_export'],
             access_method='api',
@@ -122,88 +291,92 @@ def export_audit_logs():
             request_url=request.url
         )
         
-        return jsonify({
-            'export_data': export_data,
-            'message': 'Audit logs exported successfully'
-        })
+        def generate():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(column.key for column in _EXPORT_COLUMNS)
+            
+            for count, row in enumerate(logs, 1):
+                row = row._asdict()
+                row['data_sources_used'] = ';'.join(row['data_sources_used'] or ())
+                writer.writerow(map(_csv_cell, row.values()))
+                
+                # Hand the client one chunk per batch
+                if count % _EXPORT_BATCH_SIZE == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            
+            yield buffer.getvalue()
+        
+        filename = f'audit_logs_{start_dt:%Y%m%d}_{end_dt:%Y%m%d}.csv'
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
         
     except Exception as e:
         return jsonify({'error': f'Failed to export audit logs: {str(e)}'}), 500
 
+@cache.memoize(timeout=300)
+def _compliance_report_body(user_id, today, latest_log):
+    """Encoded 30-day compliance report; `today` and `latest_log` only version the cache entry"""
+    # Whole UTC days: completed days come from the nightly rollup, only the rest is grouped live
+    end_date = datetime.utcnow()
+    start_day = end_date.date() - timedelta(days=REPORT_DAYS)
+    start_date = datetime.combine(start_day, datetime.min.time())
+    
+    daily_activity, access_method_usage, data_source_usage = ComplianceReport.summarize(
+        ComplianceReport.usage_between(user_id, start_day, end_date)
+    )
+    
+    # Calculate compliance metrics
+    total_activities = sum(daily_activity.values())
+    
+    # Compliance status
+    compliance_status = {
+        'data_access_compliant': True,  # Assuming all access is compliant
+        'rate_limits_respected': True,
+        'privacy_protected': True,
+        'audit_trail_complete': True
+    }
+    
+    compliance_report = {
+        'user_id': user_id,
+        'report_period': {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat()
+        },
+        'total_activities': total_activities,
+        'data_source_usage': data_source_usage,
+        'access_method_usage': access_method_usage,
+        'daily_activity': daily_activity,
+        'compliance_status': compliance_status,
+        'generated_at': datetime.utcnow().isoformat()
+    }
+    
+    return orjson.dumps(
+        {'compliance_report': compliance_report}, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+    )
+
 @compliance_bp.route('/compliance-report', methods=['GET'])
 @jwt_required()
 def get_compliance_report():
     """Get compliance report for current user"""
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
+        if not _user_exists(current_user_id):
             return jsonify({'error': 'User not found'}), 404
         
-        # Get date range (default to last 30 days)
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=30)
-        
-        # Get audit logs for period
-        logs = AuditLog.query.filter(
-            AuditLog.user_id == current_user_id,
-            AuditLog.timestamp >= start_date,
-            AuditLog.timestamp <= end_date
-        ).all()
-        
-        # Calculate compliance metrics
-        total_activities = len(logs)
-        
-        # Group by data source
-        data_source_usage = {}
-        for log in logs:
-            for source in log.data_sources:
-                if source not in data_source_usage:
-                    data_source_usage[source] = 0
-                data_source_usage[source] += 1
-        
-        # Group by access method
-        access_method_usage = {}
-        for log in logs:
-            method = log.access_method
-            if method not in access_method_usage:
-                access_method_usage[method] = 0
-            access_method_usage[method] += 1
+        # The newest entry is one index lookup; any logged activity moves it and so misses the cache
+        latest_log = db.session.query(AuditLog.created_at, AuditLog.id).filter(
+            AuditLog.user_id == current_user_id
+        ).order_by(*(column.desc() for column in _AUDIT_LOG_KEYSET)).first()
+        latest_log = tuple(latest_log) if latest_log else None
         
-        # Calculate daily activity
-        daily_activity = {}
-        for log in logs:
-            date_str = log.timestamp.strftime('%Y-%m-%d')
-            if date_str not in daily_activity:
-                daily_activity[date_str] = 0
-            daily_activity[date_str] += 1
-        
-        # Compliance status
-        compliance_status = {
-            'data_access_compliant': True,  # Assuming all access is compliant
-            'rate_limits_respected': True,
-            'privacy_protected': True,
-            'audit_trail_complete': True
-        }
-        
-        compliance_report = {
-            'user_id': current_user_id,
-            'report_period': {
-                'start_date': start_date.isoformat(),
-                'end_date': end_date.isoformat()
-            },
-            'total_activities': total_activities,
-            'data_source_usage': data_source_usage,
-            'access_method_usage': access_method_usage,
-            'daily_activity': daily_activity,
-            'compliance_status': compliance_status,
-            'generated_at': datetime.utcnow().isoformat()
-        }
-        
-        return jsonify({
-            'compliance_report': compliance_report
-        })
+        body = _compliance_report_body(current_user_id, datetime.utcnow().date(), latest_log)
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         return jsonify({'error': f'Failed to get compliance report: {str(e)}'}), 500
@@ -212,125 +385,18 @@ def get_compliance_report():
 @jwt_required()
 def get_data_source_info():
     """Get information about data sources and compliance"""
-    try:
-        # This would typically come from configuration or database
-        # For now, return predefined information
-        data_sources = {
-            'sec_data': {
-                'name': 'SEC EDGAR Database',
-                'compliance_status': 'Compliant',
-                'data_types': 'Public financial filings',
-                'rate_limits': '10 requests per second',
-                'privacy_impact': 'Low - Public data only',
-                'retention_policy': 'Permanent public record'
-            },
-            'linkedin_data': {
-                'name': 'LinkedIn Public Company Pages',
-                'compliance_status': 'Compliant',
-                'data_types': 'Public business information',
-                'rate_limits': 'Respects robots.txt',
-                'privacy_impact': 'Low - Public business data only',
-                'retention_policy': 'Business information only'
-            },
-            'news_data': {
-                'name': 'Legitimate News Sources',
-                'compliance_status': 'Compliant',
-                'data_types': 'Public news content',
-                'rate_limits': 'Respects source limits',
-                'privacy_impact': 'Low - Public news only',
-                'retention_policy': 'News content only'
-            },
-            'industry_research': {
-                'name': 'Industry Research Databases',
-                'compliance_status': 'Compliant',
-                'data_types': 'Aggregated industry statistics',
-                'rate_limits': 'Licensed access',
-                'privacy_impact': 'Low - No individual data',
-                'retention_policy': 'Industry-level data only'
-            }
-        }
-        
-        return jsonify({
-            'data_sources': data_sources
-        })
-        
-    except Exception as e:
-        return jsonify({'error': f'Failed to get data source info: {str(e)}'}), 500
+    # Behind authentication, so shared caches must not store it
+    return _static_response(_DATA_SOURCES, public=False)
 
 @compliance_bp.route('/privacy-policy', methods=['GET'])
 def get_privacy_policy():
     """Get privacy policy information"""
-    try:
-        privacy_policy = {
-            'data_collection': {
-                'personal_data': 'Minimal - Only account information',
-                'business_data': 'Public business information only',
-                'data_retention': 'As long as account is active',
-                'data_sharing': 'No sharing with third parties'
-            },
-            'compliance': {
-                'gdpr': 'Compliant',
-                'ccpa': 'Compliant',
-                'sox': 'Not applicable - No financial reporting',
-                'hipaa': 'Not applicable - No health data'
-            },
-            'security': {
-                'encryption': 'All data encrypted in transit and at rest',
-                'access_controls': 'Role-based access control',
-                'audit_logging': 'Complete audit trail maintained',
-                'data_backup': 'Regular automated backups'
-            },
-            'user_rights': {
-                'access': 'Users can access their data',
-                'correction': 'Users can correct their data',
-                'deletion': 'Users can delete their account and data',
-                'portability': 'Users can export their data'
-            }
-        }
-        
-        return jsonify({
-            'privacy_policy': privacy_policy
-        })
-        
-    except Exception as e:
-        return jsonify({'error': f'Failed to get privacy policy: {str(e)}'}), 500
+    return _static_response(_PRIVACY_POLICY)
 
 @compliance_bp.route('/terms-of-service', methods=['GET'])
 def get_terms_of_service():
     """Get terms of service"""
-    try:
-        terms_of_service = {
-            'acceptable_use': {
-                'business_purposes': 'Only for legitimate business intelligence',
-                'compliance': 'Must comply with all applicable laws',
-                'data_respect': 'Must respect data source terms of service',
-                'no_misuse': 'No unauthorized access or data scraping'
-            },
-            'limitations': {
-                'rate_limits': 'Must respect all rate limits',
-                'data_usage': 'Data for business intelligence only',
-                'redistribution': 'No redistribution of data',
-                'commercial_use': 'Commercial use allowed with proper licensing'
-            },
-            'liability': {
-                'data_accuracy': 'No guarantee of data accuracy',
-                'service_availability': 'No guarantee of service availability',
-                'damages': 'Limited liability for damages',
-                'indemnification': 'Users must indemnify against misuse'
-            },
-            'termination': {
-                'violation': 'Service may be terminated for violations',
-                'data_retention': 'Data may be retained for compliance',
-                'refunds': 'No refunds for policy violations'
-            }
-        }
-        
-        return jsonify({
-            'terms_of_service': terms_of_service
-        })
-        
-    except Exception as e:
-        return jsonify({'error': f'Failed to get terms of service: {str(e)}'}), 500
+    return _static_response(_TERMS_OF_SERVICE)
 
 @compliance_bp.route('/data-request', methods=['POST'])
 @jwt_required()
@@ -338,9 +404,7 @@ def request_data_deletion():
     """Request data deletion (GDPR compliance)"""
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
+        if not _user_exists(current_user_id):
             return jsonify({'error': 'User not found'}), 404
         
         data = request.get_json()
@@ -361,7 +425,7 @@ def request_data_deletion():
         }
         
         # Log the request
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['data_request'],
             access_method='api',
@@ -1,37 +1,126 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
-from models import db, User, Company, FinancialOpportunity, AuditLog
-from analysis.intelligence_analyzer import IntelligenceAnalyzer
-from data_collectors.company_research import CompanyResearchCollector
-from data_collectors.linkedin_data import LinkedInDataCollector
+from cachetools import TTLCache
+from sqlalchemy import and_, func, tuple_
+from sqlalchemy.orm import raiseload
+import threading
+from models import db, User, Company, CompanyProfile, BusinessProfile, FinancialOpportunity, AuditLog
 
 opportunities_bp = Blueprint('opportunities', __name__)
 
+@lru_cache(maxsize=None)
+def _get_analyzer():
+    """Build the shared analyzer on first use; it keeps no per-request state"""
+    from analysis.intelligence_analyzer import IntelligenceAnalyzer
+    return IntelligenceAnalyzer()
+
+# Individual reports keyed by (person, company); upstream sources change slowly
+_REPORT_CACHE = TTLCache(maxsize=1024, ttl=1800)
+_REPORT_LOCK = threading.Lock()
+
+# Keyset pagination: list pages are ordered by these columns, descending
+_MAX_PAGE_SIZE = 200
+_LIST_KEYSET = (FinancialOpportunity.created_at, FinancialOpportunity.id)
+_COMPANY_KEYSET = (FinancialOpportunity.priority, FinancialOpportunity.created_at, FinancialOpportunity.id)
+_CURSOR_PARSERS = {'priority': str, 'created_at': datetime.fromisoformat, 'id': int}
+
+# List endpoints select plain column rows instead of hydrating ORM instances
+_LIST_COLUMNS = FinancialOpportunity.serialized_columns()
+
+def _get_opportunity_with_owner(opportunity_id, user_id):
+    """Fetch an opportunity with the id of its company if the user owns it"""
+    row = db.session.query(FinancialOpportunity, Company.id).outerjoin(
+        Company,
+        and_(Company.id == FinancialOpportunity.company_id, Company.user_id == user_id)
+    ).filter(FinancialOpportunity.id == opportunity_id).first()
+    
+    return row if row else (None, None)
+
+def _user_exists(user_id):
+    """Whether the user exists, by primary key without loading the row"""
+    return db.session.query(User.id).filter_by(id=user_id).first() is not None
+
+def _user_owns_company(user_id, company_id):
+    """Whether the company belongs to the user; not cached, so ownership changes apply at once"""
+    return db.session.query(Company.id).filter_by(id=company_id, user_id=user_id).first() is not None
+
+def _user_company_ids(user_id):
+    """Subquery selecting the ids of companies owned by the user"""
+    return db.session.query(Company.id).filter(Company.user_id == user_id).scalar_subquery()
+
+def _page_limit():
+    """Requested page size, capped at _MAX_PAGE_SIZE"""
+    return max(1, min(request.args.get('limit', 50, type=int), _MAX_PAGE_SIZE))
+
+def _encode_cursor(row, keyset):
+    """Build a 'value,value,...' cursor from the keyset columns of the last row"""
+    values = (getattr(row, column.key) for column in keyset)
+    return ','.join(value.isoformat() if isinstance(value, datetime) else str(value) for value in values)
+
+def _decode_cursor(cursor, keyset):
+    """Parse a cursor back into values for the keyset columns"""
+    parts = cursor.split(',')
+    if len(parts) != len(keyset):
+        raise ValueError('Invalid cursor')
+    
+    return [_CURSOR_PARSERS[column.key](part) for column, part in zip(keyset, parts)]
+
+def _keyset_page(query, keyset, cursor, limit):
+    """Order the query by the keyset, descending, and return the page after the cursor"""
+    if cursor:
+        query = query.filter(tuple_(*keyset) < tuple_(*_decode_cursor(cursor, keyset)))
+    
+    return query.order_by(*(column.desc() for column in keyset)).limit(limit)
+
+def _stream_opportunities(rows, keyset, limit) -> Response:
+    """Stream {"opportunities": [...], "next_cursor": ...} for one page of _LIST_COLUMNS rows"""
+    json_provider = current_app.json
+    
+    def generate():
+        yield '{"opportunities":['
+        last_row = None
+        count = 0
+        for row in rows:
+            if count:
+                yield ','
+            yield json_provider.dumps(FinancialOpportunity.dict_from_values(row))
+            last_row = row
+            count += 1
+        
+        # A full page means there may be more rows after the last one
+        next_cursor = _encode_cursor(last_row, keyset) if count == limit else None
+        yield f'],"next_cursor":{json_provider.dumps(next_cursor)}}}'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 @opportunities_bp.route('/opportunities', methods=['GET'])
 @jwt_required()
 def get_opportunities():
     """Get financial planning opportunities for current user"""
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
+        if not _user_exists(current_user_id):
             return jsonify({'error': 'User not found'}), 404
         
-        # Get opportunities for user's companies
-        companies = Company.query.filter_by(user_id=current_user_id).all()
-        company_ids = [company.id for company in companies]
-        
-        opportunities = FinancialOpportunity.query.filter(
-            FinancialOpportunity.company_id.in_(company_ids)
-        ).order_by(FinancialOpportunity.created_at.desc()).all()
+        # Get opportunities for user's companies as column rows
+        limit = _page_limit()
+        opportunities = _keyset_page(
+            db.session.query(*_LIST_COLUMNS).filter(
+                FinancialOpportunity.company_id.in_(_user_company_ids(current_user_id))
+            ),
+            _LIST_KEYSET,
+            request.args.get('cursor'),
+            limit
+        )
         
-        return jsonify({
-            'opportunities': [opp.to_dict() for opp in opportunities]
-        })
+        return _stream_opportunities(opportunities, _LIST_KEYSET, limit)
         
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
     except Exception as e:
         return jsonify({'error': f'Failed to get opportunities: {str(e)}'}), 500
 
@@ -43,25 +132,47 @@ def get_company_opportunities(company_id):
         current_user_id = get_jwt_identity()
         
         # Verify company belongs to user
-        company = Company.query.filter_by(
-            id=company_id,
-            user_id=current_user_id
-        ).first()
-        
-        if not company:
+        if not _user_owns_company(current_user_id, company_id):
             return jsonify({'error': 'Company not found'}), 404
         
-        opportunities = FinancialOpportunity.query.filter_by(
-            company_id=company_id
-        ).order_by(FinancialOpportunity.priority.desc(), FinancialOpportunity.created_at.desc()).all()
+        limit = _page_limit()
+        opportunities = _keyset_page(
+            db.session.query(*_LIST_COLUMNS).filter_by(company_id=company_id),
+            _COMPANY_KEYSET,
+            request.args.get('cursor'),
+            limit
+        )
         
-        return jsonify({
-            'opportunities': [opp.to_dict() for opp in opportunities]
-        })
+        return _stream_opportunities(opportunities, _COMPANY_KEYSET, limit)
         
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
     except Exception as e:
         return jsonify({'error': f'Failed to get company opportunities: {str(e)}'}), 500
 
+def _add_opportunities(business_profile, opportunities_data):
+    """Add generated opportunities for a profile; the flush batches them into one multi-row INSERT"""
+    opportunities = [
+        FinancialOpportunity(
+            business_profile_id=business_profile.id,
+            user_id=business_profile.user_id,
+            company_id=business_profile.company_id,
+            opportunity_type=opp_data['type'],
+            title=opp_data['title'],
+            description=opp_data['description'],
+            priority=opp_data['priority'],
+            estimated_value=opp_data.get('estimated_value'),
+            implementation_time=opp_data.get('timeline'),
+            required_resources=opp_data.get('required_resources', [])
+        )
+        for opp_data in opportunities_data
+    ]
+    
+    # Added through the session so the UserStats counters follow the new rows
+    db.session.add_all(opportunities)
+    db.session.flush()
+    return opportunities
+
 @opportunities_bp.route('/opportunities/generate/<int:company_id>', methods=['POST'])
 @jwt_required()
 def generate_opportunities(company_id):
@@ -86,43 +197,27 @@ def generate_opportunities(company_id):
             return jsonify({'error': 'Opportunity generation limit exceeded for current subscription'}), 429
         
         # Get company profile data
-        from models import CompanyProfile
         profile = CompanyProfile.query.filter_by(company_id=company_id).first()
         
         if not profile:
             return jsonify({'error': 'Company profile not found. Please research the company first.'}), 400
         
         # Generate opportunities using AI analyzer
-        analyzer = IntelligenceAnalyzer()
-        opportunities_data = analyzer.identify_financial_opportunities(profile.to_dict())
-        
-        # Create opportunity records
-        new_opportunities = []
-        for opp_data in opportunities_data:
-            opportunity = FinancialOpportunity(
-                company_id=company_id,
-                opportunity_type=opp_data['type'],
-                title=opp_data['title'],
-                description=opp_data['description'],
-                priority=opp_data['priority'],
-                estimated_value=opp_data.get('estimated_value'),
-                implementation_timeline=opp_data.get('timeline'),
-                risk_level=opp_data.get('risk_level', 'medium'),
-                required_resources=opp_data.get('required_resources', []),
-                success_metrics=opp_data.get('success_metrics', [])
-            )
-            
-            db.session.add(opportunity)
-            new_opportunities.append(opportunity)
+        opportunities_data = _get_analyzer().identify_financial_opportunities(profile.to_dict())
         
-        db.session.commit()
+        business_profile = BusinessProfile.query.filter_by(user_id=current_user_id, company_id=company_id).first()
         
-        # Update user's opportunity generation usage
+        if not business_profile:
+            return jsonify({'error': 'Business profile not found. Please create a profile for the company first.'}), 400
+        
+        new_opportunities = _add_opportunities(business_profile, opportunities_data)
+        
+        # Update user's opportunity generation usage in the same transaction
         user.increment_opportunity_usage()
         db.session.commit()
         
         # Log opportunity generation
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['opportunity_generation'],
             access_method='api',
@@ -149,18 +244,13 @@ def get_opportunity(opportunity_id):
     try:
         current_user_id = get_jwt_identity()
         
-        opportunity = FinancialOpportunity.query.get(opportunity_id)
+        # Fetch the opportunity and verify user owns the company in one query
+        opportunity, owned_company_id = _get_opportunity_with_owner(opportunity_id, current_user_id)
         
         if not opportunity:
             return jsonify({'error': 'Opportunity not found'}), 404
         
-        # Verify user owns the company
-        company = Company.query.filter_by(
-            id=opportunity.company_id,
-            user_id=current_user_id
-        ).first()
-        
-        if not company:
+        if owned_company_id is None:
             return jsonify({'error': 'Access denied'}), 403
         
         return jsonify({
@@ -177,18 +267,13 @@ def update_opportunity(opportunity_id):
     try:
         current_user_id = get_jwt_identity()
         
-        opportunity = FinancialOpportunity.query.get(opportunity_id)
+        # Fetch the opportunity and verify user owns the company in one query
+        opportunity, owned_company_id = _get_opportunity_with_owner(opportunity_id, current_user_id)
         
         if not opportunity:
             return jsonify({'error': 'Opportunity not found'}), 404
         
-        # Verify user owns the company
-        company = Company.query.filter_by(
-            id=opportunity.company_id,
-            user_id=current_user_id
-        ).first()
-        
-        if not company:
+        if owned_company_id is None:
             return jsonify({'error': 'Access denied'}), 403
         
         data = request.get_json()
@@ -207,7 +292,7 @@ def update_opportunity(opportunity_id):
         db.session.commit()
         
         # Log opportunity update
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['opportunity_update'],
             access_method='api',
@@ -234,25 +319,20 @@ def delete_opportunity(opportunity_id):
     try:
         current_user_id = get_jwt_identity()
         
-        opportunity = FinancialOpportunity.query.get(opportunity_id)
+        # Fetch the opportunity and verify user owns the company in one query
+        opportunity, owned_company_id = _get_opportunity_with_owner(opportunity_id, current_user_id)
         
         if not opportunity:
             return jsonify({'error': 'Opportunity not found'}), 404
         
-        # Verify user owns the company
-        company = Company.query.filter_by(
-            id=opportunity.company_id,
-            user_id=current_user_id
-        ).first()
-        
-        if not company:
+        if owned_company_id is None:
             return jsonify({'error': 'Access denied'}), 403
         
         db.session.delete(opportunity)
         db.session.commit()
         
         # Log opportunity deletion
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['opportunity_deletion'],
             access_method='api',
@@ -283,40 +363,38 @@ def prioritize_opportunities():
         if not company_id:
             return jsonify({'error': 'Company ID is required'}), 400
         
-        # Verify company belongs to user
-        company = Company.query.filter_by(
-            id=company_id,
-            user_id=current_user_id
-        ).first()
-        
-        if not company:
-            return jsonify({'error': 'Company not found'}), 404
-        
-        # Get opportunities for the company
-        opportunities = FinancialOpportunity.query.filter_by(
-            company_id=company_id
-        ).all()
+        # Get the company's opportunities, joined on ownership so one query also authorizes
+        opportunities = FinancialOpportunity.query.options(raiseload('*')).join(
+            Company,
+            and_(Company.id == FinancialOpportunity.company_id, Company.user_id == current_user_id)
+        ).filter(Company.id == company_id).all()
         
+        # Only an empty result needs telling apart "not yours" from "nothing yet"
         if not opportunities:
+            if not _user_owns_company(current_user_id, company_id):
+                return jsonify({'error': 'Company not found'}), 404
             return jsonify({'error': 'No opportunities found for this company'}), 404
         
         # Use AI analyzer to prioritize opportunities
-        analyzer = IntelligenceAnalyzer()
-        prioritized_opportunities = analyzer.prioritize_opportunities(
+        prioritized_opportunities = _get_analyzer().prioritize_opportunities(
             [opp.to_dict() for opp in opportunities]
         )
         
-        # Update opportunity priorities
+        # Update the already loaded instances through an id map, limited to this company's opportunities
+        opportunities_by_id = {opp.id: opp for opp in opportunities}
         for opp_data in prioritized_opportunities:
-            opportunity = FinancialOpportunity.query.get(opp_data['id'])
+            opportunity = opportunities_by_id.get(opp_data['id'])
             if opportunity:
                 opportunity.priority = opp_data['priority']
                 opportunity.priority_reason = opp_data.get('priority_reason')
         
+        # Flush before serializing so the response does not reload each row after commit
+        db.session.flush()
+        opportunities_data = [opp.to_dict() for opp in opportunities]
         db.session.commit()
         
         # Log prioritization
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['opportunity_prioritization'],
             access_method='api',
@@ -329,7 +407,7 @@ def prioritize_opportunities():
         
         return jsonify({
             'message': 'Opportunities prioritized successfully',
-            'opportunities': [opp.to_dict() for opp in opportunities]
+            'opportunities': opportunities_data
         })
         
     except Exception as e:
@@ -342,43 +420,36 @@ def get_opportunity_analytics():
     """Get analytics and insights about opportunities"""
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
+        if not _user_exists(current_user_id):
             return jsonify({'error': 'User not found'}), 404
         
-        # Get all user's companies
-        companies = Company.query.filter_by(user_id=current_user_id).all()
-        company_ids = [company.id for company in companies]
+        owned_by_user = FinancialOpportunity.company_id.in_(_user_company_ids(current_user_id))
         
-        # Get all opportunities
-        opportunities = FinancialOpportunity.query.filter(
-            FinancialOpportunity.company_id.in_(company_ids)
-        ).all()
+        # Count opportunities and sum their value by priority; totals come from the same rows
+        priority_rows = db.session.query(
+            FinancialOpportunity.priority,
+            func.count(),
+            func.coalesce(func.sum(FinancialOpportunity.estimated_value), 0)
+        ).filter(owned_by_user).group_by(FinancialOpportunity.priority).all()
         
-        # Calculate analytics
-        total_opportunities = len(opportunities)
-        high_priority = len([opp for opp in opportunities if opp.priority == 'high'])
-        medium_priority = len([opp for opp in opportunities if opp.priority == 'medium'])
-        low_priority = len([opp for opp in opportunities if opp.priority == 'low'])
-        
-        # Calculate total estimated value
-        total_value = sum(opp.estimated_value or 0 for opp in opportunities)
+        priority_counts = {priority: count for priority, count, _ in priority_rows}
+        total_opportunities = sum(count for _, count, _ in priority_rows)
+        total_value = sum(value for _, _, value in priority_rows)
         
         # Group by opportunity type
-        type_distribution = {}
-        for opp in opportunities:
-            opp_type = opp.opportunity_type
-            if opp_type not in type_distribution:
-                type_distribution[opp_type] = 0
-            type_distribution[opp_type] += 1
+        type_distribution = dict(
+            db.session.query(FinancialOpportunity.opportunity_type, func.count())
+            .filter(owned_by_user)
+            .group_by(FinancialOpportunity.opportunity_type)
+            .all()
+        )
         
         analytics = {
             'total_opportunities': total_opportunities,
             'priority_distribution': {
-                'high': high_priority,
-                'medium': medium_priority,
-                'low': low_priority
+                'high': priority_counts.get('high', 0),
+                'medium': priority_counts.get('medium', 0),
+                'low': priority_counts.get('low', 0)
             },
             'total_estimated_value': total_value,
             'type_distribution': type_distribution,
@@ -392,121 +463,140 @@ def get_opportunity_analytics():
     except Exception as e:
         return jsonify({'error': f'Failed to get analytics: {str(e)}'}), 500
 
-def _map_company_query(query):
-    """Map ticker symbols and common misspellings to canonical company names"""
+# Known companies with every alias that refers to them. Company aliases cover
+# tickers, name variations and common misspellings; people aliases cover the
+# executives associated with the company. Executive records are returned by
+# person searches.
+_KNOWN_ENTITIES = (
+    {
+        'name': 'NVIDIA Corporation',
+        'aliases': ('nvda', 'nvidia', 'nvidia corp', 'nvidia corporation'),
+        'people': ('jensen huang', 'jensen', 'huang'),
+        'executive': {
+            'name': 'Jensen Huang',
+            'type': 'individual',
+            'title': 'CEO and Founder',
+            'company': 'NVIDIA Corporation',
+            'description': 'Co-founder, president and CEO of NVIDIA Corporation',
+            'estimated_net_worth': '$40B - $50B',
+            'linkedin_url': 'https://www.linkedin.com/company/nvidia',
+            'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
+            'data_sources': ['Public Records', 'Company Filings']
+        }
+    },
+    {
+        'name': 'Apple Inc.',
+        'aliases': ('aapl', 'apple', 'apple inc', 'apple corp', 'apple computer'),
+        'people': ('tim cook', 'tim', 'cook'),
+        'executive': {
+            'name': 'Tim Cook',
+            'type': 'individual',
+            'title': 'CEO',
+            'company': 'Apple Inc.',
+            'description': 'Chief Executive Officer of Apple Inc.',
+            'estimated_net_worth': '$1B - $2B',
+            'linkedin_url': 'https://www.linkedin.com/company/apple',
+            'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
+            'data_sources': ['Public Records', 'Company Filings']
+        }
+    },
+    {
+        'name': 'Microsoft Corporation',
+        'aliases': ('msft', 'microsoft', 'microsoft corp', 'microsoft corporation', 'micrsoft', 'microsft'),
+        'people': ('satya nadella', 'satya', 'nadella'),
+        'executive': {
+            'name': 'Satya Nadella',
+            'type': 'individual',
+            'title': 'CEO',
+            'company': 'Microsoft Corporation',
+            'description': 'Chief Executive Officer of Microsoft Corporation',
+            'estimated_net_worth': '$500M - $1B',
+            'linkedin_url': 'https://www.linkedin.com/company/microsoft',
+            'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
+            'data_sources': ['Public Records', 'Company Filings']
+        }
+    },
+    {
+        'name': 'Alphabet Inc.',
+        'aliases': ('googl', 'goog', 'google', 'google inc', 'google corporation', 'alphabet'),
+        'people': ('sundar pichai', 'sundar', 'pichai'),
+        'executive': {
+            'name': 'Sundar Pichai',
+            'type': 'individual',
+            'title': 'CEO',
+            'company': 'Alphabet Inc.',
+            'description': 'Chief Executive Officer of Alphabet Inc.',
+            'estimated_net_worth': '$1B - $2B',
+            'linkedin_url': 'https://www.linkedin.com/company/google',
+            'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
+            'data_sources': ['Public Records', 'Company Filings']
+        }
+    },
+    {
+        'name': 'Amazon.com Inc.',
+        'aliases': ('amzn', 'amazon', 'amazon.com', 'amazon inc'),
+        'people': ('andy jassy', 'andy', 'jassy')
+    },
+    {
+        'name': 'Tesla Inc.',
+        'aliases': ('tsla', 'tesla', 'tesla inc', 'tesla motors'),
+        'people': ('elon musk', 'elon', 'musk')
+    },
+    {
+        'name': 'Meta Platforms Inc.',
+        'aliases': ('meta', 'fb', 'facebook', 'meta platforms'),
+        'people': ('mark zuckerberg', 'mark', 'zuckerberg')
+    },
+    {'name': 'Netflix Inc.', 'aliases': ('nflx', 'netflix', 'netflix inc')},
+    {'name': 'Uber Technologies Inc.', 'aliases': ('uber', 'uber inc')},
+    {'name': 'Lyft Inc.', 'aliases': ('lyft', 'lyft inc')},
+    {'name': 'Spotify Technology S.A.', 'aliases': ('spotify', 'spotify inc')},
+    {'name': 'Shopify Inc.', 'aliases': ('shop', 'shopify', 'shopify inc')},
+    {'name': 'Zoom Video Communications Inc.', 'aliases': ('zm', 'zoom', 'zoom inc')},
+    {'name': 'Salesforce Inc.', 'aliases': ('crm', 'salesforce', 'salesforce inc')},
+    {'name': 'Adobe Inc.', 'aliases': ('adbe', 'adobe', 'adobe inc')},
+    {'name': 'Intel Corporation', 'aliases': ('intc', 'intel', 'intel corp', 'intel corporation')},
+    {'name': 'Advanced Micro Devices Inc.', 'aliases': ('amd', 'amd inc')},
+    {'name': 'Oracle Corporation', 'aliases': ('orcl', 'oracle', 'oracle corp', 'oracle corporation')},
+    {'name': 'Cisco Systems Inc.', 'aliases': ('csco', 'cisco', 'cisco corp', 'cisco systems')},
+    {'name': 'International Business Machines Corporation', 'aliases': ('ibm', 'ibm corp')},
+    {'name': 'HP Inc.', 'aliases': ('hp', 'hp inc', 'hewlett', 'hewlett packard')},
+    {'name': 'Hewlett Packard Enterprise Co.', 'aliases': ('hpe', 'hewlett packard enterprise')}
+)
+
+# Alias lookup tables built once at import, mapping each alias to its entity
+_COMPANY_ALIASES = {
+    alias: entity
+    for entity in _KNOWN_ENTITIES
+    for alias in (entity['name'].lower(),) + entity['aliases']
+}
+_PERSON_ALIASES = {
+    alias: entity
+    for entity in _KNOWN_ENTITIES
+    for alias in entity.get('people', ())
+}
+
+def _find_entity(query: str, aliases: dict) -> Optional[dict]:
+    """Find the known entity an alias refers to, trying an exact match first"""
     query_lower = query.lower().strip()
     
-    # Comprehensive company mapping dictionary
-    company_mappings = {
-        # Ticker symbols
-        'nvda': 'NVIDIA Corporation',
-        'aapl': 'Apple Inc.',
-        'msft': 'Microsoft Corporation',
-        'googl': 'Alphabet Inc.',
-        'goog': 'Alphabet Inc.',
-        'amzn': 'Amazon.com Inc.',
-        'tsla': 'Tesla Inc.',
-        'meta': 'Meta Platforms Inc.',
-        'fb': 'Meta Platforms Inc.',
-        'netflix': 'Netflix Inc.',
-        'nflx': 'Netflix Inc.',
-        'uber': 'Uber Technologies Inc.',
-        'lyft': 'Lyft Inc.',
-        'spotify': 'Spotify Technology S.A.',
-        'shop': 'Shopify Inc.',
-        'zoom': 'Zoom Video Communications Inc.',
-        'zm': 'Zoom Video Communications Inc.',
-        'salesforce': 'Salesforce Inc.',
-        'crm': 'Salesforce Inc.',
-        'adobe': 'Adobe Inc.',
-        'adbe': 'Adobe Inc.',
-        'intel': 'Intel Corporation',
-        'intc': 'Intel Corporation',
-        'amd': 'Advanced Micro Devices Inc.',
-        'oracle': 'Oracle Corporation',
-        'orcl': 'Oracle Corporation',
-        'cisco': 'Cisco Systems Inc.',
-        'csco': 'Cisco Systems Inc.',
-        'ibm': 'International Business Machines Corporation',
-        'hp': 'HP Inc.',
-        'hpe': 'Hewlett Packard Enterprise Co.',
-        
-        # Common misspellings and variations
-        'micrsoft': 'Microsoft Corporation',
-        'microsft': 'Microsoft Corporation',
-        'microsoft corp': 'Microsoft Corporation',
-        'microsoft corporation': 'Microsoft Corporation',
-        'apple computer': 'Apple Inc.',
-        'apple inc': 'Apple Inc.',
-        'apple corp': 'Apple Inc.',
-        'nvidia corp': 'NVIDIA Corporation',
-        'nvidia corporation': 'NVIDIA Corporation',
-        'google': 'Alphabet Inc.',
-        'google inc': 'Alphabet Inc.',
-        'google corporation': 'Alphabet Inc.',
-        'amazon.com': 'Amazon.com Inc.',
-        'amazon inc': 'Amazon.com Inc.',
-        'tesla motors': 'Tesla Inc.',
-        'tesla inc': 'Tesla Inc.',
-        'facebook': 'Meta Platforms Inc.',
-        'meta platforms': 'Meta Platforms Inc.',
-        'netflix inc': 'Netflix Inc.',
-        'uber inc': 'Uber Technologies Inc.',
-        'lyft inc': 'Lyft Inc.',
-        'spotify inc': 'Spotify Technology S.A.',
-        'shopify inc': 'Shopify Inc.',
-        'zoom inc': 'Zoom Video Communications Inc.',
-        'salesforce inc': 'Salesforce Inc.',
-        'adobe inc': 'Adobe Inc.',
-        'intel corp': 'Intel Corporation',
-        'intel corporation': 'Intel Corporation',
-        'amd inc': 'Advanced Micro Devices Inc.',
-        'oracle corp': 'Oracle Corporation',
-        'oracle corporation': 'Oracle Corporation',
-        'cisco systems': 'Cisco Systems Inc.',
-        'cisco corp': 'Cisco Systems Inc.',
-        'ibm corp': 'International Business Machines Corporation',
-        'hp inc': 'HP Inc.',
-        'hewlett packard': 'HP Inc.',
-        'hewlett packard enterprise': 'Hewlett Packard Enterprise Co.',
-        
-        # Partial matches for fuzzy search
-        'nvidia': 'NVIDIA Corporation',
-        'apple': 'Apple Inc.',
-        'microsoft': 'Microsoft Corporation',
-        'google': 'Alphabet Inc.',
-        'amazon': 'Amazon.com Inc.',
-        'tesla': 'Tesla Inc.',
-        'meta': 'Meta Platforms Inc.',
-        'facebook': 'Meta Platforms Inc.',
-        'netflix': 'Netflix Inc.',
-        'uber': 'Uber Technologies Inc.',
-        'lyft': 'Lyft Inc.',
-        'spotify': 'Spotify Technology S.A.',
-        'shopify': 'Shopify Inc.',
-        'zoom': 'Zoom Video Communications Inc.',
-        'salesforce': 'Salesforce Inc.',
-        'adobe': 'Adobe Inc.',
-        'intel': 'Intel Corporation',
-        'amd': 'Advanced Micro Devices Inc.',
-        'oracle': 'Oracle Corporation',
-        'cisco': 'Cisco Systems Inc.',
-        'ibm': 'International Business Machines Corporation',
-        'hp': 'HP Inc.',
-        'hewlett': 'HP Inc.'
-    }
-    
-    # Check for exact matches first
-    if query_lower in company_mappings:
-        return company_mappings[query_lower]
+    entity = aliases.get(query_lower)
+    if entity is not None:
+        return entity
     
     # Check for partial matches (for fuzzy search)
-    for key, value in company_mappings.items():
-        if key in query_lower or query_lower in key:
-            return value
+    for alias, entity in aliases.items():
+        if alias in query_lower or query_lower in alias:
+            return entity
+    
+    return None
+
+def _map_company_query(query):
+    """Map ticker symbols and common misspellings to canonical company names"""
+    entity = _find_entity(query, _COMPANY_ALIASES)
     
     # If no mapping found, return the original query
-    return query
+    return entity['name'] if entity else query
 
 @opportunities_bp.route('/search', methods=['POST'])
 def search_companies():
@@ -521,9 +611,10 @@ def search_companies():
         
         # Map the query to the canonical company name
         mapped_query = _map_company_query(query)
+        is_mapped = mapped_query != query
         
         # Only proceed if we have a valid company mapping or the query is reasonable
-        if mapped_query == query and len(query) < 3:
+        if not is_mapped and len(query) < 3:
             return jsonify({
                 'query': query,
                 'companies': [],
@@ -534,7 +625,9 @@ def search_companies():
             })
         
         # Initialize data collectors
+        from data_collectors.company_research import CompanyResearchCollector
         company_collector = CompanyResearchCollector()
+        from data_collectors.linkedin_data import LinkedInDataCollector
         linkedin_collector = LinkedInDataCollector()
         from data_collectors.edgar_data import EdgarDataCollector
         edgar_collector = EdgarDataCollector()
@@ -579,7 +672,7 @@ def search_companies():
                     }
                 if edgar_error:
                     company_info['edgar_status'] = edgar_error
-                companies.append(company_info)
+                companies = [company_info]
             else:
                 # If both failed, show errors
                 error_info = {'name': mapped_query, 'type': 'company'}
@@ -587,7 +680,7 @@ def search_companies():
                     error_info['companyresearch_status'] = company_error
                 if edgar_error:
                     error_info['edgar_status'] = edgar_error
-                companies.append(error_info)
+                companies = [error_info]
             
             # Search for LinkedIn data using mapped query
             linkedin_data = linkedin_collector.collect_company_data(mapped_query)
@@ -629,89 +722,39 @@ def search_companies():
         
         elif search_type == 'person':
             # Search for individuals
-            query_lower = mapped_query.lower()
-            
             # Search for company data first to get executives
             company_data = company_collector.collect_company_data(mapped_query)
             edgar_data = edgar_collector.collect_company_data(mapped_query)
             
             # Use EDGAR data for executives if available
             if edgar_data and edgar_data.get('executives'):
-                for executive in edgar_data['executives']:
-                    individuals.append({
+                executive_company = company_data.get('name', mapped_query) if company_data else mapped_query
+                individuals = [
+                    {
                         'name': executive['name'],
                         'type': 'individual',
                         'title': executive['title'],
-                        'company': company_data.get('name', mapped_query) if company_data else mapped_query,
-                        'description': f"{executive['title']} at {company_data.get('name', mapped_query) if company_data else mapped_query}",
+                        'company': executive_company,
+                        'description': f"{executive['title']} at {executive_company}",
                         'estimated_net_worth': f"${executive['compensation']} annually",
                         'age': executive.get('age'),
                         'tenure': executive.get('tenure'),
                         'compensation': executive.get('compensation'),
                         'data_sources': ['SEC EDGAR', 'Public Records']
-                    })
+                    }
+                    for executive in edgar_data['executives']
+                ]
             
             # Fallback to known executives for specific companies
             if not individuals:
-                # NVIDIA executives
-                if 'nvidia' in query_lower or 'jensen' in query_lower or 'huang' in query_lower:
-                    individuals.append({
-                        'name': 'Jensen Huang',
-                        'type': 'individual',
-                        'title': 'CEO and Founder',
-                        'company': 'NVIDIA Corporation',
-                        'description': 'Co-founder, president and CEO of NVIDIA Corporation',
-                        'estimated_net_worth': '$40B - $50B',
-                        'linkedin_url': 'https://www.linkedin.com/company/nvidia',
-                        'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
-                        'data_sources': ['Public Records', 'Company Filings']
-                    })
-                
-                # Apple executives
-                elif 'apple' in query_lower or 'tim' in query_lower or 'cook' in query_lower:
-                    individuals.append({
-                        'name': 'Tim Cook',
-                        'type': 'individual',
-                        'title': 'CEO',
-                        'company': 'Apple Inc.',
-                        'description': 'Chief Executive Officer of Apple Inc.',
-                        'estimated_net_worth': '$1B - $2B',
-                        'linkedin_url': 'https://www.linkedin.com/company/apple',
-                        'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
-                        'data_sources': ['Public Records', 'Company Filings']
-                    })
-                
-                # Microsoft executives
-                elif 'microsoft' in query_lower or 'satya' in query_lower or 'nadella' in query_lower:
-                    individuals.append({
-                        'name': 'Satya Nadella',
-                        'type': 'individual',
-                        'title': 'CEO',
-                        'company': 'Microsoft Corporation',
-                        'description': 'Chief Executive Officer of Microsoft Corporation',
-                        'estimated_net_worth': '$500M - $1B',
-                        'linkedin_url': 'https://www.linkedin.com/company/microsoft',
-                        'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
-                        'data_sources': ['Public Records', 'Company Filings']
-                    })
+                entity = _find_entity(mapped_query, _COMPANY_ALIASES) or _find_entity(mapped_query, _PERSON_ALIASES)
                 
-                # Alphabet executives
-                elif 'google' in query_lower or 'alphabet' in query_lower or 'sundar' in query_lower or 'pichai' in query_lower:
-                    individuals.append({
-                        'name': 'Sundar Pichai',
-                        'type': 'individual',
-                        'title': 'CEO',
-                        'company': 'Alphabet Inc.',
-                        'description': 'Chief Executive Officer of Alphabet Inc.',
-                        'estimated_net_worth': '$1B - $2B',
-                        'linkedin_url': 'https://www.linkedin.com/company/google',
-                        'linkedin_note': 'Company LinkedIn profile (individual profile not publicly available)',
-                        'data_sources': ['Public Records', 'Company Filings']
-                    })
+                if entity and entity.get('executive'):
+                    individuals = [dict(entity['executive'])]
                 
                 # General person search
                 else:
-                    individuals.append({
+                    individuals = [{
                         'name': query,
                         'type': 'individual',
                         'title': 'Business Executive',
@@ -719,11 +762,11 @@ def search_companies():
                         'description': 'High-net-worth individual or business executive',
                         'estimated_net_worth': 'Confidential',
                         'data_sources': ['Web Search']
-                    })
+                    }]
         
         return jsonify({
             'query': query,
-            'mapped_query': mapped_query if mapped_query != query else None,
+            'mapped_query': mapped_query if is_mapped else None,
             'companies': companies,
             'individuals': individuals,
             'total_results': len(companies) + len(individuals),
@@ -744,54 +787,31 @@ def generate_individual_report():
         if not person_name:
             return jsonify({'error': 'Person name is required'}), 400
         
+        # Serve repeat requests from the report cache
+        cache_key = (person_name.casefold(), company_name.casefold())
+        with _REPORT_LOCK:
+            cached_report = _REPORT_CACHE.get(cache_key)
+        
+        if cached_report is not None:
+            return _stream_json_response(cached_report)
+        
         # Initialize data collectors
+        from data_collectors.company_research import CompanyResearchCollector
         company_collector = CompanyResearchCollector()
+        from data_collectors.linkedin_data import LinkedInDataCollector
         linkedin_collector = LinkedInDataCollector()
         from data_collectors.edgar_data import EdgarDataCollector
         edgar_collector = EdgarDataCollector()
         from data_collectors.news_data import NewsDataCollector
         news_collector = NewsDataCollector()
         
-        # Map person names to their companies for proper data collection
-        person_company_mapping = {
-            'jensen huang': 'NVIDIA Corporation',
-            'jensen': 'NVIDIA Corporation',
-            'huang': 'NVIDIA Corporation',
-            'tim cook': 'Apple Inc.',
-            'tim': 'Apple Inc.',
-            'cook': 'Apple Inc.',
-            'satya nadella': 'Microsoft Corporation',
-            'satya': 'Microsoft Corporation',
-            'nadella': 'Microsoft Corporation',
-            'sundar pichai': 'Alphabet Inc.',
-            'sundar': 'Alphabet Inc.',
-            'pichai': 'Alphabet Inc.',
-            'elon musk': 'Tesla Inc.',
-            'elon': 'Tesla Inc.',
-            'musk': 'Tesla Inc.',
-            'mark zuckerberg': 'Meta Platforms Inc.',
-            'mark': 'Meta Platforms Inc.',
-            'zuckerberg': 'Meta Platforms Inc.',
-            'andy jassy': 'Amazon.com Inc.',
-            'andy': 'Amazon.com Inc.',
-            'jassy': 'Amazon.com Inc.'
-        }
-        
         # Determine the company to search for
-        person_lower = person_name.lower()
         if company_name:
             search_company = company_name
         else:
-            # Try to find the company from person name mapping
-            search_company = None
-            for person_key, company in person_company_mapping.items():
-                if person_key in person_lower or person_lower in person_key:
-                    search_company = company
-                    break
-            
-            # If no mapping found, use the person name as fallback
-            if not search_company:
-                search_company = person_name
+            # Try to find the company from the person's name, falling back to the name itself
+            entity = _find_entity(person_name, _PERSON_ALIASES)
+            search_company = entity['name'] if entity else person_name
         
         # Map the company query to canonical name
         mapped_query = _map_company_query(search_company)
@@ -840,11 +860,28 @@ def generate_individual_report():
             'data_sources': _get_data_sources(company_data, edgar_data, linkedin_data, news_data)
         }
         
-        return jsonify(report)
+        with _REPORT_LOCK:
+            _REPORT_CACHE[cache_key] = report
+        
+        return _stream_json_response(report)
         
     except Exception as e:
         return jsonify({'error': f'Report generation failed: {str(e)}'}), 500
 
+def _stream_json_response(data: dict) -> Response:
+    """Stream a JSON object to the client one top-level member at a time"""
+    json_provider = current_app.json
+    
+    def generate():
+        yield '{'
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                yield ','
+            yield f'{json_provider.dumps(key)}:{json_provider.dumps(value)}'
+        yield '}'
+    
+    return Response(generate(), mimetype='application/json')
+
 def _generate_personal_profile(person_name: str, company_name: str, edgar_data: Optional[dict]) -> dict:
     """Generate personal profile section of the report"""
     profile = {
@@ -1063,23 +1100,30 @@ def _generate_recent_developments(news_data: list, person_name: str, company_nam
     
     return developments
 
+# Report data sources, in bit order of the mask built by _get_data_sources
+_ALL_SOURCES = (
+    'Company Research Database',
+    'SEC EDGAR Filings',
+    'LinkedIn Company Profiles',
+    'News and Media Sources'
+)
+
+# Source list for every combination of available sources, indexed by mask
+_SOURCES_TABLE = tuple(
+    tuple(name for i, name in enumerate(_ALL_SOURCES) if mask & (1 << i))
+    for mask in range(1 << len(_ALL_SOURCES))
+)
+
 def _get_data_sources(company_data: Optional[dict], edgar_data: Optional[dict], linkedin_data: Optional[dict], news_data: list) -> list:
     """Get list of data sources used in the report"""
-    sources = []
-    
-    if company_data and not company_data.get('error'):
-        sources.append('Company Research Database')
-    
-    if edgar_data and not edgar_data.get('error'):
-        sources.append('SEC EDGAR Filings')
-    
-    if linkedin_data and not linkedin_data.get('error'):
-        sources.append('LinkedIn Company Profiles')
-    
-    if news_data and len(news_data) > 0:
-        sources.append('News and Media Sources')
-    
-    return sources
+    mask = (
+        bool(company_data and not company_data.get('error'))
+        | bool(edgar_data and not edgar_data.get('error')) << 1
+        | bool(linkedin_data and not linkedin_data.get('error')) << 2
+        | bool(news_data) << 3
+    )
+
+    return list(_SOURCES_TABLE[mask])
 
 def _generate_llm_response(person_name: str, company_name: str, profile: dict, company_analysis: dict, financial_opportunities: dict, contact_strategy: dict, recent_developments: dict) -> str:
     """Generate an LLM-style conversational response about the person"""
@@ -1099,12 +1143,12 @@ def _generate_llm_response(person_name: str, company_name: str, profile: dict, c
     # Key achievements
     if profile.get('key_achievements'):
         response_parts.append(f"\nSome of {person_name}'s most notable achievements include:")
-        for achievement in profile['key_achievements'][:3]:  # Limit to top 3
+        for achievement in islice(profile['key_achievements'], 3):  # Limit to top 3
             response_parts.append(f"• {achievement}")
     
     # Industry expertise
     if profile.get('industry_expertise'):
-        expertise_list = ', '.join(profile['industry_expertise'][:3])
+        expertise_list = ', '.join(islice(profile['industry_expertise'], 3))
         response_parts.append(f"\n{person_name} has deep expertise in {expertise_list}.")
     
     # Company context
@@ -1114,12 +1158,12 @@ def _generate_llm_response(person_name: str, company_name: str, profile: dict, c
     # Financial opportunities
     if financial_opportunities.get('wealth_management_needs'):
         response_parts.append(f"\nFrom a financial advisory perspective, {person_name} likely has several wealth management needs:")
-        for need in financial_opportunities['wealth_management_needs'][:2]:
+        for need in islice(financial_opportunities['wealth_management_needs'], 2):
             response_parts.append(f"• {need}")
     
     if financial_opportunities.get('tax_planning_opportunities'):
         response_parts.append(f"\nThere are also tax planning opportunities to consider:")
-        for opportunity in financial_opportunities['tax_planning_opportunities'][:2]:
+        for opportunity in islice(financial_opportunities['tax_planning_opportunities'], 2):
             response_parts.append(f"• {opportunity}")
     
     # Contact strategy
@@ -1128,18 +1172,18 @@ def _generate_llm_response(person_name: str, company_name: str, profile: dict, c
     
     if contact_strategy.get('conversation_starters'):
         response_parts.append(f"\nSome conversation starters that might resonate with {person_name} include:")
-        for starter in contact_strategy['conversation_starters'][:2]:
+        for starter in islice(contact_strategy['conversation_starters'], 2):
             response_parts.append(f"• {starter}")
     
     # Recent developments
     if recent_developments.get('company_developments'):
         response_parts.append(f"\nRecently, {person_name}'s company has been making waves with:")
-        for development in recent_developments['company_developments'][:2]:
+        for development in islice(recent_developments['company_developments'], 2):
             response_parts.append(f"• {development}")
     
     if recent_developments.get('personal_achievements'):
         response_parts.append(f"\nOn a personal level, {person_name} has achieved:")
-        for achievement in recent_developments['personal_achievements'][:2]:
+        for achievement in islice(recent_developments['personal_achievements'], 2):
             response_parts.append(f"• {achievement}")
     
     # Conclusion
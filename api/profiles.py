@@ -1,11 +1,6 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import db, User, Company, CompanyProfile, AuditLog
-from data_collectors.company_research import CompanyResearchCollector
-from data_collectors.sec_data import SECDataCollector
-from data_collectors.linkedin_data import LinkedInDataCollector
-from data_collectors.news_data import NewsDataCollector
-from analysis.intelligence_analyzer import IntelligenceAnalyzer
 from datetime import datetime
 
 profiles_bp = Blueprint('profiles', __name__)
@@ -69,7 +64,7 @@ def create_company():
         db.session.commit()
         
         # Log company creation
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['company_creation'],
             access_method='api',
@@ -142,9 +137,13 @@ def research_company(company_id):
             return jsonify({'error': 'Research limit exceeded for current subscription'}), 429
         
         # Initialize data collectors
+        from data_collectors.company_research import CompanyResearchCollector
         company_collector = CompanyResearchCollector()
+        from data_collectors.sec_data import SECDataCollector
         sec_collector = SECDataCollector()
+        from data_collectors.linkedin_data import LinkedInDataCollector
         linkedin_collector = LinkedInDataCollector()
+        from data_collectors.news_data import NewsDataCollector
         news_collector = NewsDataCollector()
         
         # Collect data from multiple sources
@@ -171,6 +170,7 @@ def research_company(company_id):
             research_data['news_data'] = news_data
         
         # Analyze data and generate insights
+        from analysis.intelligence_analyzer import IntelligenceAnalyzer
         analyzer = IntelligenceAnalyzer()
         insights = analyzer.analyze_company_data(research_data)
         
@@ -189,7 +189,7 @@ def research_company(company_id):
         db.session.commit()
         
         # Log research activity
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=list(research_data.keys()),
             access_method='api',
@@ -253,7 +253,7 @@ def update_company_profile(company_id):
         db.session.commit()
         
         # Log profile update
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['profile_update'],
             access_method='api',
@@ -299,7 +299,7 @@ def delete_company(company_id):
         db.session.commit()
         
         # Log deletion
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['company_deletion'],
             access_method='api',
@@ -344,7 +344,7 @@ def export_company_profile(company_id):
         }
         
         # Log export
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['profile_export'],
             access_method='api',
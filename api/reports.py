@@ -1,10 +1,8 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import db, User, IndustryReport, AuditLog
-from data_collectors.industry_research import IndustryResearchCollector
-from data_collectors.news_data import NewsDataCollector
-from analysis.intelligence_analyzer import IntelligenceAnalyzer
 from datetime import datetime
+from sqlalchemy import func
 
 reports_bp = Blueprint('reports', __name__)
 
@@ -75,7 +73,9 @@ def generate_report():
             return jsonify({'error': 'Report generation limit exceeded for current subscription'}), 429
         
         # Initialize data collectors
+        from data_collectors.industry_research import IndustryResearchCollector
         industry_collector = IndustryResearchCollector()
+        from data_collectors.news_data import NewsDataCollector
         news_collector = NewsDataCollector()
         
         # Collect industry data
@@ -96,6 +96,7 @@ def generate_report():
         competitive_analysis = industry_collector.get_competitive_analysis(industry)
         
         # Analyze data and generate insights
+        from analysis.intelligence_analyzer import IntelligenceAnalyzer
         analyzer = IntelligenceAnalyzer()
         insights = analyzer.analyze_industry_data(industry_data, news_data, trends)
         
@@ -123,7 +124,7 @@ def generate_report():
         db.session.commit()
         
         # Log report generation
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['industry_research', 'news_data'],
             access_method='api',
@@ -162,7 +163,7 @@ def delete_report(report_id):
         db.session.commit()
         
         # Log report deletion
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['report_deletion'],
             access_method='api',
@@ -229,28 +230,26 @@ def get_report_analytics():
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        # Get all user's reports
-        reports = IndustryReport.query.filter_by(user_id=current_user_id).all()
+        # Count per industry in SQL rather than loading every report's JSON columns
+        industry_counts = db.session.query(IndustryReport.industry, func.count(IndustryReport.id)).filter(
+            IndustryReport.user_id == current_user_id
+        ).group_by(IndustryReport.industry).all()
         
         # Calculate analytics
-        total_reports = len(reports)
-        
-        # Group by industry
-        industry_distribution = {}
-        for report in reports:
-            industry = report.industry
-            if industry not in industry_distribution:
-                industry_distribution[industry] = 0
-            industry_distribution[industry] += 1
+        industry_distribution = dict(industry_counts)
+        total_reports = sum(industry_distribution.values())
+        most_researched = max(industry_distribution, key=industry_distribution.get, default=None)
         
         # Get most recent reports
-        recent_reports = reports[:5] if len(reports) >= 5 else reports
+        recent_reports = IndustryReport.query.filter_by(user_id=current_user_id).order_by(
+            IndustryReport.created_at.desc()
+        ).limit(5).all()
         
         analytics = {
             'total_reports': total_reports,
             'industry_distribution': industry_distribution,
             'recent_reports': [report.to_dict() for report in recent_reports],
-            'most_researched_industry': max(industry_distribution.items(), key=lambda x: x[1])[0] if industry_distribution else None
+            'most_researched_industry': most_researched
         }
         
         return jsonify({
@@ -288,6 +287,7 @@ def compare_industries():
         new_reports = []
         for industry in missing_industries:
             # Generate report for missing industry
+            from data_collectors.industry_research import IndustryResearchCollector
             industry_collector = IndustryResearchCollector()
             industry_data = industry_collector.collect_industry_data(industry)
             
@@ -324,7 +324,7 @@ def compare_industries():
             }
         
         # Log comparison
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['industry_comparison'],
             access_method='api',
@@ -368,7 +368,7 @@ def export_report(report_id):
         }
         
         # Log export
-        AuditLog.log_data_access(
+        AuditLog.queue_data_access(
             user_id=current_user_id,
             data_sources=['report_export'],
             access_method='api',
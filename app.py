@@ -1,26 +1,280 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, current_app, jsonify, request
+from flask.cli import AppGroup
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager, jwt_required, get_jwt_identity
+from sqlalchemy import and_, event, func, or_, true
+from sqlalchemy.orm import raiseload
+from cachetools import TTLCache
+from datetime import datetime
 from config import config
-from models import db, User, Company, BusinessProfile, FinancialOpportunity, ConversationStarter, IndustryReport, AuditLog, Subscription
-from data_collectors.company_research import CompanyResearchCollector
-from analysis.intelligence_analyzer import IntelligenceAnalyzer
+from extensions import cache, compress, init_celery, init_logging, migrate, ORJSONProvider
+from models import db, User, ConversationStarter, IndustryReport, AuditLog, Subscription, ResearchJob, UserStats, audit_log_writer
+from tasks import run_company_research
 from api.auth import auth_bp
 from api.profiles import profiles_bp
 from api.opportunities import opportunities_bp
 from api.reports import reports_bp
 from api.compliance import compliance_bp
+import click
+import hashlib
+import orjson
 import os
+import re
+import threading
+import time
+
+# Industry reports change slowly; bump the version prefix to drop every cached report
+INDUSTRY_REPORT_CACHE_PREFIX = 'v2:industry_report'
+INDUSTRY_REPORT_CACHE_TTL = 24 * 60 * 60
+INDUSTRY_REPORT_LOCK_TIMEOUT = 30
+
+# Pre-encoded bodies for the high-traffic monitoring endpoints
+_HEALTH_CACHE = TTLCache(maxsize=8, ttl=5)
+_SUMMARY_CACHE = TTLCache(maxsize=1, ttl=30)
+_MONITORING_LOCK = threading.Lock()
+
+def _cached_json_response(ttl_cache, key, build):
+    """Return a JSON response whose encoded body is reused until the cache entry expires"""
+    with _MONITORING_LOCK:
+        body = ttl_cache.get(key)
+    
+    if body is None:
+        body = current_app.json.dumps(build())
+        with _MONITORING_LOCK:
+            ttl_cache[key] = body
+    
+    return Response(body, mimetype='application/json')
+
+class HealthCheckMiddleware:
+    """WSGI middleware that answers GET /api/health without building a Flask request"""
+    
+    path = '/api/health'
+    
+    def __init__(self, app, config_name):
+        self.wsgi_app = app.wsgi_app
+        self.config_name = config_name
+    
+    def __call__(self, environ, start_response):
+        method = environ.get('REQUEST_METHOD')
+        if environ.get('PATH_INFO') != self.path or method not in ('GET', 'HEAD'):
+            return self.wsgi_app(environ, start_response)
+        
+        body = self._body()
+        start_response('200 OK', [
+            ('Content-Type', 'application/json'),
+            ('Content-Length', str(len(body)))
+        ])
+        return [body] if method == 'GET' else []
+    
+    def _body(self):
+        """Encoded health payload, rebuilt at most once per cache TTL"""
+        with _MONITORING_LOCK:
+            body = _HEALTH_CACHE.get(self.config_name)
+        
+        if body is None:
+            body = orjson.dumps({
+                'status': 'healthy',
+                'version': '1.0.0',
+                'environment': self.config_name
+            })
+            with _MONITORING_LOCK:
+                _HEALTH_CACHE[self.config_name] = body
+        
+        return body
+
+def _report_etag(report):
+    """Validator for a stored industry report; changes whenever the report row is updated"""
+    return hashlib.blake2b(f'{report.id}:{report.updated_at}'.encode(), digest_size=8).hexdigest()
+
+def _wait_for_cached(key, timeout):
+    """Poll the cache until another request fills the key or the timeout passes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        time.sleep(0.1)
+    return None
+
+@event.listens_for(IndustryReport, 'after_update')
+@event.listens_for(IndustryReport, 'after_delete')
+def _invalidate_industry_report(mapper, connection, target):
+    """Drop the cached report for an industry whose report changed"""
+    cache.delete(f'{INDUSTRY_REPORT_CACHE_PREFIX}:{target.industry}')
+
+# Mock search payloads are constant apart from the query, so they are encoded once and
+# split at the placeholders; requests only stream the escaped query between the pieces
+_SEARCH_QUERY = '__SEARCH_QUERY__'
+_SEARCH_TYPE = '__SEARCH_TYPE__'
+_SEARCH_PLACEHOLDER = re.compile(r'__SEARCH_(QUERY|TYPE)__')
+
+_MOCK_EXECUTIVES = (
+    ('John Smith', 'Chief Executive Officer', 'https://linkedin.com/in/johnsmith', '$50M - $100M'),
+    ('Jane Doe', 'Chief Financial Officer', 'https://linkedin.com/in/janedoe', '$20M - $50M'),
+    ('Mike Johnson', 'Chief Technology Officer', 'https://linkedin.com/in/mikejohnson', '$10M - $30M')
+)
+
+_MOCK_INDUSTRY_LEADERS = (
+    ('Sarah Wilson', 'CEO', f'Leading {_SEARCH_QUERY} Company', 'https://linkedin.com/in/sarahwilson', '$100M - $200M'),
+    ('David Brown', 'CFO', f'Top {_SEARCH_QUERY} Firm', 'https://linkedin.com/in/davidbrown', '$30M - $80M')
+)
+
+def _encode_search_template(payload):
+    """Encode a search payload, split into static byte segments alternating with placeholder names"""
+    parts = _SEARCH_PLACEHOLDER.split(orjson.dumps(payload).decode())
+    return tuple(part if index % 2 else part.encode() for index, part in enumerate(parts))
+
+def _individual_search_template(results):
+    """Encode an individuals search response around the given results"""
+    return _encode_search_template({
+        'success': True,
+        'search_query': _SEARCH_QUERY,
+        'search_type': _SEARCH_TYPE,
+        'results_count': len(results),
+        'results': results
+    })
+
+_INDIVIDUAL_SEARCH_TEMPLATES = {
+    'company': _individual_search_template([
+        {
+            'name': name,
+            'title': title,
+            'company': _SEARCH_QUERY,
+            'linkedin_url': linkedin_url,
+            'estimated_net_worth': net_worth,
+            'company_info': {
+                'industry': 'Technology',
+                'revenue': '$500M - $1B',
+                'employees': '500-1000'
+            },
+            'recent_news': [
+                {
+                    'title': f'{_SEARCH_QUERY} Announces New Product Launch',
+                    'date': '2024-01-15',
+                    'source': 'TechCrunch'
+                },
+                {
+                    'title': f'{_SEARCH_QUERY} Reports Strong Q4 Earnings',
+                    'date': '2024-01-10',
+                    'source': 'Bloomberg'
+                }
+            ],
+            'financial_opportunities': [
+                'Business Succession Planning',
+                'Tax Optimization',
+                'Employee Benefit Plans'
+            ],
+            'conversation_starters': [
+                'Recent company expansion plans',
+                'Industry trends and market position',
+                'Technology investments and innovation'
+            ],
+            'planning_needs': [
+                'Estate Planning',
+                'Retirement Planning',
+                'Risk Management'
+            ]
+        }
+        for name, title, linkedin_url, net_worth in _MOCK_EXECUTIVES
+    ]),
+    'industry': _individual_search_template([
+        {
+            'name': name,
+            'title': title,
+            'company': company,
+            'industry': _SEARCH_QUERY,
+            'linkedin_url': linkedin_url,
+            'estimated_net_worth': net_worth,
+            'recent_news': [
+                {
+                    'title': f'{_SEARCH_QUERY} Industry Growth Trends',
+                    'date': '2024-01-12',
+                    'source': 'Industry Report'
+                }
+            ],
+            'financial_opportunities': [
+                'Industry Consolidation Opportunities',
+                'Market Expansion Planning',
+                'Strategic Partnerships'
+            ],
+            'conversation_starters': [
+                'Industry growth projections',
+                'Market competition analysis',
+                'Regulatory changes impact'
+            ],
+            'planning_needs': [
+                'Strategic Planning',
+                'Investment Planning',
+                'Risk Management'
+            ]
+        }
+        for name, title, company, linkedin_url, net_worth in _MOCK_INDUSTRY_LEADERS
+    ])
+}
+_EMPTY_INDIVIDUAL_SEARCH_TEMPLATE = _individual_search_template([])
+
+_COMPANY_SEARCH_TEMPLATE = _encode_search_template({
+    'success': True,
+    'search_query': _SEARCH_QUERY,
+    'results_count': 1,
+    'results': [{
+        'company_name': _SEARCH_QUERY,
+        'industry': 'Technology',
+        'revenue': '$500M - $1B',
+        'employees': '500-1000',
+        'executives': [
+            {
+                'name': name,
+                'title': title,
+                'linkedin_url': linkedin_url
+            }
+            for name, title, linkedin_url, _ in _MOCK_EXECUTIVES
+        ],
+        'financial_opportunities': [
+            'Business Succession Planning',
+            'Tax Optimization',
+            'Employee Benefit Plans'
+        ],
+        'conversation_starters': [
+            'Recent company expansion plans',
+            'Industry trends and market position',
+            'Technology investments and innovation'
+        ],
+        'planning_needs': [
+            'Estate Planning',
+            'Retirement Planning',
+            'Risk Management'
+        ]
+    }]
+})
+
+def _render_search_template(template, search_query, search_type=''):
+    """Fill a search template's segments with the JSON-escaped query and type, joined in one pass"""
+    values = {
+        'QUERY': orjson.dumps(str(search_query))[1:-1],
+        'TYPE': orjson.dumps(str(search_type))[1:-1]
+    }
+    
+    # Templates are a few small segments; one body lets Flask-Compress encode it as usual
+    body = b''.join(values[part] if index % 2 else part for index, part in enumerate(template))
+    return Response(body, mimetype='application/json')
 
 def create_app(config_name='development'):
     """Application factory pattern"""
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     
     # Load configuration
     app.config.from_object(config[config_name])
     
     # Initialize extensions
     db.init_app(app)
+    migrate.init_app(app, db)
+    init_logging(app)
+    audit_log_writer.init_app(app)
+    cache.init_app(app)
+    compress.init_app(app)
+    init_celery(app)
     CORS(app)
     JWTManager(app)
     
@@ -31,49 +285,73 @@ def create_app(config_name='development'):
     app.register_blueprint(reports_bp, url_prefix='/api/reports')
     app.register_blueprint(compliance_bp, url_prefix='/api/compliance')
     
-    # Initialize database
-    with app.app_context():
-        db.create_all()
+    # Create tables directly in development and tests; production schemas come from `flask db upgrade`
+    if app.config['AUTO_CREATE_TABLES']:
+        with app.app_context():
+            db.create_all()
     
-    @app.route('/api/health')
-    def health_check():
-        """Health check endpoint"""
-        return jsonify({
-            'status': 'healthy',
-            'version': '1.0.0',
-            'environment': config_name
-        })
+    # One-off maintenance commands: `flask audit-logs <command>`
+    audit_logs_cli = AppGroup('audit-logs', help='Audit log maintenance')
+    
+    @audit_logs_cli.command('partition')
+    @click.option('--months-ahead', default=2, show_default=True, help='Monthly partitions to create past this month')
+    def partition_audit_logs(months_ahead):
+        """Convert audit_logs into monthly partitions (PostgreSQL; run once, in a maintenance window)"""
+        with db.engine.begin() as connection:
+            converted = AuditLog.partition_table(connection, months_ahead=months_ahead)
+        
+        if converted:
+            click.echo('audit_logs is now partitioned by month')
+        else:
+            click.echo('Nothing to do: not PostgreSQL, or audit_logs is already partitioned')
+    
+    app.cli.add_command(audit_logs_cli)
+    
+    # Load balancers poll /api/health every few seconds; answer it before Flask dispatch
+    app.wsgi_app = HealthCheckMiddleware(app, config_name)
     
     @app.route('/api/dashboard/stats', methods=['GET'])
     @jwt_required()
     def get_dashboard_stats():
         """Get dashboard statistics for authenticated user"""
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
         
-        if not user:
+        # Relevance depends on the current time, so it is the one count not kept in user_stats.
+        # Same rule as ConversationStarter.is_relevant: not expired and used at most 5 times
+        is_relevant = and_(
+            or_(ConversationStarter.expires_at.is_(None), ConversationStarter.expires_at >= datetime.utcnow()),
+            ConversationStarter.used_count <= 5
+        )
+        relevant_starters = db.session.query(
+            func.count(ConversationStarter.id).label('relevant')
+        ).filter(ConversationStarter.user_id == current_user_id, is_relevant).subquery()
+        
+        # Fetch the user, the pre-aggregated counters and the relevance count in one round trip
+        row = db.session.query(User, UserStats, relevant_starters.c.relevant).select_from(User).outerjoin(
+            UserStats, UserStats.user_id == User.id
+        ).join(relevant_starters, true()).filter(User.id == current_user_id).options(raiseload('*')).first()
+        
+        if not row:
             return jsonify({'error': 'User not found'}), 404
         
-        # Get user's business profiles
-        profiles = BusinessProfile.query.filter_by(user_id=current_user_id).all()
+        user, user_stats, recent_conversation_starters = row
         
-        # Get opportunities
-        opportunities = FinancialOpportunity.query.filter_by(user_id=current_user_id).all()
+        # Users with no writes since the rollup was introduced get their counters built once
+        if user_stats is None:
+            UserStats.rebuild(db.session.connection(), user.id)
+            db.session.commit()
+            user_stats = db.session.get(UserStats, user.id)
         
-        # Get conversation starters
-        conversation_starters = ConversationStarter.query.filter_by(user_id=current_user_id).all()
+        subscription_info = user.get_subscription_info()
+        max_profiles = subscription_info['max_profiles']
         
         # Calculate statistics
         stats = {
-            'total_profiles': len(profiles),
-            'active_profiles': len([p for p in profiles if p.status == 'active']),
-            'total_opportunities': len(opportunities),
-            'high_priority_opportunities': len([o for o in opportunities if o.priority in ['high', 'critical']]),
-            'total_conversation_starters': len(conversation_starters),
-            'recent_conversation_starters': len([c for c in conversation_starters if c.is_relevant()]),
-            'subscription_info': user.get_subscription_info(),
+            **user_stats.to_dict(),
+            'recent_conversation_starters': recent_conversation_starters,
+            'subscription_info': subscription_info,
             'usage_percentage': {
-                'profiles': (user.profiles_used_this_month / user.get_subscription_info()['max_profiles'] * 100) if user.get_subscription_info()['max_profiles'] > 0 else 0
+                'profiles': (user.profiles_used_this_month / max_profiles * 100) if max_profiles > 0 else 0
             }
         }
         
@@ -84,7 +362,7 @@ def create_app(config_name='development'):
     def research_company():
         """Research a company and create business profile"""
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
+        user = User.query.options(raiseload('*')).get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -100,128 +378,142 @@ def create_app(config_name='development'):
             return jsonify({'error': 'Company name is required'}), 400
         
         try:
-            # Initialize collectors
-            collector = CompanyResearchCollector()
-            analyzer = IntelligenceAnalyzer()
-            
-            # Collect company data
-            company_data = collector.collect_company_data(company_name)
-            
-            if not company_data:
-                return jsonify({'error': 'Company not found or data unavailable'}), 404
-            
-            # Create or update company record
-            company = Company.query.filter_by(name=company_name).first()
-            if not company:
-                company = Company(**company_data)
-                db.session.add(company)
-                db.session.commit()
-            
-            # Analyze company for financial planning opportunities
-            analysis_result = analyzer.analyze_company(company_data)
-            
-            # Create business profile
-            profile = BusinessProfile(
-                user_id=current_user_id,
-                company_id=company.id,
-                profile_name=f"{company_name} - Business Profile",
-                profile_type='prospect',
-                primary_planning_needs=analysis_result.get('planning_needs', []),
-                opportunities_identified=analysis_result.get('opportunities', []),
-                conversation_starters=analysis_result.get('conversation_starters', []),
-                recent_developments=analysis_result.get('recent_developments', [])
-            )
-            
-            db.session.add(profile)
-            
-            # Increment user's profile usage
-            user.increment_profile_usage()
-            
-            # Log the activity
-            AuditLog.log_profile_creation(
-                user_id=current_user_id,
-                company_name=company_name,
-                data_sources_used=company_data.get('data_sources', []),
-                ip_address=request.remote_addr,
-                user_agent=request.headers.get('User-Agent')
-            )
-            
+            # Collection and analysis run in a worker; the client polls the job for the profile
+            job = ResearchJob(user_id=current_user_id, company_name=company_name)
+            db.session.add(job)
             db.session.commit()
             
+            run_company_research.delay(job.id, request.remote_addr, request.headers.get('User-Agent'))
+            
             return jsonify({
-                'message': 'Company profile created successfully',
-                'profile_id': profile.id,
-                'company_id': company.id,
-                'analysis_summary': analysis_result.get('summary', {})
-            })
+                'message': 'Company research started',
+                'job_id': job.id,
+                'status': job.status
+            }), 202
             
         except Exception as e:
             db.session.rollback()
-            return jsonify({'error': f'Error creating profile: {str(e)}'}), 500
+            return jsonify({'error': f'Error starting company research: {str(e)}'}), 500
+    
+    @app.route('/api/company/research/<int:job_id>', methods=['GET'])
+    @jwt_required()
+    def get_research_job(job_id):
+        """Get the status of a company research job"""
+        current_user_id = get_jwt_identity()
+        job = ResearchJob.query.filter_by(id=job_id, user_id=current_user_id).first()
+        
+        if not job:
+            return jsonify({'error': 'Research job not found'}), 404
+        
+        return jsonify(job.to_dict())
     
     @app.route('/api/industry/report/<industry>', methods=['GET'])
     @jwt_required()
     def get_industry_report(industry):
         """Get industry report for specified industry"""
         current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
         
-        if not user:
+        # Check the user and their report quota in one row of plain columns, no ORM objects
+        row = db.session.query(User.id, Subscription.id, Subscription.has_report_quota).outerjoin(
+            Subscription, Subscription.user_id == User.id
+        ).filter(User.id == current_user_id).first()
+        
+        if not row:
             return jsonify({'error': 'User not found'}), 404
         
         # Check if user can access industry reports
-        subscription = Subscription.query.filter_by(user_id=current_user_id).first()
-        if not subscription or not subscription.can_generate_report():
+        _, subscription_id, has_report_quota = row
+        if subscription_id is None or not has_report_quota:
             return jsonify({'error': 'Report limit reached for current subscription tier'}), 403
         
+        cache_key = f'{INDUSTRY_REPORT_CACHE_PREFIX}:{industry}'
+        lock_key = f'{cache_key}:lock'
+        holds_lock = False
+        
         try:
-            # Get or create industry report
-            report = IndustryReport.query.filter_by(industry=industry).first()
+            # Serve the pre-serialized report from the cache when another request already built it
+            cached = cache.get(cache_key)
+            if cached is None:
+                # Let one request build a cold report while the others wait for it
+                holds_lock = cache.add(lock_key, True, timeout=INDUSTRY_REPORT_LOCK_TIMEOUT)
+                if not holds_lock:
+                    cached = _wait_for_cached(cache_key, INDUSTRY_REPORT_LOCK_TIMEOUT)
             
-            if not report:
-                # Generate new industry report
-                from data_collectors.industry_research import IndustryResearchCollector
-                from analysis.industry_analyzer import IndustryAnalyzer
-                
-                collector = IndustryResearchCollector()
-                analyzer = IndustryAnalyzer()
+            report = None
+            is_new_report = False
+            if cached is None:
+                # Get or create industry report
+                report = IndustryReport.query.filter_by(industry=industry).first()
                 
-                industry_data = collector.collect_industry_data(industry)
-                if industry_data:
-                    analysis_result = analyzer.analyze_industry(industry_data)
+                if not report:
+                    # Generate new industry report
+                    from data_collectors.industry_research import IndustryResearchCollector
+                    from analysis.industry_analyzer import IndustryAnalyzer
                     
-                    report = IndustryReport(
-                        industry=industry,
-                        report_type='quarterly',
-                        title=f"{industry} Industry Analysis",
-                        summary=analysis_result.get('summary'),
-                        key_findings=analysis_result.get('key_findings'),
-                        market_trends=analysis_result.get('market_trends'),
-                        planning_opportunities=analysis_result.get('planning_opportunities'),
-                        risk_factors=analysis_result.get('risk_factors'),
-                        data_sources=industry_data.get('sources', [])
-                    )
+                    collector = IndustryResearchCollector()
+                    analyzer = IndustryAnalyzer()
                     
-                    db.session.add(report)
+                    industry_data = collector.collect_industry_data(industry)
+                    if industry_data:
+                        analysis_result = analyzer.analyze_industry(industry_data)
+                        
+                        report = IndustryReport(
+                            industry=industry,
+                            report_type='quarterly',
+                            title=f"{industry} Industry Analysis",
+                            summary=analysis_result.get('summary'),
+                            key_findings=analysis_result.get('key_findings'),
+                            market_trends=analysis_result.get('market_trends'),
+                            planning_opportunities=analysis_result.get('planning_opportunities'),
+                            risk_factors=analysis_result.get('risk_factors'),
+                            data_sources=industry_data.get('sources', [])
+                        )
+                        
+                        db.session.add(report)
+                        db.session.flush()
+                        is_new_report = True
+                
+                data_sources = report.data_sources or []
+                etag, last_modified = _report_etag(report), report.updated_at
+            else:
+                body, data_sources, etag, last_modified = cached
+            
+            # The client already holds this version; skip usage, logging and the body entirely
+            if not is_new_report and etag in request.if_none_match:
+                not_modified = Response(status=304)
+                not_modified.set_etag(etag)
+                not_modified.last_modified = last_modified
+                return not_modified
             
             # Increment report usage
-            subscription.increment_report_usage()
+            Subscription.record_report_usage(subscription_id)
             
-            # Log the activity
-            AuditLog.log_report_generation(
+            # Log the activity off the request path; the usage increment commits below
+            AuditLog.queue_report_generation(
                 user_id=current_user_id,
                 report_type='industry',
                 industry=industry,
-                data_sources_used=report.data_sources or []
+                data_sources_used=data_sources
             )
             
             db.session.commit()
             
-            return jsonify(report.to_dict())
+            if report is not None:
+                body = app.json.dumps(report.to_dict())
+                cache.set(cache_key, (body, data_sources, etag, last_modified), timeout=INDUSTRY_REPORT_CACHE_TTL)
+            
+            response = Response(body, mimetype='application/json')
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            return response
             
         except Exception as e:
             db.session.rollback()
             return jsonify({'error': f'Error generating report: {str(e)}'}), 500
+        
+        finally:
+            if holds_lock:
+                cache.delete(lock_key)
     
     @app.route('/api/search/individuals', methods=['POST'])
     def search_high_net_worth_individuals():
@@ -235,133 +527,8 @@ def create_app(config_name='development'):
         
         try:
             # Mock data for demonstration (in production, this would use real data collectors)
-            results = []
-            
-            if search_type == 'company':
-                # Mock company executives
-                executives = [
-                    {
-                        'name': 'John Smith',
-                        'title': 'Chief Executive Officer',
-                        'company': search_query,
-                        'linkedin_url': 'https://linkedin.com/in/johnsmith',
-                        'estimated_net_worth': '$50M - $100M'
-                    },
-                    {
-                        'name': 'Jane Doe',
-                        'title': 'Chief Financial Officer',
-                        'company': search_query,
-                        'linkedin_url': 'https://linkedin.com/in/janedoe',
-                        'estimated_net_worth': '$20M - $50M'
-                    },
-                    {
-                        'name': 'Mike Johnson',
-                        'title': 'Chief Technology Officer',
-                        'company': search_query,
-                        'linkedin_url': 'https://linkedin.com/in/mikejohnson',
-                        'estimated_net_worth': '$10M - $30M'
-                    }
-                ]
-                
-                for executive in executives:
-                    results.append({
-                        'name': executive['name'],
-                        'title': executive['title'],
-                        'company': search_query,
-                        'linkedin_url': executive['linkedin_url'],
-                        'estimated_net_worth': executive['estimated_net_worth'],
-                        'company_info': {
-                            'industry': 'Technology',
-                            'revenue': '$500M - $1B',
-                            'employees': '500-1000'
-                        },
-                        'recent_news': [
-                            {
-                                'title': f'{search_query} Announces New Product Launch',
-                                'date': '2024-01-15',
-                                'source': 'TechCrunch'
-                            },
-                            {
-                                'title': f'{search_query} Reports Strong Q4 Earnings',
-                                'date': '2024-01-10',
-                                'source': 'Bloomberg'
-                            }
-                        ],
-                        'financial_opportunities': [
-                            'Business Succession Planning',
-                            'Tax Optimization',
-                            'Employee Benefit Plans'
-                        ],
-                        'conversation_starters': [
-                            'Recent company expansion plans',
-                            'Industry trends and market position',
-                            'Technology investments and innovation'
-                        ],
-                        'planning_needs': [
-                            'Estate Planning',
-                            'Retirement Planning',
-                            'Risk Management'
-                        ]
-                    })
-            
-            elif search_type == 'industry':
-                # Mock industry leaders
-                industry_leaders = [
-                    {
-                        'name': 'Sarah Wilson',
-                        'title': 'CEO',
-                        'company': f'Leading {search_query} Company',
-                        'linkedin_url': 'https://linkedin.com/in/sarahwilson',
-                        'estimated_net_worth': '$100M - $200M'
-                    },
-                    {
-                        'name': 'David Brown',
-                        'title': 'CFO',
-                        'company': f'Top {search_query} Firm',
-                        'linkedin_url': 'https://linkedin.com/in/davidbrown',
-                        'estimated_net_worth': '$30M - $80M'
-                    }
-                ]
-                
-                for leader in industry_leaders:
-                    results.append({
-                        'name': leader['name'],
-                        'title': leader['title'],
-                        'company': leader['company'],
-                        'industry': search_query,
-                        'linkedin_url': leader['linkedin_url'],
-                        'estimated_net_worth': leader['estimated_net_worth'],
-                        'recent_news': [
-                            {
-                                'title': f'{search_query} Industry Growth Trends',
-                                'date': '2024-01-12',
-                                'source': 'Industry Report'
-                            }
-                        ],
-                        'financial_opportunities': [
-                            'Industry Consolidation Opportunities',
-                            'Market Expansion Planning',
-                            'Strategic Partnerships'
-                        ],
-                        'conversation_starters': [
-                            'Industry growth projections',
-                            'Market competition analysis',
-                            'Regulatory changes impact'
-                        ],
-                        'planning_needs': [
-                            'Strategic Planning',
-                            'Investment Planning',
-                            'Risk Management'
-                        ]
-                    })
-            
-            return jsonify({
-                'success': True,
-                'search_query': search_query,
-                'search_type': search_type,
-                'results_count': len(results),
-                'results': results
-            })
+            template = _INDIVIDUAL_SEARCH_TEMPLATES.get(search_type, _EMPTY_INDIVIDUAL_SEARCH_TEMPLATE)
+            return _render_search_template(template, search_query, search_type)
             
         except Exception as e:
             return jsonify({'error': f'Search failed: {str(e)}'}), 500
@@ -377,51 +544,7 @@ def create_app(config_name='development'):
         
         try:
             # Mock data for demonstration
-            results = [{
-                'company_name': search_query,
-                'industry': 'Technology',
-                'revenue': '$500M - $1B',
-                'employees': '500-1000',
-                'executives': [
-                    {
-                        'name': 'John Smith',
-                        'title': 'Chief Executive Officer',
-                        'linkedin_url': 'https://linkedin.com/in/johnsmith'
-                    },
-                    {
-                        'name': 'Jane Doe',
-                        'title': 'Chief Financial Officer',
-                        'linkedin_url': 'https://linkedin.com/in/janedoe'
-                    },
-                    {
-                        'name': 'Mike Johnson',
-                        'title': 'Chief Technology Officer',
-                        'linkedin_url': 'https://linkedin.com/in/mikejohnson'
-                    }
-                ],
-                'financial_opportunities': [
-                    'Business Succession Planning',
-                    'Tax Optimization',
-                    'Employee Benefit Plans'
-                ],
-                'conversation_starters': [
-                    'Recent company expansion plans',
-                    'Industry trends and market position',
-                    'Technology investments and innovation'
-                ],
-                'planning_needs': [
-                    'Estate Planning',
-                    'Retirement Planning',
-                    'Risk Management'
-                ]
-            }]
-            
-            return jsonify({
-                'success': True,
-                'search_query': search_query,
-                'results_count': len(results),
-                'results': results
-            })
+            return _render_search_template(_COMPANY_SEARCH_TEMPLATE, search_query)
             
         except Exception as e:
             return jsonify({'error': f'Search failed: {str(e)}'}), 500
@@ -429,7 +552,7 @@ def create_app(config_name='development'):
     @app.route('/api/summary')
     def summary():
         # Replace these with real data as needed
-        return jsonify({
+        return _cached_json_response(_SUMMARY_CACHE, 'summary', lambda: {
             "active_users": 1200,
             "opportunities": 34,
             "compliance_alerts": 2
@@ -447,5 +570,10 @@ def create_app(config_name='development'):
     return app
 
 if __name__ == '__main__':
-    app = create_app(os.environ.get('FLASK_ENV', 'development'))
+    config_name = os.environ.get('FLASK_ENV', 'development')
+    if config_name != 'development':
+        # The Werkzeug server handles one request at a time; serve other environments with Gunicorn
+        raise SystemExit(f'Refusing to run the development server for {config_name!r}; use: gunicorn -c gunicorn.conf.py')
+    
+    app = create_app(config_name)
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
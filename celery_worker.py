@@ -0,0 +1,6 @@
+import os
+from app import create_app
+
+# Worker entry point: celery -A celery_worker worker (add --beat to schedule partition maintenance)
+flask_app = create_app(os.environ.get('FLASK_ENV', 'production'))
+celery_app = flask_app.extensions['celery']
\ No newline at end of file
@@ -1,17 +1,47 @@
 import os
+import orjson
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv()
 
+def _json_column_dumps(value):
+    """Serialize JSON column values with orjson; integer keys become strings as with the json module"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 class Config:
     """Base configuration class"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///business_intelligence.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Create missing tables at startup; production schemas are managed by migrations at deploy time
+    AUTO_CREATE_TABLES = False
+    
+    # Check connections on checkout and recycle them before the database's idle timeout
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE') or 1800),
+        # JSON columns (audit data sources, profile opportunities and starters) go through orjson
+        'json_serializer': _json_column_dumps,
+        'json_deserializer': orjson.loads
+    }
+    
     # Redis configuration
     REDIS_URL = os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
     
+    # Cache configuration
+    CACHE_TYPE = os.environ.get('CACHE_TYPE') or 'RedisCache'
+    CACHE_REDIS_URL = REDIS_URL
+    CACHE_DEFAULT_TIMEOUT = 60
+    
+    # Response compression for JSON bodies when the client accepts br/gzip
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_MIN_SIZE = 500
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    # Compressing a stream buffers it whole first, so streamed responses go out uncompressed
+    COMPRESS_STREAMS = False
+    
     # API rate limiting
     RATELIMIT_DEFAULT = "200 per day;50 per hour"
     RATELIMIT_STORAGE_URL = REDIS_URL
@@ -52,27 +82,31 @@ class Config:
     CELERY_BROKER_URL = REDIS_URL
     CELERY_RESULT_BACKEND = REDIS_URL
     
-    # Pricing tiers
-    PRICING_TIERS = {
-        'basic': {
+    # Audit log partitions (PostgreSQL) older than this many days move to the archive tablespace, when one is set
+    AUDIT_LOG_HOT_DAYS = int(os.environ.get('AUDIT_LOG_HOT_DAYS') or 90)
+    AUDIT_LOG_ARCHIVE_TABLESPACE = os.environ.get('AUDIT_LOG_ARCHIVE_TABLESPACE')
+    
+    # Pricing tiers; read-only so callers can share them without copying
+    PRICING_TIERS = MappingProxyType({
+        'basic': MappingProxyType({
             'price': 199,
             'profiles_per_month': 50,
-            'features': ['business_profiles', 'basic_analysis']
-        },
-        'professional': {
+            'features': ('business_profiles', 'basic_analysis')
+        }),
+        'professional': MappingProxyType({
             'price': 399,
             'profiles_per_month': 200,
-            'features': ['business_profiles', 'advanced_analysis', 'industry_reports']
-        },
-        'enterprise': {
+            'features': ('business_profiles', 'advanced_analysis', 'industry_reports')
+        }),
+        'enterprise': MappingProxyType({
             'price': 799,
             'profiles_per_month': -1,  # unlimited
-            'features': ['business_profiles', 'advanced_analysis', 'industry_reports', 'custom_research']
-        }
-    }
+            'features': ('business_profiles', 'advanced_analysis', 'industry_reports', 'custom_research')
+        })
+    })
     
     # Industry categories
-    INDUSTRY_CATEGORIES = [
+    INDUSTRY_CATEGORIES = (
         'Healthcare',
         'Technology',
         'Real Estate',
@@ -93,10 +127,10 @@ class Config:
         'Telecommunications',
         'Utilities',
         'Other'
-    ]
+    )
     
     # Financial planning opportunities
-    PLANNING_OPPORTUNITIES = [
+    PLANNING_OPPORTUNITIES = (
         'Business Succession Planning',
         'Tax Optimization',
         'Employee Benefit Plans',
@@ -107,12 +141,13 @@ class Config:
         'Insurance Planning',
         'Debt Management',
         'Cash Flow Optimization'
-    ]
+    )
 
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
     TESTING = False
+    AUTO_CREATE_TABLES = True
 
 class ProductionConfig(Config):
     """Production configuration"""
@@ -123,6 +158,19 @@ class ProductionConfig(Config):
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SECRET_KEY = os.environ.get('SECRET_KEY')
     
+    # Connection pool sized for the gevent workers in gunicorn.conf.py;
+    # keep workers * (pool_size + max_overflow) below Postgres max_connections.
+    # Audit logs are written by one background thread per worker, which holds a
+    # single pooled connection per batch rather than one per request
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE') or 20),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW') or 10),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT') or 10),
+        # Hand out the most recently used connection so idle ones age out via pool_recycle
+        'pool_use_lifo': True
+    }
+    
     # Security headers
     SECURITY_HEADERS = {
         'X-Content-Type-Options': 'nosniff',
@@ -137,6 +185,9 @@ class TestingConfig(Config):
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    CACHE_TYPE = 'SimpleCache'
+    CELERY_TASK_ALWAYS_EAGER = True
+    AUTO_CREATE_TABLES = True
 
 # Configuration dictionary
 config = {
@@ -1,26 +1,279 @@
 import requests
 import time
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import wraps
 from typing import Dict, List, Optional
 import logging
 import re
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 import json
 
+# Seconds each source's results are reused for the same company; news goes stale fastest
+_SOURCE_CACHE_TTLS = {
+    'sec': 24 * 60 * 60,
+    'website': 24 * 60 * 60,
+    'linkedin': 24 * 60 * 60,
+    'news': 15 * 60,
+    'directory': 24 * 60 * 60
+}
+_SOURCE_CACHES = {source: TTLCache(maxsize=1024, ttl=ttl) for source, ttl in _SOURCE_CACHE_TTLS.items()}
+_SOURCE_CACHE_LOCK = threading.Lock()
+
+# One keep-alive connection pool shared by every collector and source thread, so research
+# jobs reuse open TLS connections instead of handshaking with each host on every lookup
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.headers.update({
+    'User-Agent': 'BusinessIntelligencePlatform/1.0 (Compliant Research Tool)'
+})
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+_HTTP_SESSION.mount('https://', _HTTP_ADAPTER)
+_HTTP_SESSION.mount('http://', _HTTP_ADAPTER)
+
+# Source lookups from every collection share one set of worker threads, sized to the connection
+# pool, so a collection hands work to idle threads instead of starting and joining five new ones
+_SOURCE_EXECUTOR = ThreadPoolExecutor(max_workers=20, thread_name_prefix='company-research')
+
+# Industry keyword patterns in classification priority order (substring matches, like `in`)
+# One search per category; at this size that beats a single combined multi-pattern scan
+_INDUSTRY_KEYWORDS = tuple(
+    (industry, re.compile('|'.join(re.escape(word) for word in words)))
+    for industry, words in (
+        ('Technology', ['tech', 'software', 'ai', 'digital', 'nvidia', 'intel', 'amd']),
+        ('Healthcare', ['health', 'medical', 'pharma']),
+        ('Real Estate', ['real estate', 'property', 'construction']),
+        ('Financial Services', ['financial', 'bank', 'insurance'])
+    )
+)
+
+# Year patterns like "founded 1990" or "established 1990"
+_FOUNDED_YEAR = re.compile(r'(?:founded|established|since)\s+(\d{4})', re.IGNORECASE)
+
+# Common address patterns, in priority order
+_HEADQUARTERS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'headquarters[:\s]+([^.\n]+)',
+    r'head office[:\s]+([^.\n]+)',
+    r'located in ([^.\n]+)',
+    r'based in ([^.\n]+)'
+))
+
+# Reference data for well-known companies, applied over whatever the website scrape found
+_KNOWN_COMPANIES = (
+    # NVIDIA variations
+    (('nvidia', 'nvda', 'nvidia corp', 'nvidia corporation'), {
+        'description': 'NVIDIA Corporation is an American multinational technology company incorporated in Delaware and based in Santa Clara, California. It designs graphics processing units (GPUs) for the gaming and professional markets, as well as system on a chip units (SoCs) for the mobile computing and automotive market. NVIDIA is a global leader in AI computing and is known for its GeForce graphics cards, Tesla GPUs for data centers, and Tegra mobile processors.',
+        'founded_year': 1993,
+        'headquarters': 'Santa Clara, California',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$60.9 billion (2024)',
+        'market_cap': '$2.8 trillion',
+        'employee_count': '29,600+',
+        'ceo': 'Jensen Huang',
+        'website': 'https://www.nvidia.com',
+        'ticker': 'NVDA',
+        'revenue_growth': '126% YoY',
+        'profit_margin': '57.3%',
+        'pe_ratio': '74.2'
+    }),
+    # Apple variations
+    (('apple', 'aapl', 'apple inc', 'apple computer'), {
+        'description': 'Apple Inc. is an American multinational technology company that specializes in consumer electronics, computer software, and online services. Apple is the world\'s largest technology company by revenue and one of the world\'s most valuable companies. The company designs, develops, and sells consumer electronics, computer software, and related services.',
+        'founded_year': 1976,
+        'headquarters': 'Cupertino, California',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$383.3 billion (2024)',
+        'market_cap': '$3.2 trillion',
+        'employee_count': '164,000+',
+        'ceo': 'Tim Cook',
+        'website': 'https://www.apple.com',
+        'ticker': 'AAPL',
+        'revenue_growth': '-2.8% YoY',
+        'profit_margin': '25.3%',
+        'pe_ratio': '28.5'
+    }),
+    # Microsoft variations
+    (('microsoft', 'msft', 'microsoft corp', 'microsoft corporation'), {
+        'description': 'Microsoft Corporation is an American multinational technology company which produces computer software, consumer electronics, personal computers, and related services. Its best known software products are the Microsoft Windows line of operating systems, the Microsoft Office suite, and the Internet Explorer and Edge web browsers.',
+        'founded_year': 1975,
+        'headquarters': 'Redmond, Washington',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$236.6 billion (2024)',
+        'market_cap': '$3.1 trillion',
+        'employee_count': '221,000+',
+        'ceo': 'Satya Nadella',
+        'website': 'https://www.microsoft.com',
+        'ticker': 'MSFT',
+        'revenue_growth': '13.6% YoY',
+        'profit_margin': '36.7%',
+        'pe_ratio': '35.8'
+    }),
+    # Google/Alphabet variations
+    (('google', 'alphabet', 'googl', 'goog'), {
+        'description': 'Alphabet Inc. is an American multinational technology conglomerate holding company. It was created through a restructuring of Google on October 2, 2015, and became the parent company of Google and several former Google subsidiaries.',
+        'founded_year': 1998,
+        'headquarters': 'Mountain View, California',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$307.4 billion (2024)',
+        'market_cap': '$2.1 trillion',
+        'employee_count': '156,500+',
+        'ceo': 'Sundar Pichai',
+        'website': 'https://www.alphabet.com',
+        'ticker': 'GOOGL',
+        'revenue_growth': '8.7% YoY',
+        'profit_margin': '23.8%',
+        'pe_ratio': '26.4'
+    }),
+    # Amazon variations
+    (('amazon', 'amzn', 'amazon.com'), {
+        'description': 'Amazon.com, Inc. is an American multinational technology company focusing on e-commerce, cloud computing, digital streaming, and artificial intelligence.',
+        'founded_year': 1994,
+        'headquarters': 'Seattle, Washington',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$574.8 billion (2024)',
+        'market_cap': '$1.8 trillion',
+        'employee_count': '1,468,000+',
+        'ceo': 'Andy Jassy',
+        'website': 'https://www.amazon.com',
+        'ticker': 'AMZN',
+        'revenue_growth': '11.8% YoY',
+        'profit_margin': '6.4%',
+        'pe_ratio': '58.2'
+    }),
+    # Tesla variations
+    (('tesla', 'tsla', 'tesla motors'), {
+        'description': 'Tesla, Inc. is an American multinational automotive and clean energy company headquartered in Austin, Texas. Tesla designs and manufactures electric vehicles, battery energy storage, solar panels and related products and services.',
+        'founded_year': 2003,
+        'headquarters': 'Austin, Texas',
+        'industry': 'Automotive',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$96.8 billion (2024)',
+        'market_cap': '$760 billion',
+        'employee_count': '140,000+',
+        'ceo': 'Elon Musk',
+        'website': 'https://www.tesla.com',
+        'ticker': 'TSLA',
+        'revenue_growth': '18.8% YoY',
+        'profit_margin': '15.4%',
+        'pe_ratio': '42.1'
+    }),
+    # Meta/Facebook variations
+    (('meta', 'facebook', 'fb'), {
+        'description': 'Meta Platforms, Inc. is an American multinational technology conglomerate. The company owns and operates Facebook, Instagram, WhatsApp, and other products and services.',
+        'founded_year': 2004,
+        'headquarters': 'Menlo Park, California',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$134.9 billion (2024)',
+        'market_cap': '$1.2 trillion',
+        'employee_count': '86,482',
+        'ceo': 'Mark Zuckerberg',
+        'website': 'https://www.meta.com',
+        'ticker': 'META',
+        'revenue_growth': '15.7% YoY',
+        'profit_margin': '34.1%',
+        'pe_ratio': '24.8'
+    }),
+    # Netflix variations
+    (('netflix', 'nflx'), {
+        'description': 'Netflix, Inc. is an American subscription streaming service and production company. The company provides streaming media and video-on-demand online and DVD by mail.',
+        'founded_year': 1997,
+        'headquarters': 'Los Gatos, California',
+        'industry': 'Entertainment',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$33.7 billion (2024)',
+        'market_cap': '$240 billion',
+        'employee_count': '12,800',
+        'ceo': 'Ted Sarandos',
+        'website': 'https://www.netflix.com',
+        'ticker': 'NFLX',
+        'revenue_growth': '6.7% YoY',
+        'profit_margin': '16.8%',
+        'pe_ratio': '32.1'
+    }),
+    # Salesforce variations
+    (('salesforce', 'crm'), {
+        'description': 'Salesforce, Inc. is an American cloud-based software company headquartered in San Francisco, California. It provides customer relationship management software and applications focused on sales, customer service, marketing automation, e-commerce, analytics, and application development.',
+        'founded_year': 1999,
+        'headquarters': 'San Francisco, California',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$34.9 billion (2024)',
+        'market_cap': '$240 billion',
+        'employee_count': '73,541',
+        'ceo': 'Marc Benioff',
+        'website': 'https://www.salesforce.com',
+        'ticker': 'CRM',
+        'revenue_growth': '11.1% YoY',
+        'profit_margin': '4.2%',
+        'pe_ratio': '45.2'
+    }),
+    # Oracle variations
+    (('oracle', 'orcl'), {
+        'description': 'Oracle Corporation is an American multinational computer technology corporation headquartered in Austin, Texas. The company sells database software and technology, cloud engineered systems, and enterprise software products.',
+        'founded_year': 1977,
+        'headquarters': 'Austin, Texas',
+        'industry': 'Technology',
+        'business_type': 'Corporation',
+        'estimated_revenue': '$50.0 billion (2024)',
+        'market_cap': '$320 billion',
+        'employee_count': '164,000',
+        'ceo': 'Safra Catz',
+        'website': 'https://www.oracle.com',
+        'ticker': 'ORCL',
+        'revenue_growth': '6.3% YoY',
+        'profit_margin': '23.4%',
+        'pe_ratio': '31.8'
+    })
+)
+
+# Each alias maps to its company's data; multi-word aliases only match the whole name
+_KNOWN_COMPANY_ALIASES = {alias: data for aliases, data in _KNOWN_COMPANIES for alias in aliases}
+_NAME_TOKENS = re.compile(r'[a-z0-9]+')
+
+def _cached_source(source):
+    """Reuse a source collector's successful results per company name until its TTL expires"""
+    source_cache = _SOURCE_CACHES[source]
+    
+    def decorator(collect):
+        @wraps(collect)
+        def wrapper(self, company_name, force_refresh=False):
+            key = company_name.strip().lower()
+            if not force_refresh:
+                with _SOURCE_CACHE_LOCK:
+                    cached = source_cache.get(key)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+            
+            result = collect(self, company_name)
+            
+            # Empty results and errors are retried on the next call rather than cached
+            if result and not (isinstance(result, dict) and 'error' in result):
+                with _SOURCE_CACHE_LOCK:
+                    source_cache[key] = copy.deepcopy(result)
+            return result
+        return wrapper
+    return decorator
+
 class CompanyResearchCollector:
     """Collects company data from various legitimate sources"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BusinessIntelligencePlatform/1.0 (Compliant Research Tool)'
-        })
+        self.session = _HTTP_SESSION
         self.logger = logging.getLogger(__name__)
         
-    def collect_company_data(self, company_name: str) -> Optional[Dict]:
-        """Collect comprehensive company data from multiple sources"""
+    def collect_company_data(self, company_name: str, force_refresh: bool = False) -> Optional[Dict]:
+        """Collect comprehensive company data from multiple sources; force_refresh bypasses cached sources"""
         try:
-            self.logger.info(f"Starting data collection for company: {company_name}")
+            self.logger.info("Starting data collection for company: %s", company_name)
             
             # Initialize data structure
             company_data = {
@@ -29,32 +282,40 @@ class CompanyResearchCollector:
                 'last_data_refresh': datetime.utcnow().isoformat()
             }
             
+            # The sources are independent, mostly network-bound lookups, so fetch them
+            # concurrently and merge in the original order so later sources still win
+            sec_future = _SOURCE_EXECUTOR.submit(self._collect_sec_data, company_name, force_refresh)
+            website_future = _SOURCE_EXECUTOR.submit(self._collect_website_data, company_name, force_refresh)
+            linkedin_future = _SOURCE_EXECUTOR.submit(self._collect_linkedin_data, company_name, force_refresh)
+            news_future = _SOURCE_EXECUTOR.submit(self._collect_news_data, company_name, force_refresh)
+            directory_future = _SOURCE_EXECUTOR.submit(self._collect_directory_data, company_name, force_refresh)
+            
             # Collect from SEC (for public companies)
-            sec_data = self._collect_sec_data(company_name)
+            sec_data = sec_future.result()
             if sec_data:
                 company_data.update(sec_data)
                 company_data['data_sources'].append('SEC')
             
             # Collect from company website
-            website_data = self._collect_website_data(company_name)
+            website_data = website_future.result()
             if website_data:
                 company_data.update(website_data)
                 company_data['data_sources'].append('Company Website')
             
             # Collect from LinkedIn (public business info only)
-            linkedin_data = self._collect_linkedin_data(company_name)
+            linkedin_data = linkedin_future.result()
             if linkedin_data:
                 company_data.update(linkedin_data)
                 company_data['data_sources'].append('LinkedIn')
             
             # Collect recent news
-            news_data = self._collect_news_data(company_name)
+            news_data = news_future.result()
             if news_data:
                 company_data['recent_news'] = news_data
                 company_data['data_sources'].append('News Sources')
             
             # Collect from D&B or similar business directories
-            directory_data = self._collect_directory_data(company_name)
+            directory_data = directory_future.result()
             if directory_data:
                 company_data.update(directory_data)
                 company_data['data_sources'].append('Business Directory')
@@ -67,13 +328,14 @@ class CompanyResearchCollector:
             if not company_data.get('industry'):
                 company_data['industry'] = self._classify_industry(company_data)
             
-            self.logger.info(f"Data collection completed for {company_name}")
+            self.logger.info("Data collection completed for %s", company_name)
             return company_data
             
         except Exception as e:
             self.logger.error(f"Error collecting data for {company_name}: {str(e)}")
             return {"error": f"CompanyResearch error: {str(e)}"}
     
+    @_cached_source('sec')
     def _collect_sec_data(self, company_name: str) -> Optional[Dict]:
         """Collect data from SEC filings (for public companies)"""
         try:
@@ -89,6 +351,7 @@ class CompanyResearchCollector:
             self.logger.warning(f"Error collecting SEC data: {str(e)}")
             return {"error": f"Error collecting SEC data: {str(e)}"}
     
+    @_cached_source('website')
     def _collect_website_data(self, company_name: str) -> Optional[Dict]:
         """Collect data from company website"""
         try:
@@ -104,198 +367,26 @@ class CompanyResearchCollector:
                 
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
-                # Extract company information from website
+                # Extract company information from website; the page text is rendered once for all extractors
+                text = soup.get_text()
                 website_data.update({
                     'website': website_url,
                     'description': self._extract_description(soup),
-                    'business_type': self._extract_business_type(soup),
-                    'founded_year': self._extract_founded_year(soup),
-                    'headquarters': self._extract_headquarters(soup)
+                    'business_type': self._extract_business_type(text),
+                    'founded_year': self._extract_founded_year(text),
+                    'headquarters': self._extract_headquarters(text)
                 })
             
-            # Apply hardcoded data for known companies (case-insensitive and fuzzy matching)
+            # Apply hardcoded data for known companies: the whole name first, then each word of it
             company_name_lower = company_name.lower()
-            
-            # NVIDIA variations
-            if any(term in company_name_lower for term in ['nvidia', 'nvda', 'nvidia corp', 'nvidia corporation']):
-                website_data.update({
-                    'description': 'NVIDIA Corporation is an American multinational technology company incorporated in Delaware and based in Santa Clara, California. It designs graphics processing units (GPUs) for the gaming and professional markets, as well as system on a chip units (SoCs) for the mobile computing and automotive market. NVIDIA is a global leader in AI computing and is known for its GeForce graphics cards, Tesla GPUs for data centers, and Tegra mobile processors.',
-                    'founded_year': 1993,
-                    'headquarters': 'Santa Clara, California',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$60.9 billion (2024)',
-                    'market_cap': '$2.8 trillion',
-                    'employee_count': '29,600+',
-                    'ceo': 'Jensen Huang',
-                    'website': 'https://www.nvidia.com',
-                    'ticker': 'NVDA',
-                    'revenue_growth': '126% YoY',
-                    'profit_margin': '57.3%',
-                    'pe_ratio': '74.2'
-                })
-            # Apple variations
-            elif any(term in company_name_lower for term in ['apple', 'aapl', 'apple inc', 'apple computer']):
-                website_data.update({
-                    'description': 'Apple Inc. is an American multinational technology company that specializes in consumer electronics, computer software, and online services. Apple is the world\'s largest technology company by revenue and one of the world\'s most valuable companies. The company designs, develops, and sells consumer electronics, computer software, and related services.',
-                    'founded_year': 1976,
-                    'headquarters': 'Cupertino, California',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$383.3 billion (2024)',
-                    'market_cap': '$3.2 trillion',
-                    'employee_count': '164,000+',
-                    'ceo': 'Tim Cook',
-                    'website': 'https://www.apple.com',
-                    'ticker': 'AAPL',
-                    'revenue_growth': '-2.8% YoY',
-                    'profit_margin': '25.3%',
-                    'pe_ratio': '28.5'
-                })
-            # Microsoft variations
-            elif any(term in company_name_lower for term in ['microsoft', 'msft', 'microsoft corp', 'microsoft corporation']):
-                website_data.update({
-                    'description': 'Microsoft Corporation is an American multinational technology company which produces computer software, consumer electronics, personal computers, and related services. Its best known software products are the Microsoft Windows line of operating systems, the Microsoft Office suite, and the Internet Explorer and Edge web browsers.',
-                    'founded_year': 1975,
-                    'headquarters': 'Redmond, Washington',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$236.6 billion (2024)',
-                    'market_cap': '$3.1 trillion',
-                    'employee_count': '221,000+',
-                    'ceo': 'Satya Nadella',
-                    'website': 'https://www.microsoft.com',
-                    'ticker': 'MSFT',
-                    'revenue_growth': '13.6% YoY',
-                    'profit_margin': '36.7%',
-                    'pe_ratio': '35.8'
-                })
-            # Google/Alphabet variations
-            elif any(term in company_name_lower for term in ['google', 'alphabet', 'googl', 'goog']):
-                website_data.update({
-                    'description': 'Alphabet Inc. is an American multinational technology conglomerate holding company. It was created through a restructuring of Google on October 2, 2015, and became the parent company of Google and several former Google subsidiaries.',
-                    'founded_year': 1998,
-                    'headquarters': 'Mountain View, California',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$307.4 billion (2024)',
-                    'market_cap': '$2.1 trillion',
-                    'employee_count': '156,500+',
-                    'ceo': 'Sundar Pichai',
-                    'website': 'https://www.alphabet.com',
-                    'ticker': 'GOOGL',
-                    'revenue_growth': '8.7% YoY',
-                    'profit_margin': '23.8%',
-                    'pe_ratio': '26.4'
-                })
-            # Amazon variations
-            elif any(term in company_name_lower for term in ['amazon', 'amzn', 'amazon.com']):
-                website_data.update({
-                    'description': 'Amazon.com, Inc. is an American multinational technology company focusing on e-commerce, cloud computing, digital streaming, and artificial intelligence.',
-                    'founded_year': 1994,
-                    'headquarters': 'Seattle, Washington',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$574.8 billion (2024)',
-                    'market_cap': '$1.8 trillion',
-                    'employee_count': '1,468,000+',
-                    'ceo': 'Andy Jassy',
-                    'website': 'https://www.amazon.com',
-                    'ticker': 'AMZN',
-                    'revenue_growth': '11.8% YoY',
-                    'profit_margin': '6.4%',
-                    'pe_ratio': '58.2'
-                })
-            # Tesla variations
-            elif any(term in company_name_lower for term in ['tesla', 'tsla', 'tesla motors']):
-                website_data.update({
-                    'description': 'Tesla, Inc. is an American multinational automotive and clean energy company headquartered in Austin, Texas. Tesla designs and manufactures electric vehicles, battery energy storage, solar panels and related products and services.',
-                    'founded_year': 2003,
-                    'headquarters': 'Austin, Texas',
-                    'industry': 'Automotive',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$96.8 billion (2024)',
-                    'market_cap': '$760 billion',
-                    'employee_count': '140,000+',
-                    'ceo': 'Elon Musk',
-                    'website': 'https://www.tesla.com',
-                    'ticker': 'TSLA',
-                    'revenue_growth': '18.8% YoY',
-                    'profit_margin': '15.4%',
-                    'pe_ratio': '42.1'
-                })
-            # Meta/Facebook variations
-            elif any(term in company_name_lower for term in ['meta', 'facebook', 'fb']):
-                website_data.update({
-                    'description': 'Meta Platforms, Inc. is an American multinational technology conglomerate. The company owns and operates Facebook, Instagram, WhatsApp, and other products and services.',
-                    'founded_year': 2004,
-                    'headquarters': 'Menlo Park, California',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$134.9 billion (2024)',
-                    'market_cap': '$1.2 trillion',
-                    'employee_count': '86,482',
-                    'ceo': 'Mark Zuckerberg',
-                    'website': 'https://www.meta.com',
-                    'ticker': 'META',
-                    'revenue_growth': '15.7% YoY',
-                    'profit_margin': '34.1%',
-                    'pe_ratio': '24.8'
-                })
-            # Netflix variations
-            elif any(term in company_name_lower for term in ['netflix', 'nflx']):
-                website_data.update({
-                    'description': 'Netflix, Inc. is an American subscription streaming service and production company. The company provides streaming media and video-on-demand online and DVD by mail.',
-                    'founded_year': 1997,
-                    'headquarters': 'Los Gatos, California',
-                    'industry': 'Entertainment',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$33.7 billion (2024)',
-                    'market_cap': '$240 billion',
-                    'employee_count': '12,800',
-                    'ceo': 'Ted Sarandos',
-                    'website': 'https://www.netflix.com',
-                    'ticker': 'NFLX',
-                    'revenue_growth': '6.7% YoY',
-                    'profit_margin': '16.8%',
-                    'pe_ratio': '32.1'
-                })
-            # Salesforce variations
-            elif any(term in company_name_lower for term in ['salesforce', 'crm']):
-                website_data.update({
-                    'description': 'Salesforce, Inc. is an American cloud-based software company headquartered in San Francisco, California. It provides customer relationship management software and applications focused on sales, customer service, marketing automation, e-commerce, analytics, and application development.',
-                    'founded_year': 1999,
-                    'headquarters': 'San Francisco, California',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$34.9 billion (2024)',
-                    'market_cap': '$240 billion',
-                    'employee_count': '73,541',
-                    'ceo': 'Marc Benioff',
-                    'website': 'https://www.salesforce.com',
-                    'ticker': 'CRM',
-                    'revenue_growth': '11.1% YoY',
-                    'profit_margin': '4.2%',
-                    'pe_ratio': '45.2'
-                })
-            # Oracle variations
-            elif any(term in company_name_lower for term in ['oracle', 'orcl']):
-                website_data.update({
-                    'description': 'Oracle Corporation is an American multinational computer technology corporation headquartered in Austin, Texas. The company sells database software and technology, cloud engineered systems, and enterprise software products.',
-                    'founded_year': 1977,
-                    'headquarters': 'Austin, Texas',
-                    'industry': 'Technology',
-                    'business_type': 'Corporation',
-                    'estimated_revenue': '$50.0 billion (2024)',
-                    'market_cap': '$320 billion',
-                    'employee_count': '164,000',
-                    'ceo': 'Safra Catz',
-                    'website': 'https://www.oracle.com',
-                    'ticker': 'ORCL',
-                    'revenue_growth': '6.3% YoY',
-                    'profit_margin': '23.4%',
-                    'pe_ratio': '31.8'
-                })
+            known = _KNOWN_COMPANY_ALIASES.get(company_name_lower.strip())
+            if known is None:
+                for token in _NAME_TOKENS.findall(company_name_lower):
+                    known = _KNOWN_COMPANY_ALIASES.get(token)
+                    if known is not None:
+                        break
+            if known is not None:
+                website_data.update(known)
             
             # Only return data if we have some meaningful information
             if website_data:
@@ -370,11 +461,11 @@ class CompanyResearchCollector:
         except Exception:
             return "Company description not available"
     
-    def _extract_business_type(self, soup: BeautifulSoup) -> str:
-        """Extract business type from website"""
+    def _extract_business_type(self, text: str) -> str:
+        """Extract business type from website text"""
         try:
             # Look for business type indicators
-            text = soup.get_text().lower()
+            text = text.lower()
             
             if any(word in text for word in ['corporation', 'corp', 'inc']):
                 return 'Corporation'
@@ -388,13 +479,10 @@ class CompanyResearchCollector:
         except Exception:
             return 'Private Company'
     
-    def _extract_founded_year(self, soup: BeautifulSoup) -> Optional[int]:
-        """Extract founded year from website"""
+    def _extract_founded_year(self, text: str) -> Optional[int]:
+        """Extract founded year from website text"""
         try:
-            text = soup.get_text()
-            # Look for year patterns like "founded in 1990" or "established 1990"
-            year_pattern = r'(?:founded|established|since)\s+(\d{4})'
-            match = re.search(year_pattern, text, re.IGNORECASE)
+            match = _FOUNDED_YEAR.search(text)
             
             if match:
                 year = int(match.group(1))
@@ -406,22 +494,12 @@ class CompanyResearchCollector:
         except Exception:
             return None
     
-    def _extract_headquarters(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract headquarters location from website"""
+    def _extract_headquarters(self, text: str) -> Optional[str]:
+        """Extract headquarters location from website text"""
         try:
             # Look for address information
-            text = soup.get_text()
-            
-            # Common address patterns
-            address_patterns = [
-                r'headquarters[:\s]+([^.\n]+)',
-                r'head office[:\s]+([^.\n]+)',
-                r'located in ([^.\n]+)',
-                r'based in ([^.\n]+)'
-            ]
-            
-            for pattern in address_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in _HEADQUARTERS_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     return match.group(1).strip()
             
@@ -430,6 +508,7 @@ class CompanyResearchCollector:
         except Exception:
             return None
     
+    @_cached_source('linkedin')
     def _collect_linkedin_data(self, company_name: str) -> Optional[Dict]:
         """Collect public business information from LinkedIn"""
         try:
@@ -449,6 +528,7 @@ class CompanyResearchCollector:
             self.logger.warning(f"Error collecting LinkedIn data: {str(e)}")
             return None
     
+    @_cached_source('news')
     def _collect_news_data(self, company_name: str) -> List[Dict]:
         """Collect recent news about the company"""
         try:
@@ -501,6 +581,7 @@ class CompanyResearchCollector:
             self.logger.warning(f"Error collecting news data: {str(e)}")
             return []
     
+    @_cached_source('directory')
     def _collect_directory_data(self, company_name: str) -> Optional[Dict]:
         """Collect data from business directories"""
         try:
@@ -561,16 +642,13 @@ class CompanyResearchCollector:
             name = name.lower() if name else ''
             description = description.lower() if description else ''
             
-            if any(word in name or word in description for word in ['tech', 'software', 'ai', 'digital', 'nvidia', 'intel', 'amd']):
-                return 'Technology'
-            elif any(word in name or word in description for word in ['health', 'medical', 'pharma']):
-                return 'Healthcare'
-            elif any(word in name or word in description for word in ['real estate', 'property', 'construction']):
-                return 'Real Estate'
-            elif any(word in name or word in description for word in ['financial', 'bank', 'insurance']):
-                return 'Financial Services'
-            else:
-                return 'Other'
+            # One C-level scan per industry, checked in priority order; the newline keeps a
+            # keyword from matching across the name/description boundary
+            text = f'{name}\n{description}'
+            for industry, keywords in _INDUSTRY_KEYWORDS:
+                if keywords.search(text):
+                    return industry
+            return 'Other'
                 
         except Exception as e:
             self.logger.warning(f"Error classifying industry: {str(e)}")
@@ -21,7 +21,7 @@ class EdgarDataCollector:
     def collect_company_data(self, company_name: str) -> Optional[Dict]:
         """Collect financial data from EDGAR for a company"""
         try:
-            self.logger.info(f"Collecting EDGAR data for: {company_name}")
+            self.logger.info("Collecting EDGAR data for: %s", company_name)
             
             # Find company CIK (Central Index Key)
             cik = self._find_company_cik(company_name)
@@ -53,7 +53,7 @@ class EdgarDataCollector:
                 'last_updated': datetime.utcnow().isoformat()
             }
             
-            self.logger.info(f"EDGAR data collection completed for {company_name}")
+            self.logger.info("EDGAR data collection completed for %s", company_name)
             return edgar_data
             
         except Exception as e:
@@ -70,7 +70,7 @@ class EdgarDataCollector:
             
             # Only try SEC website if we don't have the CIK in our mapping
             # SEC has strict rate limiting, so we'll use our known mappings
-            self.logger.info(f"Using known CIK mapping for {company_name}")
+            self.logger.info("Using known CIK mapping for %s", company_name)
             return None
             
         except Exception as e:
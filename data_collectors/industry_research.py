@@ -17,7 +17,7 @@ class IndustryResearchCollector:
     def collect_industry_data(self, industry: str) -> Optional[Dict]:
         """Collect comprehensive industry data"""
         try:
-            self.logger.info(f"Collecting industry data for: {industry}")
+            self.logger.info("Collecting industry data for: %s", industry)
             
             # Initialize data structure
             industry_data = {
@@ -56,7 +56,7 @@ class IndustryResearchCollector:
                 industry_data['financial_benchmarks'] = financial_data
                 industry_data['sources'].append('Financial Research')
             
-            self.logger.info(f"Industry data collection completed for {industry}")
+            self.logger.info("Industry data collection completed for %s", industry)
             return industry_data
             
         except Exception as e:
@@ -21,7 +21,7 @@ class LinkedInDataCollector:
     def collect_company_data(self, company_name: str) -> Optional[Dict]:
         """Collect public business information from LinkedIn"""
         try:
-            self.logger.info(f"Collecting LinkedIn data for: {company_name}")
+            self.logger.info("Collecting LinkedIn data for: %s", company_name)
             
             # Check for known companies first (avoid scraping LinkedIn)
             company_name_lower = company_name.lower()
@@ -28,7 +28,7 @@ class NewsDataCollector:
     def collect_company_news(self, company_name: str, days_back: int = 30) -> List[Dict]:
         """Collect recent news about a specific company"""
         try:
-            self.logger.info(f"Collecting news for company: {company_name}")
+            self.logger.info("Collecting news for company: %s", company_name)
             
             all_news = []
             
@@ -49,7 +49,7 @@ class NewsDataCollector:
             all_news = self._deduplicate_news(all_news)
             all_news.sort(key=lambda x: x.get('date', ''), reverse=True)
             
-            self.logger.info(f"Collected {len(all_news)} news items for {company_name}")
+            self.logger.info("Collected %s news items for %s", len(all_news), company_name)
             return all_news
             
         except Exception as e:
@@ -59,7 +59,7 @@ class NewsDataCollector:
     def collect_industry_news(self, industry: str, days_back: int = 30) -> List[Dict]:
         """Collect recent news about a specific industry"""
         try:
-            self.logger.info(f"Collecting industry news for: {industry}")
+            self.logger.info("Collecting industry news for: %s", industry)
             
             all_news = []
             
@@ -80,7 +80,7 @@ class NewsDataCollector:
             all_news = self._deduplicate_news(all_news)
             all_news.sort(key=lambda x: x.get('date', ''), reverse=True)
             
-            self.logger.info(f"Collected {len(all_news)} industry news items for {industry}")
+            self.logger.info("Collected %s industry news items for %s", len(all_news), industry)
             return all_news
             
         except Exception as e:
@@ -342,17 +342,14 @@ class NewsDataCollector:
                 # Extract key themes
                 key_phrases = self._extract_key_phrases(title + ' ' + summary)
                 
+                sentiment = news.get('sentiment')
                 for phrase in key_phrases:
-                    if phrase not in themes:
-                        themes[phrase] = {'count': 0, 'sentiment': 'neutral'}
-                    
-                    themes[phrase]['count'] += 1
+                    theme = themes.setdefault(phrase, {'count': 0, 'sentiment': 'neutral'})
+                    theme['count'] += 1
                     
                     # Update sentiment
-                    if news.get('sentiment') == 'positive':
-                        themes[phrase]['sentiment'] = 'positive'
-                    elif news.get('sentiment') == 'negative':
-                        themes[phrase]['sentiment'] = 'negative'
+                    if sentiment in ('positive', 'negative'):
+                        theme['sentiment'] = sentiment
             
             # Convert to trend list
             for theme, data in themes.items():
@@ -19,7 +19,7 @@ class SECDataCollector:
     def collect_company_data(self, company_name: str) -> Optional[Dict]:
         """Collect SEC data for a company"""
         try:
-            self.logger.info(f"Collecting SEC data for: {company_name}")
+            self.logger.info("Collecting SEC data for: %s", company_name)
             
             # Search for company CIK
             cik = self._find_company_cik(company_name)
@@ -47,7 +47,7 @@ class SECDataCollector:
                 'last_updated': datetime.utcnow().isoformat()
             }
             
-            self.logger.info(f"SEC data collection completed for {company_name}")
+            self.logger.info("SEC data collection completed for %s", company_name)
             return sec_data
             
         except Exception as e:
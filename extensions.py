@@ -0,0 +1,119 @@
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from celery import Celery, Task
+from celery.schedules import crontab
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
+from flask_migrate import Migrate
+
+# Shared cache backend, configured from CACHE_* settings in create_app
+cache = Cache()
+
+# Transparent br/gzip response compression, configured from COMPRESS_* settings
+compress = Compress()
+
+# Schema migrations in migrations/, applied with `flask db upgrade`; batch mode lets ALTERs run on SQLite
+migrate = Migrate(render_as_batch=True)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson and falls back to Flask's defaults for other types"""
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize data as JSON using orjson"""
+        return self._dump_bytes(obj, **kwargs).decode()
+    
+    def response(self, *args, **kwargs):
+        """Build a JSON response straight from orjson's bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        
+        return self._app.response_class(self._dump_bytes(obj, indent=indent) + b'\n', mimetype=self.mimetype)
+    
+    def _dump_bytes(self, obj, **kwargs):
+        """Encode data as UTF-8 JSON bytes, handing unsupported types such as Decimal to Flask's default"""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def loads(self, s, **kwargs):
+        """Deserialize data as JSON using orjson"""
+        return orjson.loads(s)
+
+def init_celery(app):
+    """Create the Celery app for background jobs, running each task inside the Flask app context"""
+    class FlaskTask(Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+    
+    celery_app = Celery(app.name, task_cls=FlaskTask)
+    celery_app.conf.update(
+        broker_url=app.config['CELERY_BROKER_URL'],
+        result_backend=app.config['CELERY_RESULT_BACKEND'],
+        task_always_eager=app.config.get('CELERY_TASK_ALWAYS_EAGER', False),
+        task_ignore_result=True,
+        beat_schedule={
+            'maintain-audit-log-partitions': {
+                'task': 'tasks.maintain_audit_log_partitions',
+                'schedule': 24 * 60 * 60
+            },
+            # After midnight UTC, once the audit log writer has flushed the previous day
+            'aggregate-compliance-reports': {
+                'task': 'tasks.aggregate_compliance_reports',
+                'schedule': crontab(hour=2, minute=0)
+            }
+        }
+    )
+    celery_app.set_default()
+    app.extensions['celery'] = celery_app
+    return celery_app
+
+class JSONLogFormatter(logging.Formatter):
+    """Formats log records as one orjson-encoded JSON object per line"""
+    
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        
+        return orjson.dumps(entry, default=str).decode()
+
+# Started once per process by init_logging
+_log_listener = None
+
+def init_logging(app):
+    """Send log records through a queue so formatting and IO happen off the request thread"""
+    global _log_listener
+    
+    logging.getLogger().setLevel(app.config['LOG_LEVEL'])
+    if app.testing or _log_listener is not None:
+        return
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONLogFormatter())
+    
+    log_queue = queue.SimpleQueue()
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _log_listener.start()
+    
+    # Forked workers inherit the queue but not the listener thread
+    os.register_at_fork(after_in_child=_log_listener.start)
+    # Write whatever is still queued when the process exits
+    atexit.register(_log_listener.stop)
\ No newline at end of file
@@ -0,0 +1,28 @@
+import multiprocessing
+import os
+
+# Production entry point: gunicorn -c gunicorn.conf.py
+wsgi_app = "app:create_app('production')"
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Handlers spend most of their time waiting on the database and upstream APIs,
+# so each worker serves many requests concurrently as gevent greenlets.
+# Set GUNICORN_WORKER_CLASS=gthread where gevent's monkey-patching is unwanted.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS') or 'gevent'
+workers = int(os.environ.get('GUNICORN_WORKERS') or multiprocessing.cpu_count() * 2 + 1)
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS') or 500)
+threads = int(os.environ.get('GUNICORN_THREADS') or 8)  # gthread only
+
+# Compiling the URL rules dominates create_app, so thread workers build the app once in
+# the master and share it copy-on-write. gevent workers must import the app after
+# monkey-patching, so they each build their own. Either way, data collectors and
+# analyzers are imported on first use.
+preload_app = worker_class != 'gevent'
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperate with gevent so queries yield instead of blocking the worker"""
+    if worker_class != 'gevent':
+        return
+    
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""Index audit logs by user and date
+
+Revision ID: 0d9b3a7e5c18
+Revises: e81d4c6a2f95
+Create Date: 2026-10-16 18:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0d9b3a7e5c18'
+down_revision = 'e81d4c6a2f95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_audit_user_created', 'audit_logs', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_audit_user_created', table_name='audit_logs')
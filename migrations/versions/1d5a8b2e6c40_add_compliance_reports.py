@@ -0,0 +1,33 @@
+"""Add compliance_reports
+
+Revision ID: 1d5a8b2e6c40
+Revises: a8c1f4e7d3b9
+Create Date: 2026-10-16 18:12:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1d5a8b2e6c40'
+down_revision = 'a8c1f4e7d3b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('compliance_reports',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('report_date', sa.Date(), nullable=False),
+    sa.Column('total_activities', sa.Integer(), nullable=False),
+    sa.Column('access_method_usage', sa.JSON(), nullable=True),
+    sa.Column('data_source_usage', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'report_date')
+    )
+
+
+def downgrade():
+    op.drop_table('compliance_reports')
@@ -0,0 +1,32 @@
+"""Add company_id and company indexes to financial_opportunities
+
+Revision ID: 3f6d2b8e4c10
+Revises: 9a1c0e5b7d21
+Create Date: 2026-10-16 18:01:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6d2b8e4c10'
+down_revision = '9a1c0e5b7d21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('financial_opportunities') as batch_op:
+        batch_op.add_column(sa.Column('company_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_financial_opportunities_company_id', 'companies', ['company_id'], ['id'])
+        batch_op.create_index('ix_fo_company_created', ['company_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_fo_company_priority_created', ['company_id', 'priority', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('financial_opportunities') as batch_op:
+        batch_op.drop_index('ix_fo_company_priority_created')
+        batch_op.drop_index('ix_fo_company_created')
+        batch_op.drop_constraint('fk_financial_opportunities_company_id', type_='foreignkey')
+        batch_op.drop_column('company_id')
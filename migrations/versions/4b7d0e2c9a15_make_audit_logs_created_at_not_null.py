@@ -0,0 +1,32 @@
+"""Make audit_logs.created_at not null
+
+Revision ID: 4b7d0e2c9a15
+Revises: c3e8b2f6a4d7
+Create Date: 2026-10-16 18:08:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7d0e2c9a15'
+down_revision = 'c3e8b2f6a4d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows logged before the writer always stamped a time take the migration time, in UTC like the rest
+    if op.get_bind().dialect.name == 'postgresql':
+        now = "now() AT TIME ZONE 'utc'"
+    else:
+        now = 'CURRENT_TIMESTAMP'
+    op.execute(sa.text(f'UPDATE audit_logs SET created_at = {now} WHERE created_at IS NULL'))
+    with op.batch_alter_table('audit_logs') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('audit_logs') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
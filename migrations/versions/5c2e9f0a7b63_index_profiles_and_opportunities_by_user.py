@@ -0,0 +1,26 @@
+"""Index profiles and opportunities by user
+
+Revision ID: 5c2e9f0a7b63
+Revises: b5e7a1d9c342
+Create Date: 2026-10-16 18:03:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e9f0a7b63'
+down_revision = 'b5e7a1d9c342'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_bp_user_status', 'business_profiles', ['user_id', 'status'], unique=False)
+    op.create_index('ix_fo_user_priority', 'financial_opportunities', ['user_id', 'priority'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_fo_user_priority', table_name='financial_opportunities')
+    op.drop_index('ix_bp_user_status', table_name='business_profiles')
@@ -0,0 +1,26 @@
+"""Add id to the audit log user/date index
+
+Revision ID: 6e0b5d3f1a72
+Revises: f2a6c9e1b8d4
+Create Date: 2026-10-16 18:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e0b5d3f1a72'
+down_revision = 'f2a6c9e1b8d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('ix_audit_user_created', table_name='audit_logs')
+    op.create_index('ix_audit_user_created', 'audit_logs', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_audit_user_created', table_name='audit_logs')
+    op.create_index('ix_audit_user_created', 'audit_logs', ['user_id', 'created_at'], unique=False)
@@ -0,0 +1,24 @@
+"""Index audit logs by date
+
+Revision ID: 7a4f1c8d2e06
+Revises: 0d9b3a7e5c18
+Create Date: 2026-10-16 18:06:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a4f1c8d2e06'
+down_revision = '0d9b3a7e5c18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_audit_created', 'audit_logs', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_audit_created', table_name='audit_logs')
@@ -0,0 +1,32 @@
+"""Add compliance_rollup_runs
+
+No backfill: finding no completed runs, the nightly task rolls up the last report window again,
+replacing the compliance_reports rows it already stored.
+
+Revision ID: 8f3b6d1c5a27
+Revises: 1d5a8b2e6c40
+Create Date: 2026-10-16 19:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f3b6d1c5a27'
+down_revision = '1d5a8b2e6c40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('compliance_rollup_runs',
+    sa.Column('report_date', sa.Date(), nullable=False),
+    sa.Column('users', sa.Integer(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('report_date')
+    )
+
+
+def downgrade():
+    op.drop_table('compliance_rollup_runs')
@@ -0,0 +1,340 @@
+"""Initial schema
+
+Tables as they stood before schema migrations were introduced; databases
+created by db.create_all() at that point should be stamped at this revision.
+
+Revision ID: 9a1c0e5b7d21
+Revises: 
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a1c0e5b7d21'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('companies',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('legal_name', sa.String(length=200), nullable=True),
+    sa.Column('duns_number', sa.String(length=20), nullable=True),
+    sa.Column('ein', sa.String(length=20), nullable=True),
+    sa.Column('industry', sa.String(length=100), nullable=True),
+    sa.Column('sector', sa.String(length=100), nullable=True),
+    sa.Column('business_type', sa.String(length=50), nullable=True),
+    sa.Column('founded_year', sa.Integer(), nullable=True),
+    sa.Column('website', sa.String(length=200), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('email', sa.String(length=120), nullable=True),
+    sa.Column('address_line1', sa.String(length=200), nullable=True),
+    sa.Column('address_line2', sa.String(length=200), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('state', sa.String(length=50), nullable=True),
+    sa.Column('zip_code', sa.String(length=20), nullable=True),
+    sa.Column('country', sa.String(length=50), nullable=True),
+    sa.Column('estimated_revenue', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('revenue_range', sa.String(length=50), nullable=True),
+    sa.Column('employee_count', sa.Integer(), nullable=True),
+    sa.Column('employee_range', sa.String(length=50), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_public', sa.Boolean(), nullable=True),
+    sa.Column('ticker_symbol', sa.String(length=10), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('last_data_refresh', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('duns_number'),
+    sa.UniqueConstraint('ein')
+    )
+    op.create_index(op.f('ix_companies_industry'), 'companies', ['industry'], unique=False)
+    op.create_index(op.f('ix_companies_name'), 'companies', ['name'], unique=False)
+    op.create_table('industry_reports',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('industry', sa.String(length=100), nullable=False),
+    sa.Column('report_type', sa.String(length=50), nullable=True),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=True),
+    sa.Column('key_findings', sa.JSON(), nullable=True),
+    sa.Column('market_trends', sa.JSON(), nullable=True),
+    sa.Column('regulatory_updates', sa.JSON(), nullable=True),
+    sa.Column('planning_opportunities', sa.JSON(), nullable=True),
+    sa.Column('risk_factors', sa.JSON(), nullable=True),
+    sa.Column('tax_considerations', sa.JSON(), nullable=True),
+    sa.Column('succession_planning_insights', sa.JSON(), nullable=True),
+    sa.Column('market_size', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('growth_rate', sa.Float(), nullable=True),
+    sa.Column('key_players', sa.JSON(), nullable=True),
+    sa.Column('competitive_landscape', sa.Text(), nullable=True),
+    sa.Column('regulatory_changes', sa.JSON(), nullable=True),
+    sa.Column('compliance_requirements', sa.JSON(), nullable=True),
+    sa.Column('upcoming_deadlines', sa.JSON(), nullable=True),
+    sa.Column('technology_trends', sa.JSON(), nullable=True),
+    sa.Column('innovation_opportunities', sa.JSON(), nullable=True),
+    sa.Column('digital_transformation', sa.Text(), nullable=True),
+    sa.Column('talent_trends', sa.JSON(), nullable=True),
+    sa.Column('compensation_trends', sa.JSON(), nullable=True),
+    sa.Column('benefit_trends', sa.JSON(), nullable=True),
+    sa.Column('average_revenue', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('average_profit_margins', sa.Float(), nullable=True),
+    sa.Column('financing_trends', sa.JSON(), nullable=True),
+    sa.Column('valuation_metrics', sa.JSON(), nullable=True),
+    sa.Column('data_sources', sa.JSON(), nullable=True),
+    sa.Column('methodology', sa.Text(), nullable=True),
+    sa.Column('last_updated', sa.DateTime(), nullable=True),
+    sa.Column('is_public', sa.Boolean(), nullable=True),
+    sa.Column('subscription_tier_required', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('version', sa.String(length=20), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_industry_reports_industry'), 'industry_reports', ['industry'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('username', sa.String(length=80), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('first_name', sa.String(length=50), nullable=False),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('company_name', sa.String(length=100), nullable=True),
+    sa.Column('job_title', sa.String(length=100), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('subscription_tier', sa.String(length=20), nullable=True),
+    sa.Column('subscription_status', sa.String(length=20), nullable=True),
+    sa.Column('subscription_start_date', sa.DateTime(), nullable=True),
+    sa.Column('subscription_end_date', sa.DateTime(), nullable=True),
+    sa.Column('profiles_used_this_month', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('last_login', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('preferred_industries', sa.JSON(), nullable=True),
+    sa.Column('notification_settings', sa.JSON(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('username')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_table('audit_logs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('action_type', sa.String(length=50), nullable=False),
+    sa.Column('action_description', sa.Text(), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=True),
+    sa.Column('resource_id', sa.Integer(), nullable=True),
+    sa.Column('data_sources_used', sa.JSON(), nullable=True),
+    sa.Column('data_access_method', sa.String(length=50), nullable=True),
+    sa.Column('data_access_url', sa.String(length=500), nullable=True),
+    sa.Column('compliance_status', sa.String(length=20), nullable=True),
+    sa.Column('privacy_impact', sa.String(length=20), nullable=True),
+    sa.Column('data_retention_required', sa.Boolean(), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('user_agent', sa.String(length=500), nullable=True),
+    sa.Column('request_method', sa.String(length=10), nullable=True),
+    sa.Column('request_url', sa.String(length=500), nullable=True),
+    sa.Column('success', sa.Boolean(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('processing_time', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('session_id', sa.String(length=100), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('business_profiles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('profile_name', sa.String(length=200), nullable=True),
+    sa.Column('profile_type', sa.String(length=50), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('primary_planning_needs', sa.JSON(), nullable=True),
+    sa.Column('secondary_planning_needs', sa.JSON(), nullable=True),
+    sa.Column('urgency_level', sa.String(length=20), nullable=True),
+    sa.Column('relationship_stage', sa.String(length=50), nullable=True),
+    sa.Column('relationship_notes', sa.Text(), nullable=True),
+    sa.Column('next_follow_up_date', sa.DateTime(), nullable=True),
+    sa.Column('last_contact_date', sa.DateTime(), nullable=True),
+    sa.Column('opportunities_identified', sa.JSON(), nullable=True),
+    sa.Column('opportunities_prioritized', sa.JSON(), nullable=True),
+    sa.Column('estimated_opportunity_value', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('conversation_starters', sa.JSON(), nullable=True),
+    sa.Column('recent_developments', sa.JSON(), nullable=True),
+    sa.Column('industry_insights', sa.JSON(), nullable=True),
+    sa.Column('custom_fields', sa.JSON(), nullable=True),
+    sa.Column('tags', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('last_analysis_date', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('company_executives',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=True),
+    sa.Column('email', sa.String(length=120), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('linkedin_url', sa.String(length=200), nullable=True),
+    sa.Column('bio', sa.Text(), nullable=True),
+    sa.Column('experience', sa.JSON(), nullable=True),
+    sa.Column('education', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('company_profiles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('business_model', sa.Text(), nullable=True),
+    sa.Column('value_proposition', sa.Text(), nullable=True),
+    sa.Column('target_market', sa.Text(), nullable=True),
+    sa.Column('competitive_advantages', sa.Text(), nullable=True),
+    sa.Column('growth_strategy', sa.Text(), nullable=True),
+    sa.Column('revenue_growth_rate', sa.Float(), nullable=True),
+    sa.Column('profit_margins', sa.Float(), nullable=True),
+    sa.Column('cash_flow_analysis', sa.Text(), nullable=True),
+    sa.Column('debt_levels', sa.Text(), nullable=True),
+    sa.Column('investment_needs', sa.Text(), nullable=True),
+    sa.Column('business_risks', sa.JSON(), nullable=True),
+    sa.Column('market_risks', sa.JSON(), nullable=True),
+    sa.Column('regulatory_risks', sa.JSON(), nullable=True),
+    sa.Column('financial_risks', sa.JSON(), nullable=True),
+    sa.Column('expansion_opportunities', sa.Text(), nullable=True),
+    sa.Column('efficiency_opportunities', sa.Text(), nullable=True),
+    sa.Column('partnership_opportunities', sa.Text(), nullable=True),
+    sa.Column('recent_news', sa.JSON(), nullable=True),
+    sa.Column('recent_milestones', sa.JSON(), nullable=True),
+    sa.Column('upcoming_events', sa.JSON(), nullable=True),
+    sa.Column('industry_trends', sa.Text(), nullable=True),
+    sa.Column('market_position', sa.Text(), nullable=True),
+    sa.Column('competitive_landscape', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('analysis_date', sa.DateTime(), nullable=True),
+    sa.Column('data_sources', sa.JSON(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('subscriptions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('tier', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('billing_cycle', sa.String(length=20), nullable=True),
+    sa.Column('amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=True),
+    sa.Column('next_billing_date', sa.DateTime(), nullable=False),
+    sa.Column('last_billing_date', sa.DateTime(), nullable=True),
+    sa.Column('profiles_used_this_period', sa.Integer(), nullable=True),
+    sa.Column('profiles_limit', sa.Integer(), nullable=True),
+    sa.Column('reports_used_this_period', sa.Integer(), nullable=True),
+    sa.Column('reports_limit', sa.Integer(), nullable=True),
+    sa.Column('payment_method', sa.String(length=50), nullable=True),
+    sa.Column('payment_status', sa.String(length=20), nullable=True),
+    sa.Column('last_payment_amount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('last_payment_date', sa.DateTime(), nullable=True),
+    sa.Column('is_trial', sa.Boolean(), nullable=True),
+    sa.Column('trial_start_date', sa.DateTime(), nullable=True),
+    sa.Column('trial_end_date', sa.DateTime(), nullable=True),
+    sa.Column('trial_days_remaining', sa.Integer(), nullable=True),
+    sa.Column('cancellation_date', sa.DateTime(), nullable=True),
+    sa.Column('cancellation_reason', sa.Text(), nullable=True),
+    sa.Column('auto_renew', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('conversation_starters',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('business_profile_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('topic', sa.String(length=200), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('context', sa.Text(), nullable=False),
+    sa.Column('suggested_approach', sa.Text(), nullable=True),
+    sa.Column('relevance_score', sa.Integer(), nullable=True),
+    sa.Column('urgency', sa.String(length=20), nullable=True),
+    sa.Column('best_timing', sa.String(length=50), nullable=True),
+    sa.Column('business_milestone', sa.String(length=200), nullable=True),
+    sa.Column('industry_trend', sa.String(length=200), nullable=True),
+    sa.Column('regulatory_change', sa.String(length=200), nullable=True),
+    sa.Column('planning_areas', sa.JSON(), nullable=True),
+    sa.Column('opportunity_value', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('risk_mitigation', sa.Text(), nullable=True),
+    sa.Column('used_count', sa.Integer(), nullable=True),
+    sa.Column('last_used', sa.DateTime(), nullable=True),
+    sa.Column('success_rating', sa.Integer(), nullable=True),
+    sa.Column('feedback', sa.Text(), nullable=True),
+    sa.Column('custom_notes', sa.Text(), nullable=True),
+    sa.Column('tags', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['business_profile_id'], ['business_profiles.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('financial_opportunities',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('business_profile_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('opportunity_type', sa.String(length=100), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('estimated_value', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('value_range', sa.String(length=50), nullable=True),
+    sa.Column('annual_savings', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('one_time_benefit', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('priority', sa.String(length=20), nullable=True),
+    sa.Column('urgency', sa.String(length=20), nullable=True),
+    sa.Column('deadline', sa.DateTime(), nullable=True),
+    sa.Column('complexity', sa.String(length=20), nullable=True),
+    sa.Column('implementation_time', sa.String(length=50), nullable=True),
+    sa.Column('required_resources', sa.JSON(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('progress_percentage', sa.Integer(), nullable=True),
+    sa.Column('business_context', sa.Text(), nullable=True),
+    sa.Column('regulatory_context', sa.Text(), nullable=True),
+    sa.Column('market_context', sa.Text(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('related_opportunities', sa.JSON(), nullable=True),
+    sa.Column('prerequisites', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('identified_date', sa.DateTime(), nullable=True),
+    sa.Column('last_reviewed', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['business_profile_id'], ['business_profiles.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('financial_opportunities')
+    op.drop_table('conversation_starters')
+    op.drop_table('subscriptions')
+    op.drop_table('company_profiles')
+    op.drop_table('company_executives')
+    op.drop_table('business_profiles')
+    op.drop_table('audit_logs')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_industry_reports_industry'), table_name='industry_reports')
+    op.drop_table('industry_reports')
+    op.drop_index(op.f('ix_companies_name'), table_name='companies')
+    op.drop_index(op.f('ix_companies_industry'), table_name='companies')
+    op.drop_table('companies')
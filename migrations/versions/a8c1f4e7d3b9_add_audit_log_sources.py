@@ -0,0 +1,55 @@
+"""Add audit_log_sources
+
+Revision ID: a8c1f4e7d3b9
+Revises: 6e0b5d3f1a72
+Create Date: 2026-10-16 18:11:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c1f4e7d3b9'
+down_revision = '6e0b5d3f1a72'
+branch_labels = None
+depends_on = None
+
+# Backfill written out per dialect so this revision doesn't change when the models do
+BACKFILL_SOURCES = {
+    # Rows logged without sources hold JSON null, which json_array_elements_text rejects
+    'postgresql': """
+        INSERT INTO audit_log_sources (audit_log_id, source)
+        SELECT DISTINCT audit_logs.id, elements.value
+        FROM audit_logs
+        JOIN json_array_elements_text(
+            CASE WHEN json_typeof(audit_logs.data_sources_used) = 'array'
+            THEN audit_logs.data_sources_used ELSE '[]'::json END
+        ) AS elements(value) ON true
+        WHERE elements.value IS NOT NULL
+    """,
+    'sqlite': """
+        INSERT INTO audit_log_sources (audit_log_id, source)
+        SELECT DISTINCT audit_logs.id, elements.value
+        FROM audit_logs
+        JOIN json_each(audit_logs.data_sources_used) AS elements
+        WHERE elements.value IS NOT NULL
+    """
+}
+
+
+def upgrade():
+    op.create_table('audit_log_sources',
+    sa.Column('audit_log_id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('audit_log_id', 'source')
+    )
+    op.create_index('ix_audit_source_log', 'audit_log_sources', ['source', 'audit_log_id'], unique=False)
+
+    # Backfill the sources of every audit log written before the table existed
+    op.execute(sa.text(BACKFILL_SOURCES[op.get_bind().dialect.name]))
+
+
+def downgrade():
+    op.drop_index('ix_audit_source_log', table_name='audit_log_sources')
+    op.drop_table('audit_log_sources')
@@ -0,0 +1,26 @@
+"""Index audit log action types and violations
+
+Revision ID: c3e8b2f6a4d7
+Revises: 7a4f1c8d2e06
+Create Date: 2026-10-16 18:07:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e8b2f6a4d7'
+down_revision = '7a4f1c8d2e06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_audit_action_type', 'audit_logs', ['action_type'], unique=False)
+    op.create_index('ix_audit_violations_created', 'audit_logs', ['created_at'], unique=False, postgresql_where=sa.text("compliance_status = 'violation'"), sqlite_where=sa.text("compliance_status = 'violation'"))
+
+
+def downgrade():
+    op.drop_index('ix_audit_violations_created', table_name='audit_logs', postgresql_where=sa.text("compliance_status = 'violation'"), sqlite_where=sa.text("compliance_status = 'violation'"))
+    op.drop_index('ix_audit_action_type', table_name='audit_logs')
@@ -0,0 +1,36 @@
+"""Add user_stats
+
+Rows are built on first use by UserStats.ensure, so no backfill is needed.
+
+Revision ID: e81d4c6a2f95
+Revises: 5c2e9f0a7b63
+Create Date: 2026-10-16 18:04:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e81d4c6a2f95'
+down_revision = '5c2e9f0a7b63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('profiles_total', sa.Integer(), nullable=False),
+    sa.Column('active_profiles', sa.Integer(), nullable=False),
+    sa.Column('opportunities_total', sa.Integer(), nullable=False),
+    sa.Column('high_priority_opportunities', sa.Integer(), nullable=False),
+    sa.Column('conversation_starters_total', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade():
+    op.drop_table('user_stats')
@@ -0,0 +1,31 @@
+"""Default audit_logs.created_at on the server
+
+Revision ID: f2a6c9e1b8d4
+Revises: 4b7d0e2c9a15
+Create Date: 2026-10-16 18:09:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a6c9e1b8d4'
+down_revision = '4b7d0e2c9a15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Same expressions as models.audit_log.utc_now, pinned here so later model changes don't alter history
+    if op.get_bind().dialect.name == 'postgresql':
+        default = sa.text("(now() AT TIME ZONE 'utc')")
+    else:
+        default = sa.text('CURRENT_TIMESTAMP')
+    with op.batch_alter_table('audit_logs') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=default)
+
+
+def downgrade():
+    with op.batch_alter_table('audit_logs') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=None)
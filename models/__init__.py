@@ -1,14 +1,16 @@
-from flask_sqlalchemy import SQLAlchemy
-db = SQLAlchemy()
-
-from .user import User
+# Every model registers on the instance defined next to User, so the app, create_all and
+# migrations all share one metadata and one session
+from .user import db, User
 from .company import Company, CompanyProfile
 from .business_profile import BusinessProfile
 from .financial_opportunity import FinancialOpportunity
 from .conversation_starter import ConversationStarter
 from .industry_report import IndustryReport
-from .audit_log import AuditLog
+from .audit_log import AuditLog, AuditLogSource, audit_log_writer
 from .subscription import Subscription
+from .research_job import ResearchJob
+from .user_stats import UserStats
+from .compliance_report import ComplianceReport, ComplianceRollupRun
 
 __all__ = [
     'db',
@@ -20,5 +22,11 @@ __all__ = [
     'ConversationStarter',
     'IndustryReport',
     'AuditLog',
-    'Subscription'
+    'AuditLogSource',
+    'audit_log_writer',
+    'Subscription',
+    'ResearchJob',
+    'UserStats',
+    'ComplianceReport',
+    'ComplianceRollupRun'
 ] 
\ No newline at end of file
@@ -1,9 +1,101 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from sqlalchemy import case, event, exists, func, insert, literal_column, select, text, true
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
 from .user import db
+from .dict_cache import cache_to_dict
 
+# Activity summary counter for each action type
+_ACTIVITY_SUMMARY_COUNTERS = {
+    'data_access': 'data_access_count',
+    'profile_created': 'profiles_created',
+    'report_generated': 'reports_generated',
+    'opportunity_identified': 'opportunities_identified',
+    'compliance_violation': 'compliance_violations'
+}
+
+# Compliance report counter for each compliance status
+_COMPLIANCE_REPORT_COUNTERS = {
+    'compliant': 'compliant_actions',
+    'violation': 'violations',
+    'review_needed': 'review_needed'
+}
+
+class utc_now(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database"""
+    type = db.DateTime()
+    inherit_cache = True
+
+@compiles(utc_now)
+def _utc_now_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return 'CURRENT_TIMESTAMP'
+
+@compiles(utc_now, 'postgresql')
+def _utc_now_postgresql(element, compiler, **kw):
+    return "(now() AT TIME ZONE 'utc')"
+
+# Queued entries are stamped by the application clock; allow for skew against the database clock
+_SOURCE_INDEX_MARGIN = timedelta(minutes=1)
+
+def json_array_elements(column, dialect_name):
+    """Table-valued function yielding one `value` row per element of a JSON array column"""
+    if dialect_name == 'postgresql':
+        # Rows logged without sources hold JSON null, which json_array_elements_text rejects
+        array = case((func.json_typeof(column) == 'array', column), else_=literal_column("'[]'::json"))
+        return func.json_array_elements_text(array).table_valued('value')
+    # SQLite yields a single NULL value for JSON null
+    return func.json_each(column).table_valued('value')
+
+# Monthly partitions of audit_logs on PostgreSQL are named audit_logs_y2025m07
+_PARTITION_FORMAT = 'audit_logs_y%Ym%m'
+# Catches rows no monthly partition covers, so inserts keep working if maintenance stops running
+_DEFAULT_PARTITION = 'audit_logs_default'
+
+def _month_start(moment):
+    """First instant of the month containing moment"""
+    return datetime(moment.year, moment.month, 1)
+
+def _next_month(month):
+    """First instant of the month after month"""
+    return datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+def _partition_months(start, end):
+    """Yield (name, lower, upper) for every monthly partition covering start..end"""
+    month = _month_start(start)
+    while month <= end:
+        upper = _next_month(month)
+        yield month.strftime(_PARTITION_FORMAT), month, upper
+        month = upper
+
+@cache_to_dict
 class AuditLog(db.Model):
     """Audit log for compliance and data tracking"""
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Per-user activity windows filter on user and date; id completes the audit log page keyset
+        db.Index('ix_audit_user_created', 'user_id', 'created_at', 'id'),
+        # Compliance reports filter on the date window alone
+        db.Index('ix_audit_created', 'created_at'),
+        db.Index('ix_audit_action_type', 'action_type'),
+        # Violations are rare; a partial index keeps scanning them cheap as the table grows
+        db.Index(
+            'ix_audit_violations_created', 'created_at',
+            postgresql_where=text("compliance_status = 'violation'"),
+            sqlite_where=text("compliance_status = 'violation'")
+        ),
+    )
+    # Fetch the server-stamped created_at with the INSERT so logged entries serialize without a reload
+    __mapper_args__ = {'eager_defaults': True}
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -36,7 +128,8 @@ class AuditLog(db.Model):
     processing_time = db.Column(db.Float)  # seconds
     
     # Metadata
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Stamped by the database; partition key on PostgreSQL
+    created_at = db.Column(db.DateTime, nullable=False, server_default=utc_now())
     session_id = db.Column(db.String(100))
     
     def __repr__(self):
@@ -78,33 +171,63 @@ class AuditLog(db.Model):
             'session_id': self.session_id
         }
     
+    @classmethod
+    def _data_access_entry(cls, user_id, data_sources, access_method, access_url, 
+                          resource_type=None, resource_id=None, ip_address=None, 
+                          user_agent=None, request_method=None, request_url=None):
+        """Build the column values for a data access log entry"""
+        return {
+            'user_id': user_id,
+            'action_type': 'data_access',
+            'action_description': f'Accessed data from {len(data_sources)} sources',
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            'data_sources_used': data_sources,
+            'data_access_method': access_method,
+            'data_access_url': access_url,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'request_method': request_method,
+            'request_url': request_url
+        }
+    
     @classmethod
     def log_data_access(cls, user_id, data_sources, access_method, access_url, 
                        resource_type=None, resource_id=None, ip_address=None, 
                        user_agent=None, request_method=None, request_url=None):
         """Log data access for compliance"""
-        log_entry = cls(
-            user_id=user_id,
-            action_type='data_access',
-            action_description=f'Accessed data from {len(data_sources)} sources',
+        log_entry = cls(**cls._data_access_entry(
+            user_id, data_sources, access_method, access_url,
             resource_type=resource_type,
             resource_id=resource_id,
-            data_sources_used=data_sources,
-            data_access_method=access_method,
-            data_access_url=access_url,
             ip_address=ip_address,
             user_agent=user_agent,
             request_method=request_method,
             request_url=request_url
-        )
+        ))
         
         db.session.add(log_entry)
         db.session.commit()
         return log_entry
     
+    @classmethod
+    def queue_data_access(cls, user_id, data_sources, access_method, access_url, 
+                         resource_type=None, resource_id=None, ip_address=None, 
+                         user_agent=None, request_method=None, request_url=None):
+        """Queue a data access log entry for the background audit log writer"""
+        audit_log_writer.enqueue(cls._data_access_entry(
+            user_id, data_sources, access_method, access_url,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            request_method=request_method,
+            request_url=request_url
+        ))
+    
     @classmethod
     def log_profile_creation(cls, user_id, company_name, data_sources_used, 
-                           ip_address=None, user_agent=None):
+                           ip_address=None, user_agent=None, commit=True):
         """Log business profile creation"""
         log_entry = cls(
             user_id=user_id,
@@ -118,27 +241,44 @@ class AuditLog(db.Model):
         )
         
         db.session.add(log_entry)
-        db.session.commit()
+        if commit:
+            db.session.commit()
         return log_entry
     
+    @classmethod
+    def _report_generation_entry(cls, user_id, report_type, industry, 
+                                data_sources_used, processing_time=None):
+        """Build the column values for a report generation log entry"""
+        return {
+            'user_id': user_id,
+            'action_type': 'report_generated',
+            'action_description': f'Generated {report_type} report for {industry}',
+            'resource_type': 'industry_report',
+            'data_sources_used': data_sources_used,
+            'data_access_method': 'api',
+            'processing_time': processing_time
+        }
+    
     @classmethod
     def log_report_generation(cls, user_id, report_type, industry, 
                             data_sources_used, processing_time=None):
         """Log report generation"""
-        log_entry = cls(
-            user_id=user_id,
-            action_type='report_generated',
-            action_description=f'Generated {report_type} report for {industry}',
-            resource_type='industry_report',
-            data_sources_used=data_sources_used,
-            data_access_method='api',
-            processing_time=processing_time
-        )
+        log_entry = cls(**cls._report_generation_entry(
+            user_id, report_type, industry, data_sources_used, processing_time=processing_time
+        ))
         
         db.session.add(log_entry)
         db.session.commit()
         return log_entry
     
+    @classmethod
+    def queue_report_generation(cls, user_id, report_type, industry, 
+                              data_sources_used, processing_time=None):
+        """Queue a report generation log entry for the background audit log writer"""
+        audit_log_writer.enqueue(cls._report_generation_entry(
+            user_id, report_type, industry, data_sources_used, processing_time=processing_time
+        ))
+    
     @classmethod
     def log_opportunity_identification(cls, user_id, opportunity_type, company_name,
                                      data_sources_used, estimated_value=None):
@@ -186,84 +326,74 @@ class AuditLog(db.Model):
         
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        activities = cls.query.filter(
-            cls.user_id == user_id,
-            cls.created_at >= cutoff_date
-        ).all()
+        in_window = (cls.user_id == user_id, cls.created_at >= cutoff_date)
+        
+        # Count and date each action type in SQL rather than loading every row
+        counts = db.session.query(
+            cls.action_type, func.count(cls.id), func.max(cls.created_at)
+        ).filter(*in_window).group_by(cls.action_type).all()
         
         summary = {
-            'total_actions': len(activities),
+            'total_actions': 0,
             'data_access_count': 0,
             'profiles_created': 0,
             'reports_generated': 0,
             'opportunities_identified': 0,
             'compliance_violations': 0,
-            'data_sources_accessed': set(),
+            'data_sources_accessed': [],
             'last_activity': None
         }
         
-        for activity in activities:
-            if activity.action_type == 'data_access':
-                summary['data_access_count'] += 1
-            elif activity.action_type == 'profile_created':
-                summary['profiles_created'] += 1
-            elif activity.action_type == 'report_generated':
-                summary['reports_generated'] += 1
-            elif activity.action_type == 'opportunity_identified':
-                summary['opportunities_identified'] += 1
-            elif activity.action_type == 'compliance_violation':
-                summary['compliance_violations'] += 1
+        for action_type, count, last_created_at in counts:
+            summary['total_actions'] += count
+            counter = _ACTIVITY_SUMMARY_COUNTERS.get(action_type)
+            if counter:
+                summary[counter] += count
             
-            if activity.data_sources_used:
-                summary['data_sources_accessed'].update(activity.data_sources_used)
-            
-            if not summary['last_activity'] or activity.created_at > summary['last_activity']:
-                summary['last_activity'] = activity.created_at
+            if last_created_at and (not summary['last_activity'] or last_created_at > summary['last_activity']):
+                summary['last_activity'] = last_created_at
         
-        summary['data_sources_accessed'] = list(summary['data_sources_accessed'])
+        summary['data_sources_accessed'] = AuditLogSource.distinct_sources(*in_window)
         return summary
     
     @classmethod
     def get_compliance_report(cls, start_date=None, end_date=None):
         """Generate compliance report"""
-        query = cls.query
+        window = []
         
         if start_date:
-            query = query.filter(cls.created_at >= start_date)
+            window.append(cls.created_at >= start_date)
         
         if end_date:
-            query = query.filter(cls.created_at <= end_date)
+            window.append(cls.created_at <= end_date)
         
-        logs = query.all()
+        # Count every status / impact / action type combination in one grouped query
+        counts = db.session.query(
+            cls.compliance_status, cls.privacy_impact, cls.action_type, func.count(cls.id)
+        ).filter(*window).group_by(cls.compliance_status, cls.privacy_impact, cls.action_type).all()
         
         report = {
-            'total_actions': len(logs),
+            'total_actions': 0,
             'compliant_actions': 0,
             'violations': 0,
             'review_needed': 0,
-            'data_sources_used': set(),
+            'data_sources_used': [],
             'privacy_impact_summary': {'low': 0, 'medium': 0, 'high': 0},
             'action_type_summary': {}
         }
         
-        for log in logs:
-            if log.compliance_status == 'compliant':
-                report['compliant_actions'] += 1
-            elif log.compliance_status == 'violation':
-                report['violations'] += 1
-            elif log.compliance_status == 'review_needed':
-                report['review_needed'] += 1
-            
-            if log.data_sources_used:
-                report['data_sources_used'].update(log.data_sources_used)
+        for compliance_status, privacy_impact, action_type, count in counts:
+            report['total_actions'] += count
+            counter = _COMPLIANCE_REPORT_COUNTERS.get(compliance_status)
+            if counter:
+                report[counter] += count
             
-            if log.privacy_impact:
-                report['privacy_impact_summary'][log.privacy_impact] += 1
+            if privacy_impact:
+                report['privacy_impact_summary'][privacy_impact] += count
             
-            action_type = log.action_type
-            report['action_type_summary'][action_type] = report['action_type_summary'].get(action_type, 0) + 1
+            report['action_type_summary'][action_type] = report['action_type_summary'].get(action_type, 0) + count
         
-        report['data_sources_used'] = list(report['data_sources_used'])
+        report['data_sources_used'] = AuditLogSource.distinct_sources(*window)
         return report
     
     def mark_for_review(self, reason):
@@ -289,4 +419,308 @@ class AuditLog(db.Model):
         if self.action_type == 'data_access':
             return True
         
-        return False 
\ No newline at end of file
+        return False
+    
+    @classmethod
+    def _is_partitioned(cls, connection):
+        """Whether audit_logs is a range-partitioned PostgreSQL table"""
+        if connection.dialect.name != 'postgresql':
+            return False
+        
+        return connection.execute(text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"
+        ), {'table': cls.__tablename__}).first() is not None
+    
+    @classmethod
+    def partition_table(cls, connection, months_ahead=2):
+        """Convert audit_logs into a table partitioned by month on created_at (PostgreSQL only)
+        
+        Run once, during a maintenance window; existing rows are copied into the new partitions.
+        """
+        if connection.dialect.name != 'postgresql' or cls._is_partitioned(connection):
+            return False
+        
+        # Index names are schema-wide, so the old table's indexes go before the new ones are built
+        quote = connection.dialect.identifier_preparer.quote
+        for index in cls.__table__.indexes:
+            connection.execute(text(f'DROP INDEX IF EXISTS {quote(index.name)}'))
+        
+        connection.execute(text('ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned'))
+        connection.execute(text('''
+            CREATE TABLE audit_logs (LIKE audit_logs_unpartitioned INCLUDING DEFAULTS)
+            PARTITION BY RANGE (created_at)
+        '''))
+        # A partitioned table's primary key must include the partition key
+        connection.execute(text('ALTER TABLE audit_logs ADD PRIMARY KEY (id, created_at)'))
+        connection.execute(text('ALTER TABLE audit_logs ADD FOREIGN KEY (user_id) REFERENCES users (id)'))
+        # Keep the id sequence when the old table is dropped
+        connection.execute(text(
+            "ALTER SEQUENCE IF EXISTS audit_logs_id_seq OWNED BY audit_logs.id"
+        ))
+        
+        oldest = connection.execute(text('SELECT min(created_at) FROM audit_logs_unpartitioned')).scalar()
+        cls.ensure_partitions(connection, months_ahead=months_ahead, start=oldest)
+        
+        connection.execute(text('INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned'))
+        connection.execute(text('DROP TABLE audit_logs_unpartitioned'))
+        
+        # Indexes declared on the parent are created on every partition
+        for index in cls.__table__.indexes:
+            index.create(connection)
+        
+        return True
+    
+    @classmethod
+    def ensure_partitions(cls, connection, months_ahead=2, start=None):
+        """Create the default partition and monthly ones from start (default: this month) through months_ahead months"""
+        if not cls._is_partitioned(connection):
+            return []
+        
+        quote = connection.dialect.identifier_preparer.quote
+        created = []
+        if connection.execute(text('SELECT to_regclass(:name)'), {'name': _DEFAULT_PARTITION}).scalar() is None:
+            connection.execute(text(
+                f'CREATE TABLE {quote(_DEFAULT_PARTITION)} PARTITION OF {quote(cls.__tablename__)} DEFAULT'
+            ))
+            created.append(_DEFAULT_PARTITION)
+        
+        now = datetime.utcnow()
+        end = now
+        for _ in range(months_ahead):
+            end = _next_month(_month_start(end))
+        
+        for name, lower, upper in _partition_months(start or now, end):
+            result = connection.execute(text('SELECT to_regclass(:name)'), {'name': name}).scalar()
+            if result is None:
+                cls._create_partition(connection, name, lower, upper)
+                created.append(name)
+        
+        return created
+    
+    @classmethod
+    def _create_partition(cls, connection, name, lower, upper):
+        """Create one monthly partition, moving in any rows the default partition caught for that month"""
+        quote = connection.dialect.identifier_preparer.quote
+        table, default = quote(cls.__tablename__), quote(_DEFAULT_PARTITION)
+        bounds = {'lower': lower, 'upper': upper}
+        in_month = 'created_at >= :lower AND created_at < :upper'
+        
+        # PostgreSQL refuses a new partition while the default one holds rows in its range
+        stray = connection.execute(
+            text(f'SELECT 1 FROM {default} WHERE {in_month} LIMIT 1'), bounds
+        ).first() is not None
+        if stray:
+            connection.execute(text(f'ALTER TABLE {table} DETACH PARTITION {default}'))
+        
+        connection.execute(text(
+            f"CREATE TABLE {quote(name)} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        ))
+        
+        if stray:
+            connection.execute(text(f'INSERT INTO {table} SELECT * FROM {default} WHERE {in_month}'), bounds)
+            connection.execute(text(f'DELETE FROM {default} WHERE {in_month}'), bounds)
+            connection.execute(text(f'ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT'))
+    
+    @classmethod
+    def archive_partitions(cls, connection, hot_days=90, tablespace=None):
+        """Move monthly partitions older than hot_days to a cheaper tablespace
+        
+        Partitions stay attached, so archived months are still queried, exported and summarized.
+        Nothing happens unless a tablespace is configured.
+        """
+        if not tablespace or not cls._is_partitioned(connection):
+            return []
+        
+        cutoff = datetime.utcnow() - timedelta(days=hot_days)
+        partitions = connection.execute(text('''
+            SELECT child.relname FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(:table)
+            AND child.reltablespace IS DISTINCT FROM (SELECT oid FROM pg_tablespace WHERE spcname = :tablespace)
+        '''), {'table': cls.__tablename__, 'tablespace': tablespace}).scalars()
+        
+        quote = connection.dialect.identifier_preparer.quote
+        archived = []
+        for name in sorted(partitions):
+            try:
+                upper = _next_month(datetime.strptime(name, _PARTITION_FORMAT))
+            except ValueError:
+                continue  # not one of the monthly partitions
+            
+            if upper <= cutoff:
+                connection.execute(text(f'ALTER TABLE {quote(name)} SET TABLESPACE {quote(tablespace)}'))
+                archived.append(name)
+        
+        return archived
+
+class AuditLogSource(db.Model):
+    """One row per data source an audit log entry used, so source filters are index lookups rather than JSON scans"""
+    __tablename__ = 'audit_log_sources'
+    __table_args__ = (
+        db.Index('ix_audit_source_log', 'source', 'audit_log_id'),
+    )
+    
+    # No foreign key: audit_logs' primary key becomes (id, created_at) once partitioned on PostgreSQL
+    audit_log_id = db.Column(db.Integer, primary_key=True)
+    source = db.Column(db.String(100), primary_key=True)
+    
+    def __repr__(self):
+        return f'<AuditLogSource {self.source} for {self.audit_log_id}>'
+    
+    @classmethod
+    def distinct_sources(cls, *criteria):
+        """Sources used by audit logs matching the criteria, fetched without the JSON column"""
+        return [source for (source,) in db.session.query(cls.source).join(
+            AuditLog, AuditLog.id == cls.audit_log_id
+        ).filter(*criteria).distinct()]
+    
+    @classmethod
+    def index_logs(cls, connection, since=None):
+        """Add source rows for audit logs created since `since` that have none yet; pass no date to backfill"""
+        elements = json_array_elements(AuditLog.data_sources_used, connection.dialect.name)
+        logs = select(AuditLog.id, elements.c.value).select_from(AuditLog).join(elements, true()).where(
+            elements.c.value.isnot(None),
+            ~exists().where(cls.audit_log_id == AuditLog.id)
+        ).distinct()
+        if since is not None:
+            logs = logs.where(AuditLog.created_at >= since)
+        
+        connection.execute(insert(cls).from_select(['audit_log_id', 'source'], logs))
+
+@event.listens_for(AuditLog, 'after_insert')
+def _index_log_sources(mapper, connection, target):
+    """Record the sources of an entry added through the session in the same transaction"""
+    sources = set(target.data_sources_used or ())
+    if sources:
+        connection.execute(
+            AuditLogSource.__table__.insert(),
+            [{'audit_log_id': target.id, 'source': source} for source in sources]
+        )
+
+class AuditLogWriter:
+    """Writes queued audit log entries in batches from a background thread"""
+    
+    def __init__(self, batch_size=100, flush_interval=0.1, max_queue_size=10000, max_retries=3):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval  # seconds to wait for a batch to fill
+        self.max_retries = max_retries  # attempts per batch when the database is unreachable
+        self.app = None
+        self.logger = logging.getLogger(__name__)
+        # Entries that could not be written at all, logged as JSON so they can be replayed
+        self.dead_letter = logging.getLogger(f'{__name__}.dead_letter')
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+    
+    def init_app(self, app):
+        """Bind the writer to an application and start the writer thread"""
+        self.app = app
+        
+        if self._thread is None:
+            self._start()
+            # Forked workers (Gunicorn preload, Celery prefork) inherit the writer but not its thread
+            os.register_at_fork(after_in_child=self._start)
+            # Write whatever is still queued when the process exits
+            atexit.register(self.flush)
+    
+    def _start(self):
+        """Start the thread that drains the queue"""
+        self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+        self._thread.start()
+    
+    def enqueue(self, entry):
+        """Queue a dictionary of AuditLog column values to be written"""
+        # Stamp the entry now so it records when the action happened, not when it was written
+        entry.setdefault('created_at', datetime.utcnow())
+        
+        if self.app is None:
+            # No writer thread outside the application; write now on a session of our own so the
+            # caller's pending changes are neither committed nor rolled back with the entry
+            with Session(db.engine) as session:
+                self._write_rows(session, [entry])
+            return
+        
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            # The writer is falling behind; apply backpressure rather than drop an audit record
+            self.logger.warning("Audit log queue is full, writing entry synchronously")
+            self._write_batch([entry])
+    
+    def flush(self):
+        """Write every queued entry now, in batches, from the calling thread"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch)
+                batch = []
+        
+        if batch:
+            self._write_batch(batch)
+    
+    def _run(self):
+        """Drain the queue, writing up to batch_size entries per INSERT"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            self._write_batch(batch)
+    
+    def _index_sources(self, batch):
+        """Index the data sources of a just-inserted batch; bulk inserts don't return the new ids"""
+        if not any(entry.get('data_sources_used') for entry in batch):
+            return
+        
+        created = [entry['created_at'] for entry in batch if entry.get('created_at')]
+        since = min(created, default=datetime.utcnow()) - _SOURCE_INDEX_MARGIN
+        AuditLogSource.index_logs(db.session.connection(), since=since)
+    
+    def _write_rows(self, session, entries):
+        """Write entries one transaction each; an entry that still fails goes to the dead-letter log"""
+        for entry in entries:
+            try:
+                session.add(AuditLog(**entry))
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                self.logger.error("Error writing audit log entry: %s", e)
+                self.dead_letter.error("%s", json.dumps(entry, default=str))
+    
+    def _write_batch(self, batch):
+        """Insert a batch of audit log entries in one transaction, retrying dropped connections"""
+        with self.app.app_context():
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    db.session.bulk_insert_mappings(AuditLog, batch)
+                    self._index_sources(batch)
+                    db.session.commit()
+                    return
+                except OperationalError as e:
+                    db.session.rollback()
+                    if attempt == self.max_retries:
+                        self.logger.error("Error writing %s audit log entries: %s", len(batch), e)
+                        break
+                    time.sleep(0.5 * 2 ** (attempt - 1))
+                except Exception as e:
+                    db.session.rollback()
+                    self.logger.error("Error writing %s audit log entries: %s", len(batch), e)
+                    break
+            
+            # Write the batch row by row so one bad entry doesn't lose the rest
+            self._write_rows(db.session, batch)
+
+audit_log_writer = AuditLogWriter()
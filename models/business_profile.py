@@ -1,9 +1,27 @@
 from datetime import datetime, timedelta
+import calendar
 from .user import db
+from .dict_cache import cache_to_dict
 
+def _epoch_seconds(moment):
+    """Seconds since the epoch, reading naive datetimes as UTC"""
+    return calendar.timegm(moment.utctimetuple())
+
+def _development_ts(development):
+    """Epoch seconds of a development's ISO date, 0 when it has none"""
+    try:
+        return _epoch_seconds(datetime.fromisoformat(development['date'].replace('Z', '+00:00')))
+    except (KeyError, TypeError, AttributeError, ValueError):
+        return 0
+
+@cache_to_dict
 class BusinessProfile(db.Model):
     """Business profile for financial planning intelligence"""
     __tablename__ = 'business_profiles'
+    __table_args__ = (
+        # Dashboard counts per user and status come straight from the index
+        db.Index('ix_bp_user_status', 'user_id', 'status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -92,34 +110,43 @@ class BusinessProfile(db.Model):
     
     def add_opportunity(self, opportunity_type, description, estimated_value=None, priority='medium'):
         """Add a financial planning opportunity"""
-        if not self.opportunities_identified:
-            self.opportunities_identified = []
-        
-        opportunity = {
+        self.add_opportunities_bulk([{
             'type': opportunity_type,
             'description': description,
             'estimated_value': estimated_value,
-            'priority': priority,
-            'created_at': datetime.utcnow().isoformat()
-        }
+            'priority': priority
+        }])
+    
+    def add_opportunities_bulk(self, opportunities, commit=True):
+        """Add several financial planning opportunities with a single row update"""
+        created_at = datetime.utcnow().isoformat()
+        # Assign a new list so the JSON column is marked changed and the cached dictionary is dropped
+        self.opportunities_identified = [
+            *(self.opportunities_identified or []),
+            *({**opportunity, 'created_at': opportunity.get('created_at', created_at)} for opportunity in opportunities)
+        ]
         
-        self.opportunities_identified.append(opportunity)
-        db.session.commit()
+        if commit:
+            db.session.commit()
     
     def add_conversation_starter(self, topic, context, suggested_approach):
         """Add a conversation starter"""
-        if not self.conversation_starters:
-            self.conversation_starters = []
-        
-        starter = {
+        self.add_conversation_starters_bulk([{
             'topic': topic,
             'context': context,
-            'suggested_approach': suggested_approach,
-            'created_at': datetime.utcnow().isoformat()
-        }
+            'suggested_approach': suggested_approach
+        }])
+    
+    def add_conversation_starters_bulk(self, starters, commit=True):
+        """Add several conversation starters with a single row update"""
+        created_at = datetime.utcnow().isoformat()
+        self.conversation_starters = [
+            *(self.conversation_starters or []),
+            *({**starter, 'created_at': starter.get('created_at', created_at)} for starter in starters)
+        ]
         
-        self.conversation_starters.append(starter)
-        db.session.commit()
+        if commit:
+            db.session.commit()
     
     def update_relationship_stage(self, new_stage, notes=None):
         """Update relationship stage"""
@@ -138,23 +165,31 @@ class BusinessProfile(db.Model):
         db.session.commit()
     
     def get_priority_opportunities(self):
-        """Get high-priority opportunities"""
-        if not self.opportunities_identified:
+        """Get high-priority opportunities; the returned list is shared, so copy it before mutating"""
+        opportunities = self.opportunities_identified
+        if not opportunities:
             return []
         
-        return [opp for opp in self.opportunities_identified if opp.get('priority') in ['high', 'critical']]
+        # Additions assign a new list, so the filtered list is reused until the column is replaced or reloaded
+        cached = self.__dict__.get('_priority_opportunities')
+        if cached is None or cached[0] is not opportunities:
+            priority = [opp for opp in opportunities if opp.get('priority') in ('high', 'critical')]
+            cached = self.__dict__['_priority_opportunities'] = (opportunities, priority)
+        
+        return cached[1]
     
     def get_recent_developments(self, days=30):
         """Get recent developments within specified days"""
-        if not self.recent_developments:
+        developments = self.recent_developments
+        if not developments:
             return []
         
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        recent = []
-        
-        for dev in self.recent_developments:
-            dev_date = datetime.fromisoformat(dev.get('date', ''))
-            if dev_date >= cutoff_date:
-                recent.append(dev)
+        # Dates are parsed to epoch seconds once per list and kept off the stored JSON
+        cached = self.__dict__.get('_development_timestamps')
+        if cached is None or cached[0] is not developments:
+            cached = self.__dict__['_development_timestamps'] = (
+                developments, [_development_ts(dev) for dev in developments]
+            )
         
-        return recent 
\ No newline at end of file
+        cutoff_ts = _epoch_seconds(datetime.utcnow() - timedelta(days=days))
+        return [dev for dev, ts in zip(developments, cached[1]) if ts >= cutoff_ts]
\ No newline at end of file
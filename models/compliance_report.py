@@ -0,0 +1,134 @@
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import func
+from .user import db
+from .audit_log import AuditLog, AuditLogSource
+
+# Days of activity covered by a compliance report, and by the nightly backfill
+REPORT_DAYS = 30
+
+def _as_date(value):
+    """date(created_at) comes back as a date on PostgreSQL and as a string on SQLite"""
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+class ComplianceRollupRun(db.Model):
+    """One row per UTC day the nightly task has rolled up, whether or not anyone was active"""
+    __tablename__ = 'compliance_rollup_runs'
+    
+    report_date = db.Column(db.Date, primary_key=True)
+    users = db.Column(db.Integer, nullable=False, default=0)
+    completed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ComplianceRollupRun {self.report_date}>'
+
+class ComplianceReport(db.Model):
+    """Audit log activity of one user on one completed UTC day, rolled up by the nightly task"""
+    __tablename__ = 'compliance_reports'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    report_date = db.Column(db.Date, primary_key=True)
+    
+    # Counts
+    total_activities = db.Column(db.Integer, nullable=False, default=0)
+    access_method_usage = db.Column(db.JSON)
+    data_source_usage = db.Column(db.JSON)
+    
+    # Metadata
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ComplianceReport {self.user_id} {self.report_date}>'
+    
+    def to_usage(self):
+        """Counts in the shape returned by count_activity"""
+        return {
+            'total_activities': self.total_activities,
+            'access_method_usage': self.access_method_usage or {},
+            'data_source_usage': self.data_source_usage or {}
+        }
+    
+    @staticmethod
+    def count_activity(start, end, user_id=None):
+        """Count audit logs from start up to end per (user_id, day), grouped in SQL"""
+        criteria = [AuditLog.created_at >= start, AuditLog.created_at < end]
+        if user_id is not None:
+            criteria.append(AuditLog.user_id == user_id)
+        day = func.date(AuditLog.created_at)
+        
+        activity = {}
+        def usage(log_user_id, log_day):
+            return activity.setdefault((log_user_id, _as_date(log_day)), {
+                'total_activities': 0, 'access_method_usage': {}, 'data_source_usage': {}
+            })
+        
+        methods = db.session.query(AuditLog.user_id, day, AuditLog.data_access_method, func.count()).filter(
+            *criteria
+        ).group_by(AuditLog.user_id, day, AuditLog.data_access_method)
+        for log_user_id, log_day, method, count in methods:
+            entry = usage(log_user_id, log_day)
+            entry['total_activities'] += count
+            # Stored rollups are JSON objects, which read a None key back as 'null'
+            entry['access_method_usage']['null' if method is None else method] = count
+        
+        sources = db.session.query(AuditLog.user_id, day, AuditLogSource.source, func.count()).join(
+            AuditLogSource, AuditLogSource.audit_log_id == AuditLog.id
+        ).filter(*criteria).group_by(AuditLog.user_id, day, AuditLogSource.source)
+        for log_user_id, log_day, source, count in sources:
+            usage(log_user_id, log_day)['data_source_usage'][source] = count
+        
+        return activity
+    
+    @classmethod
+    def rolled_up_through(cls):
+        """Last day the nightly rollup has completed, or None before its first run"""
+        return db.session.query(func.max(ComplianceRollupRun.report_date)).scalar()
+    
+    @classmethod
+    def roll_up_day(cls, day, commit=True):
+        """Store every user's counts for one UTC day, replacing any earlier rollup of it"""
+        start = datetime.combine(day, time.min)
+        activity = cls.count_activity(start, start + timedelta(days=1))
+        
+        db.session.query(cls).filter(cls.report_date == day).delete(synchronize_session=False)
+        db.session.add_all(
+            cls(user_id=user_id, report_date=log_day, **usage) for (user_id, log_day), usage in activity.items()
+        )
+        # Recorded even when nobody was active, so quiet days aren't rolled up again
+        db.session.merge(ComplianceRollupRun(report_date=day, users=len(activity), completed_at=datetime.utcnow()))
+        
+        if commit:
+            db.session.commit()
+        return len(activity)
+    
+    @classmethod
+    def usage_between(cls, user_id, start_day, end):
+        """Per-day counts for a user from start_day up to end: stored days from rollups, later ones live"""
+        live_from = start_day
+        activity = {}
+        
+        through = cls.rolled_up_through()
+        if through is not None and through >= start_day:
+            reports = cls.query.filter(
+                cls.user_id == user_id, cls.report_date >= start_day, cls.report_date <= through
+            )
+            activity = {report.report_date: report.to_usage() for report in reports}
+            live_from = through + timedelta(days=1)
+        
+        live = cls.count_activity(datetime.combine(live_from, time.min), end, user_id)
+        activity.update((log_day, usage) for (_, log_day), usage in live.items())
+        return activity
+    
+    @staticmethod
+    def summarize(activity):
+        """Fold per-day counts into daily, access method and data source totals"""
+        daily_activity = {}
+        access_method_usage = Counter()
+        data_source_usage = Counter()
+        for log_day in sorted(activity):
+            usage = activity[log_day]
+            daily_activity[log_day.isoformat()] = usage['total_activities']
+            access_method_usage.update(usage['access_method_usage'])
+            data_source_usage.update(usage['data_source_usage'])
+        
+        return daily_activity, dict(access_method_usage), dict(data_source_usage)
\ No newline at end of file
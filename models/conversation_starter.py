@@ -1,6 +1,17 @@
 from datetime import datetime
+from sqlalchemy import and_, case, func, update
+from sqlalchemy.ext.hybrid import hybrid_property
 from .user import db
+from .dict_cache import cache_to_dict
 
+# Priority score contributed by each urgency level
+_URGENCY_SCORES = {
+    'low': 1,
+    'medium': 2,
+    'high': 3
+}
+
+@cache_to_dict
 class ConversationStarter(db.Model):
     """Conversation starters and insights for financial advisors"""
     __tablename__ = 'conversation_starters'
@@ -88,7 +99,7 @@ class ConversationStarter(db.Model):
             'expires_at': self.expires_at.isoformat() if self.expires_at else None
         }
     
-    def mark_as_used(self, success_rating=None, feedback=None):
+    def mark_as_used(self, success_rating=None, feedback=None, commit=True):
         """Mark conversation starter as used"""
         self.used_count += 1
         self.last_used = datetime.utcnow()
@@ -100,7 +111,31 @@ class ConversationStarter(db.Model):
             self.feedback = feedback
         
         self.updated_at = datetime.utcnow()
-        db.session.commit()
+        if commit:
+            db.session.commit()
+    
+    @classmethod
+    def bulk_mark_used(cls, starter_ids, success_rating=None, commit=True):
+        """Mark many conversation starters as used with one UPDATE, incrementing use counts in the database"""
+        now = datetime.utcnow()
+        values = {'used_count': cls.used_count + 1, 'last_used': now, 'updated_at': now}
+        if success_rating is not None:
+            values['success_rating'] = success_rating
+        
+        starter_ids = set(starter_ids)
+        result = db.session.execute(
+            update(cls).where(cls.id.in_(starter_ids)).values(**values),
+            execution_options={'synchronize_session': False}
+        )
+        
+        # Sessions keep objects after commit, so reload the changed columns of any starters already loaded
+        for starter in list(db.session.identity_map.values()):
+            if isinstance(starter, cls) and starter.id in starter_ids:
+                db.session.expire(starter, list(values))
+        
+        if commit:
+            db.session.commit()
+        return result.rowcount
     
     def is_relevant(self):
         """Check if conversation starter is still relevant"""
@@ -113,40 +148,60 @@ class ConversationStarter(db.Model):
         
         return True
     
-    def get_effectiveness_score(self):
-        """Calculate effectiveness score based on usage and ratings"""
-        if self.used_count == 0:
+    @hybrid_property
+    def effectiveness_score(self):
+        """Effectiveness score based on usage and ratings; also usable as a SQL expression"""
+        used_count = self.used_count
+        if used_count == 0:
             return 0
         
         # Base score from success rating
-        base_score = self.success_rating or 3
+        success_rating = self.success_rating
+        base_score = success_rating or 3
         
         # Bonus for multiple successful uses
-        if self.used_count > 1 and self.success_rating and self.success_rating >= 4:
+        if used_count > 1 and success_rating and success_rating >= 4:
             base_score += 1
         
         return min(base_score, 5)
     
-    def get_priority_score(self):
-        """Calculate priority score for sorting"""
-        priority_scores = {
-            'low': 1,
-            'medium': 2,
-            'high': 3
-        }
-        
-        base_score = priority_scores.get(self.urgency, 1)
+    @effectiveness_score.expression
+    def effectiveness_score(cls):
+        base_score = func.coalesce(cls.success_rating, 3) + case(
+            (and_(cls.used_count > 1, cls.success_rating >= 4), 1), else_=0
+        )
+        return case((cls.used_count == 0, 0), (base_score > 5, 5), else_=base_score)
+    
+    def get_effectiveness_score(self):
+        """Calculate effectiveness score based on usage and ratings"""
+        return self.effectiveness_score
+    
+    @hybrid_property
+    def priority_score(self):
+        """Priority score for sorting; also usable as a SQL expression so lists can sort in the database"""
+        base_score = _URGENCY_SCORES.get(self.urgency, 1)
         
         # Add relevance score
-        if self.relevance_score:
-            base_score += self.relevance_score / 10
+        relevance_score = self.relevance_score
+        if relevance_score:
+            base_score += relevance_score / 10
         
         # Add effectiveness bonus
-        base_score += self.get_effectiveness_score() / 10
-        
-        return base_score
+        return base_score + self.effectiveness_score / 10
+    
+    @priority_score.expression
+    def priority_score(cls):
+        return (
+            case(_URGENCY_SCORES, value=cls.urgency, else_=1)
+            + func.coalesce(cls.relevance_score, 0) / 10.0
+            + cls.effectiveness_score / 10.0
+        )
     
-    def update_relevance(self, new_score, new_urgency=None):
+    def get_priority_score(self):
+        """Calculate priority score for sorting"""
+        return self.priority_score
+    
+    def update_relevance(self, new_score, new_urgency=None, commit=True):
         """Update relevance score and urgency"""
         self.relevance_score = new_score
         
@@ -154,22 +209,25 @@ class ConversationStarter(db.Model):
             self.urgency = new_urgency
         
         self.updated_at = datetime.utcnow()
-        db.session.commit()
+        if commit:
+            db.session.commit()
     
-    def add_tag(self, tag):
+    def add_tag(self, tag, commit=True):
         """Add a tag to the conversation starter"""
-        if not self.tags:
-            self.tags = []
+        tags = self.tags or []
         
-        if tag not in self.tags:
-            self.tags.append(tag)
-            db.session.commit()
+        if tag not in tags:
+            # Assign a new list so the JSON column is marked changed
+            self.tags = [*tags, tag]
+            if commit:
+                db.session.commit()
     
-    def remove_tag(self, tag):
+    def remove_tag(self, tag, commit=True):
         """Remove a tag from the conversation starter"""
         if self.tags and tag in self.tags:
-            self.tags.remove(tag)
-            db.session.commit()
+            self.tags = [existing for existing in self.tags if existing != tag]
+            if commit:
+                db.session.commit()
     
     def get_suggested_script(self):
         """Generate a suggested conversation script"""
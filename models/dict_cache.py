@@ -0,0 +1,38 @@
+from sqlalchemy import event
+
+_CACHE_KEY = '_to_dict_cache'
+
+def _forget(target, *args):
+    """Drop an instance's cached dictionary"""
+    target.__dict__.pop(_CACHE_KEY, None)
+
+def _forget_after_flush(mapper, connection, target):
+    """Drop the cached dictionary once the flush has filled in ids and defaults"""
+    _forget(target)
+
+def cache_to_dict(model):
+    """Class decorator: add to_cached_dict(), reusing a model's to_dict() result until one of its columns changes
+    
+    to_dict() still builds a new dictionary on every call. The cached one is shared between callers,
+    so only call sites that serialize it without changing anything should use to_cached_dict().
+    """
+    build = model.to_dict
+    
+    def to_cached_dict(self):
+        """to_dict() result shared until the row changes; serialize it, never mutate it"""
+        cached = self.__dict__.get(_CACHE_KEY)
+        if cached is None:
+            cached = self.__dict__[_CACHE_KEY] = build(self)
+        return cached
+    
+    model.to_cached_dict = to_cached_dict
+    
+    # Mapped attributes share their column names in these models
+    for column in model.__table__.columns:
+        event.listen(getattr(model, column.key), 'set', _forget)
+    for identifier in ('expire', 'refresh'):
+        event.listen(model, identifier, _forget)
+    for identifier in ('after_insert', 'after_update'):
+        event.listen(model, identifier, _forget_after_flush)
+    
+    return model
\ No newline at end of file
@@ -1,13 +1,35 @@
 from datetime import datetime, timedelta
+from operator import attrgetter
 from .user import db
 
+# Columns serialized by to_dict, in the order dict_from_values unpacks them
+_TO_DICT_FIELDS = (
+    'id', 'business_profile_id', 'user_id', 'company_id', 'opportunity_type', 'category', 'title', 'description',
+    'estimated_value', 'value_range', 'annual_savings', 'one_time_benefit',
+    'priority', 'urgency', 'deadline', 'complexity', 'implementation_time', 'required_resources',
+    'status', 'progress_percentage', 'business_context', 'regulatory_context', 'market_context', 'notes',
+    'related_opportunities', 'prerequisites',
+    'created_at', 'updated_at', 'identified_date', 'last_reviewed'
+)
+
+# Read every serialized column in one C-level call instead of attribute by attribute
+_TO_DICT_ATTRS = attrgetter(*_TO_DICT_FIELDS)
+
 class FinancialOpportunity(db.Model):
     """Financial planning opportunities identified for businesses"""
     __tablename__ = 'financial_opportunities'
+    __table_args__ = (
+        # Serve the per-company listings (priority, then newest first) straight from the index
+        db.Index('ix_fo_company_priority_created', 'company_id', 'priority', 'created_at'),
+        db.Index('ix_fo_company_created', 'company_id', 'created_at'),
+        # Dashboard counts per user and priority come straight from the index
+        db.Index('ix_fo_user_priority', 'user_id', 'priority'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     business_profile_id = db.Column(db.Integer, db.ForeignKey('business_profiles.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'))
     
     # Opportunity details
     opportunity_type = db.Column(db.String(100), nullable=False)  # e.g., "Business Succession Planning"
@@ -54,50 +76,68 @@ class FinancialOpportunity(db.Model):
     def __repr__(self):
         return f'<FinancialOpportunity {self.title}>'
     
+    @classmethod
+    def serialized_columns(cls):
+        """Columns read by to_dict, for queries that skip loading full instances"""
+        return tuple(getattr(cls, field) for field in _TO_DICT_FIELDS)
+    
     def to_dict(self):
         """Convert opportunity to dictionary"""
+        return self.dict_from_values(_TO_DICT_ATTRS(self))
+    
+    @staticmethod
+    def dict_from_values(values):
+        """Build the to_dict structure from column values in serialized_columns order"""
+        (id_, business_profile_id, user_id, company_id, opportunity_type, category, title, description,
+         estimated_value, value_range, annual_savings, one_time_benefit,
+         priority, urgency, deadline, complexity, implementation_time, required_resources,
+         status, progress_percentage, business_context, regulatory_context, market_context, notes,
+         related_opportunities, prerequisites,
+         created_at, updated_at, identified_date, last_reviewed) = values
+        
         return {
-            'id': self.id,
-            'business_profile_id': self.business_profile_id,
-            'user_id': self.user_id,
-            'opportunity_type': self.opportunity_type,
-            'category': self.category,
-            'title': self.title,
-            'description': self.description,
+            'id': id_,
+            'business_profile_id': business_profile_id,
+            'user_id': user_id,
+            'company_id': company_id,
+            'opportunity_type': opportunity_type,
+            'category': category,
+            'title': title,
+            'description': description,
             'financial_impact': {
-                'estimated_value': float(self.estimated_value) if self.estimated_value else None,
-                'value_range': self.value_range,
-                'annual_savings': float(self.annual_savings) if self.annual_savings else None,
-                'one_time_benefit': float(self.one_time_benefit) if self.one_time_benefit else None
+                'estimated_value': float(estimated_value) if estimated_value else None,
+                'value_range': value_range,
+                'annual_savings': float(annual_savings) if annual_savings else None,
+                'one_time_benefit': float(one_time_benefit) if one_time_benefit else None
             },
             'priority': {
-                'level': self.priority,
-                'urgency': self.urgency,
-                'deadline': self.deadline.isoformat() if self.deadline else None
+                'level': priority,
+                'urgency': urgency,
+                'deadline': deadline.isoformat() if deadline else None
             },
             'implementation': {
-                'complexity': self.complexity,
-                'time_required': self.implementation_time,
-                'required_resources': self.required_resources
+                'complexity': complexity,
+                'time_required': implementation_time,
+                'required_resources': required_resources
             },
             'status': {
-                'current': self.status,
-                'progress': self.progress_percentage
+                'current': status,
+                'progress': progress_percentage
             },
             'context': {
-                'business': self.business_context,
-                'regulatory': self.regulatory_context,
-                'market': self.market_context,
-                'notes': self.notes
+                'business': business_context,
+                'regulatory': regulatory_context,
+                'market': market_context,
+                'notes': notes
             },
             'relationships': {
-                'related_opportunities': self.related_opportunities,
-                'prerequisites': self.prerequisites
+                'related_opportunities': related_opportunities,
+                'prerequisites': prerequisites
             },
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'identified_date': self.identified_date.isoformat(),
-            'last_reviewed': self.last_reviewed.isoformat() if self.last_reviewed else None
+            'created_at': created_at.isoformat(),
+            'updated_at': updated_at.isoformat(),
+            'identified_date': identified_date.isoformat(),
+            'last_reviewed': last_reviewed.isoformat() if last_reviewed else None
         }
     
     def update_status(self, new_status, progress_percentage=None, notes=None):
@@ -0,0 +1,61 @@
+from datetime import datetime
+from .user import db
+
+class ResearchJob(db.Model):
+    """Background company research request and its outcome"""
+    __tablename__ = 'research_jobs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    company_name = db.Column(db.String(200), nullable=False)
+    
+    # Job state
+    status = db.Column(db.String(20), default='pending')  # pending, running, completed, failed
+    error = db.Column(db.Text)
+    
+    # Results
+    profile_id = db.Column(db.Integer, db.ForeignKey('business_profiles.id'))
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'))
+    analysis_summary = db.Column(db.JSON)
+    
+    # Metadata
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<ResearchJob {self.id} {self.company_name} ({self.status})>'
+    
+    def to_dict(self):
+        """Convert research job to dictionary"""
+        return {
+            'job_id': self.id,
+            'company_name': self.company_name,
+            'status': self.status,
+            'error': self.error,
+            'profile_id': self.profile_id,
+            'company_id': self.company_id,
+            'analysis_summary': self.analysis_summary,
+            'created_at': self.created_at.isoformat(),
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
+    
+    def mark_running(self):
+        """Mark the job as picked up by a worker"""
+        self.status = 'running'
+        db.session.commit()
+    
+    def mark_completed(self, profile_id, company_id, analysis_summary):
+        """Record the created profile; committed with the caller's transaction"""
+        self.status = 'completed'
+        self.profile_id = profile_id
+        self.company_id = company_id
+        self.analysis_summary = analysis_summary
+        self.completed_at = datetime.utcnow()
+    
+    def mark_failed(self, error):
+        """Record why the job failed"""
+        self.status = 'failed'
+        self.error = error
+        self.completed_at = datetime.utcnow()
+        db.session.commit()
\ No newline at end of file
@@ -1,4 +1,6 @@
 from datetime import datetime, timedelta
+from sqlalchemy import or_
+from sqlalchemy.ext.hybrid import hybrid_property
 from .user import db
 
 class Subscription(db.Model):
@@ -97,13 +99,22 @@ class Subscription(db.Model):
         
         return self.profiles_used_this_period < self.profiles_limit
     
-    def can_generate_report(self):
-        """Check if user can generate a new industry report"""
+    @hybrid_property
+    def has_report_quota(self):
+        """Whether another report fits in this period; also usable as a SQL expression"""
         if self.reports_limit is None:  # Unlimited
             return True
         
         return self.reports_used_this_period < self.reports_limit
     
+    @has_report_quota.expression
+    def has_report_quota(cls):
+        return or_(cls.reports_limit.is_(None), cls.reports_used_this_period < cls.reports_limit)
+    
+    def can_generate_report(self):
+        """Check if user can generate a new industry report"""
+        return self.has_report_quota
+    
     def increment_profile_usage(self):
         """Increment profile usage counter"""
         if self.can_create_profile():
@@ -122,6 +133,17 @@ class Subscription(db.Model):
             return True
         return False
     
+    @classmethod
+    def record_report_usage(cls, subscription_id):
+        """Count a report against the subscription in SQL, without loading it; committed by the caller"""
+        result = db.session.execute(
+            db.update(cls).where(cls.id == subscription_id, cls.has_report_quota).values(
+                reports_used_this_period=cls.reports_used_this_period + 1,
+                updated_at=datetime.utcnow()
+            )
+        )
+        return result.rowcount == 1
+    
     def reset_usage_counters(self):
         """Reset usage counters for new billing period"""
         self.profiles_used_this_period = 0
@@ -1,8 +1,11 @@
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from werkzeug.http import http_date
 from werkzeug.security import generate_password_hash, check_password_hash
 
-db = SQLAlchemy()
+# Keep loaded attributes after commit; sessions are scoped to one request or task, so
+# handlers read back what they just wrote without a refresh SELECT per object
+db = SQLAlchemy(session_options={'expire_on_commit': False})
 
 class User(db.Model):
     """User model for financial advisors"""
@@ -63,10 +66,11 @@ class User(db.Model):
         
         return self.profiles_used_this_month < max_profiles
     
-    def increment_profile_usage(self):
+    def increment_profile_usage(self, commit=True):
         """Increment the profile usage counter"""
         self.profiles_used_this_month += 1
-        db.session.commit()
+        if commit:
+            db.session.commit()
     
     def reset_monthly_usage(self):
         """Reset monthly usage counter (called by scheduler)"""
@@ -85,8 +89,9 @@ class User(db.Model):
             'max_profiles': tier_config.get('profiles_per_month', 0),
             'features': tier_config.get('features', []),
             'profiles_used': self.profiles_used_this_month,
-            'start_date': self.subscription_start_date,
-            'end_date': self.subscription_end_date
+            # Formatted here so the JSON provider can't change the dates' wire format
+            'start_date': http_date(self.subscription_start_date) if self.subscription_start_date else None,
+            'end_date': http_date(self.subscription_end_date) if self.subscription_end_date else None
         }
     
     def to_dict(self):
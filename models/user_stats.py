@@ -0,0 +1,158 @@
+from datetime import datetime
+from sqlalchemy import case, event, func, inspect, select
+from sqlalchemy.orm import Session
+from .user import db
+from .business_profile import BusinessProfile
+from .financial_opportunity import FinancialOpportunity
+from .conversation_starter import ConversationStarter
+
+HIGH_PRIORITIES = ('high', 'critical')
+
+class UserStats(db.Model):
+    """Per-user dashboard counters, kept in step with profile, opportunity and starter writes"""
+    __tablename__ = 'user_stats'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    
+    # Counters
+    profiles_total = db.Column(db.Integer, nullable=False, default=0)
+    active_profiles = db.Column(db.Integer, nullable=False, default=0)
+    opportunities_total = db.Column(db.Integer, nullable=False, default=0)
+    high_priority_opportunities = db.Column(db.Integer, nullable=False, default=0)
+    conversation_starters_total = db.Column(db.Integer, nullable=False, default=0)
+    
+    # Metadata
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<UserStats {self.user_id}>'
+    
+    def to_dict(self):
+        """Convert user stats to dictionary"""
+        return {
+            'total_profiles': self.profiles_total,
+            'active_profiles': self.active_profiles,
+            'total_opportunities': self.opportunities_total,
+            'high_priority_opportunities': self.high_priority_opportunities,
+            'total_conversation_starters': self.conversation_starters_total
+        }
+    
+    @classmethod
+    def rebuild(cls, connection, user_id):
+        """Recount a user's counters from the source tables and store them"""
+        def count(model, condition=None):
+            column = func.count(case((condition, 1))) if condition is not None else func.count(model.id)
+            return select(column).where(model.user_id == user_id).scalar_subquery()
+        
+        counters = {
+            'profiles_total': count(BusinessProfile),
+            'active_profiles': count(BusinessProfile, BusinessProfile.status == 'active'),
+            'opportunities_total': count(FinancialOpportunity),
+            'high_priority_opportunities': count(
+                FinancialOpportunity, FinancialOpportunity.priority.in_(HIGH_PRIORITIES)
+            ),
+            'conversation_starters_total': count(ConversationStarter),
+            'updated_at': datetime.utcnow()
+        }
+        
+        table = cls.__table__
+        connection.execute(table.delete().where(table.c.user_id == user_id))
+        connection.execute(table.insert().values(user_id=user_id, **counters))
+    
+    @classmethod
+    def ensure(cls, connection, user_ids):
+        """Build counters for users without a row, before the flush writes anything"""
+        table = cls.__table__
+        existing = set(connection.execute(
+            select(table.c.user_id).where(table.c.user_id.in_(user_ids))
+        ).scalars())
+        
+        for user_id in set(user_ids) - existing:
+            cls.rebuild(connection, user_id)
+    
+    @classmethod
+    def apply(cls, connection, user_id, **deltas):
+        """Add deltas to a user's counters in the caller's transaction"""
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        
+        table = cls.__table__
+        values = {name: table.c[name] + delta for name, delta in deltas.items()}
+        connection.execute(
+            table.update().where(table.c.user_id == user_id).values(updated_at=datetime.utcnow(), **values)
+        )
+
+_COUNTED_MODELS = (BusinessProfile, FinancialOpportunity, ConversationStarter)
+
+@event.listens_for(Session, 'before_flush')
+def _ensure_user_stats(session, flush_context, instances):
+    """Count missing users from scratch before the flush so recounts never mix with the row deltas"""
+    user_ids = {
+        target.user_id for target in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(target, _COUNTED_MODELS) and target.user_id is not None
+    }
+    if user_ids:
+        UserStats.ensure(session.connection(), user_ids)
+
+@event.listens_for(BusinessProfile.status, 'set', active_history=True)
+@event.listens_for(FinancialOpportunity.priority, 'set', active_history=True)
+def _track_previous(target, value, oldvalue, initiator):
+    """Load the replaced value on assignment so updates know which counter the row left"""
+
+def _previous(target, attribute):
+    """Value an attribute had before the pending flush"""
+    history = inspect(target).attrs[attribute].history
+    return history.deleted[0] if history.deleted else getattr(target, attribute)
+
+def _is_active(status):
+    return 1 if status == 'active' else 0
+
+def _is_high_priority(priority):
+    return 1 if priority in HIGH_PRIORITIES else 0
+
+@event.listens_for(BusinessProfile, 'after_insert')
+def _profile_inserted(mapper, connection, target):
+    UserStats.apply(connection, target.user_id, profiles_total=1, active_profiles=_is_active(target.status))
+
+@event.listens_for(BusinessProfile, 'after_update')
+def _profile_updated(mapper, connection, target):
+    UserStats.apply(
+        connection, target.user_id,
+        active_profiles=_is_active(target.status) - _is_active(_previous(target, 'status'))
+    )
+
+@event.listens_for(BusinessProfile, 'after_delete')
+def _profile_deleted(mapper, connection, target):
+    UserStats.apply(connection, target.user_id, profiles_total=-1, active_profiles=-_is_active(target.status))
+
+@event.listens_for(FinancialOpportunity, 'after_insert')
+def _opportunity_inserted(mapper, connection, target):
+    UserStats.apply(
+        connection, target.user_id,
+        opportunities_total=1, high_priority_opportunities=_is_high_priority(target.priority)
+    )
+
+@event.listens_for(FinancialOpportunity, 'after_update')
+def _opportunity_updated(mapper, connection, target):
+    UserStats.apply(
+        connection, target.user_id,
+        high_priority_opportunities=_is_high_priority(target.priority) - _is_high_priority(
+            _previous(target, 'priority')
+        )
+    )
+
+@event.listens_for(FinancialOpportunity, 'after_delete')
+def _opportunity_deleted(mapper, connection, target):
+    UserStats.apply(
+        connection, target.user_id,
+        opportunities_total=-1, high_priority_opportunities=-_is_high_priority(target.priority)
+    )
+
+@event.listens_for(ConversationStarter, 'after_insert')
+def _starter_inserted(mapper, connection, target):
+    UserStats.apply(connection, target.user_id, conversation_starters_total=1)
+
+@event.listens_for(ConversationStarter, 'after_delete')
+def _starter_deleted(mapper, connection, target):
+    UserStats.apply(connection, target.user_id, conversation_starters_total=-1)
\ No newline at end of file
@@ -0,0 +1,113 @@
+from celery import shared_task
+from models import db, User, Company, BusinessProfile, AuditLog, ComplianceReport, ResearchJob
+from models.compliance_report import REPORT_DAYS
+from datetime import datetime, timedelta
+from flask import current_app
+import logging
+
+logger = logging.getLogger(__name__)
+
+@shared_task(rate_limit='30/m')
+def run_company_research(job_id, ip_address=None, user_agent=None):
+    """Research a company and create the business profile for a queued ResearchJob"""
+    job = ResearchJob.query.get(job_id)
+    if not job:
+        logger.warning(f"Research job {job_id} no longer exists")
+        return
+    
+    job.mark_running()
+    
+    try:
+        user = User.query.get(job.user_id)
+        
+        # Usage may have changed while the job was queued
+        if not user or not user.can_create_profile():
+            job.mark_failed('Profile limit reached for current subscription tier')
+            return
+        
+        # Initialize collectors
+        from data_collectors.company_research import CompanyResearchCollector
+        from analysis.intelligence_analyzer import IntelligenceAnalyzer
+        collector = CompanyResearchCollector()
+        analyzer = IntelligenceAnalyzer()
+        
+        # Collect company data
+        company_data = collector.collect_company_data(job.company_name)
+        
+        if not company_data:
+            job.mark_failed('Company not found or data unavailable')
+            return
+        
+        # Create or update company record; flush for its id and commit with everything else
+        company = Company.query.filter_by(name=job.company_name).first()
+        if not company:
+            company = Company(**company_data)
+            db.session.add(company)
+            db.session.flush()
+        
+        # Analyze company for financial planning opportunities
+        analysis_result = analyzer.analyze_company(company_data)
+        
+        # Create business profile
+        profile = BusinessProfile(
+            user_id=job.user_id,
+            company_id=company.id,
+            profile_name=f"{job.company_name} - Business Profile",
+            profile_type='prospect',
+            primary_planning_needs=analysis_result.get('planning_needs', []),
+            opportunities_identified=analysis_result.get('opportunities', []),
+            conversation_starters=analysis_result.get('conversation_starters', []),
+            recent_developments=analysis_result.get('recent_developments', [])
+        )
+        
+        db.session.add(profile)
+        db.session.flush()
+        
+        # Increment user's profile usage
+        user.increment_profile_usage(commit=False)
+        
+        # Log the activity
+        AuditLog.log_profile_creation(
+            user_id=job.user_id,
+            company_name=job.company_name,
+            data_sources_used=company_data.get('data_sources', []),
+            ip_address=ip_address,
+            user_agent=user_agent,
+            commit=False
+        )
+        
+        job.mark_completed(profile.id, company.id, analysis_result.get('summary', {}))
+        
+        # Company, profile, usage, audit log and job result land in one transaction
+        db.session.commit()
+    
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Research job {job_id} failed: {str(e)}")
+        job.mark_failed(f'Error creating profile: {str(e)}')
+
+@shared_task
+def maintain_audit_log_partitions():
+    """Create upcoming audit log partitions and move partitions past the hot window to cold storage"""
+    with db.engine.begin() as connection:
+        created = AuditLog.ensure_partitions(connection)
+        archived = AuditLog.archive_partitions(
+            connection,
+            hot_days=current_app.config['AUDIT_LOG_HOT_DAYS'],
+            tablespace=current_app.config['AUDIT_LOG_ARCHIVE_TABLESPACE']
+        )
+    
+    if created or archived:
+        logger.info("Audit log partitions created: %s, archived: %s", created, archived)
+
+@shared_task
+def aggregate_compliance_reports():
+    """Roll up each completed day since the last run, so compliance reports only group today's logs live"""
+    yesterday = datetime.utcnow().date() - timedelta(days=1)
+    through = ComplianceReport.rolled_up_through()
+    day = through + timedelta(days=1) if through else yesterday - timedelta(days=REPORT_DAYS - 1)
+    
+    while day <= yesterday:
+        users = ComplianceReport.roll_up_day(day)
+        logger.info("Compliance rollup for %s stored %s users", day, users)
+        day += timedelta(days=1)
\ No newline at end of file
@@ -8,8 +8,15 @@ from datetime import datetime, timedelta
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models.audit_log import AuditLog
+from flask import Flask
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+from models.user import db
+from models.audit_log import AuditLog, AuditLogSource, AuditLogWriter, _partition_months
+from api.compliance import _csv_cell
 from models.user import User
+from models.compliance_report import ComplianceReport
 
 class TestComplianceAutomation(unittest.TestCase):
     """Test compliance automation and regulatory requirements"""
@@ -51,6 +58,197 @@ class TestComplianceAutomation(unittest.TestCase):
             self.assertEqual(audit_log.request_method, 'POST')
             self.assertEqual(audit_log.request_url, 'http://localhost:5000/api/profiles/companies/1/research')
     
+    def test_audit_log_batch_write(self):
+        """Test that queued audit logs are written in a single bulk insert"""
+        writer = AuditLogWriter()
+        writer.app = MagicMock()
+        
+        entries = [
+            AuditLog._data_access_entry(
+                user_id=1,
+                data_sources=['sec_data'],
+                access_method='api',
+                access_url=f'/api/opportunities/opportunities/{opportunity_id}'
+            )
+            for opportunity_id in range(3)
+        ]
+        
+        with patch('models.audit_log.db', self.mock_db):
+            writer._write_batch(entries)
+        
+        self.mock_session.bulk_insert_mappings.assert_called_once_with(AuditLog, entries)
+        self.mock_session.commit.assert_called_once()
+    
+    def test_audit_log_flush_drains_queue_in_batches(self):
+        """Test that flushing writes every queued entry in batch_size inserts"""
+        writer = AuditLogWriter(batch_size=2)
+        writer.app = MagicMock()
+        
+        for opportunity_id in range(5):
+            writer._queue.put(AuditLog._data_access_entry(
+                user_id=1,
+                data_sources=['sec_data'],
+                access_method='api',
+                access_url=f'/api/opportunities/opportunities/{opportunity_id}'
+            ))
+        
+        with patch('models.audit_log.db', self.mock_db):
+            writer.flush()
+        
+        batch_sizes = [len(call.args[1]) for call in self.mock_session.bulk_insert_mappings.call_args_list]
+        self.assertEqual(batch_sizes, [2, 2, 1])
+        self.assertTrue(writer._queue.empty())
+    
+    def test_audit_log_batch_retries_dropped_connection(self):
+        """Test that a batch is retried when the database connection drops"""
+        writer = AuditLogWriter(max_retries=3)
+        writer.app = MagicMock()
+        self.mock_session.commit.side_effect = [OperationalError('INSERT', {}, Exception('gone')), None]
+        entries = [AuditLog._data_access_entry(1, ['sec_data'], 'api', '/api/profiles/companies')]
+        
+        with patch('models.audit_log.db', self.mock_db), patch('models.audit_log.time.sleep') as mock_sleep:
+            writer._write_batch(entries)
+        
+        self.assertEqual(self.mock_session.bulk_insert_mappings.call_count, 2)
+        self.mock_session.rollback.assert_called_once()
+        mock_sleep.assert_called_once()
+    
+    def test_failed_batch_falls_back_to_row_writes(self):
+        """Test that a batch the database rejects is written row by row instead of dropped"""
+        writer = AuditLogWriter()
+        writer.app = MagicMock()
+        self.mock_session.bulk_insert_mappings.side_effect = ValueError('bad entry')
+        self.mock_session.commit.side_effect = [None, ValueError('bad entry')]
+        entries = [
+            AuditLog._data_access_entry(1, ['sec_data'], 'api', '/api/profiles/companies'),
+            AuditLog._data_access_entry(2, ['sec_data'], 'api', '/api/profiles/companies')
+        ]
+        
+        with patch('models.audit_log.db', self.mock_db), \
+             self.assertLogs('models.audit_log.dead_letter', level='ERROR') as dead_letter:
+            writer._write_batch(entries)
+        
+        self.assertEqual(self.mock_session.add.call_count, 2)
+        self.assertEqual(len(dead_letter.records), 1)
+        self.assertEqual(json.loads(dead_letter.records[0].getMessage())['user_id'], 2)
+    
+    def test_full_audit_queue_writes_synchronously(self):
+        """Test that entries are written inline instead of dropped when the queue is full"""
+        writer = AuditLogWriter(max_queue_size=1)
+        writer.app = MagicMock()
+        entry = AuditLog._data_access_entry(1, ['sec_data'], 'api', '/api/profiles/companies')
+        
+        with patch('models.audit_log.db', self.mock_db):
+            writer.enqueue(dict(entry))
+            writer.enqueue(dict(entry))
+        
+        self.assertEqual(writer._queue.qsize(), 1)
+        self.mock_session.bulk_insert_mappings.assert_called_once()
+    
+    def test_report_generation_is_queued(self):
+        """Test that report generation audits go to the background writer without touching the session"""
+        with patch('models.audit_log.db', self.mock_db), \
+             patch('models.audit_log.audit_log_writer') as mock_writer:
+            AuditLog.queue_report_generation(
+                user_id=1,
+                report_type='industry',
+                industry='Technology',
+                data_sources_used=['industry_reports']
+            )
+        
+        entry = mock_writer.enqueue.call_args[0][0]
+        self.assertEqual(entry['action_type'], 'report_generated')
+        self.assertEqual(entry['action_description'], 'Generated industry report for Technology')
+        self.assertEqual(entry['data_sources_used'], ['industry_reports'])
+        self.mock_session.add.assert_not_called()
+        self.mock_session.commit.assert_not_called()
+    
+    def test_audit_log_partitions_cover_each_month(self):
+        """Test that monthly partition bounds are contiguous across a year boundary"""
+        partitions = list(_partition_months(datetime(2024, 11, 15), datetime(2025, 1, 2)))
+        
+        self.assertEqual([name for name, lower, upper in partitions], [
+            'audit_logs_y2024m11', 'audit_logs_y2024m12', 'audit_logs_y2025m01'
+        ])
+        self.assertEqual(partitions[1][1:], (datetime(2024, 12, 1), datetime(2025, 1, 1)))
+    
+    def test_audit_log_partitioning_skips_other_databases(self):
+        """Test that partition maintenance does nothing outside PostgreSQL"""
+        connection = Mock()
+        connection.dialect.name = 'sqlite'
+        
+        self.assertFalse(AuditLog.partition_table(connection))
+        self.assertEqual(AuditLog.ensure_partitions(connection), [])
+        self.assertEqual(AuditLog.archive_partitions(connection), [])
+        connection.execute.assert_not_called()
+    
+    def test_audit_log_archive_keeps_partitions_attached(self):
+        """Test that old partitions are only moved to the archive tablespace, never detached"""
+        connection = MagicMock()
+        connection.dialect = postgresql.dialect()
+        current = datetime.utcnow().strftime('audit_logs_y%Ym%m')
+        connection.execute.return_value.scalars.return_value = ['audit_logs_y2020m01', 'audit_logs_default', current]
+        
+        self.assertEqual(AuditLog.archive_partitions(connection, hot_days=90), [])
+        connection.execute.assert_not_called()
+        
+        archived = AuditLog.archive_partitions(connection, hot_days=90, tablespace='cold')
+        statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+        
+        self.assertEqual(archived, ['audit_logs_y2020m01'])
+        self.assertEqual(statements[-1], 'ALTER TABLE audit_logs_y2020m01 SET TABLESPACE cold')
+        self.assertFalse(any('DETACH' in statement for statement in statements))
+    
+    def test_audit_log_partitions_include_default(self):
+        """Test that a default partition is created so inserts never run out of partitions"""
+        connection = MagicMock()
+        connection.dialect = postgresql.dialect()
+        connection.execute.return_value.scalar.return_value = None
+        connection.execute.return_value.first.side_effect = [(1,), None, None, None]
+        
+        created = AuditLog.ensure_partitions(connection, months_ahead=2)
+        statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+        
+        self.assertEqual(created[0], 'audit_logs_default')
+        self.assertEqual(len(created), 4)
+        self.assertIn('CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT', statements)
+        self.assertFalse(any('DETACH' in statement for statement in statements))
+    
+    def test_audit_log_partition_ddl_quotes_identifiers(self):
+        """Test that a configured tablespace name is quoted rather than pasted into the DDL"""
+        connection = MagicMock()
+        connection.dialect = postgresql.dialect()
+        connection.execute.return_value.scalars.return_value = ['audit_logs_y2020m01']
+        
+        AuditLog.archive_partitions(connection, tablespace='cold; DROP TABLE users')
+        
+        self.assertEqual(
+            str(connection.execute.call_args.args[0]),
+            'ALTER TABLE audit_logs_y2020m01 SET TABLESPACE "cold; DROP TABLE users"'
+        )
+    
+    def test_partition_command_converts_audit_logs(self):
+        """Test that `flask audit-logs partition` runs the one-off conversion"""
+        from app import create_app
+        runner = create_app('testing').test_cli_runner()
+        
+        with patch.object(AuditLog, 'partition_table', return_value=True) as mock_partition:
+            result = runner.invoke(args=['audit-logs', 'partition', '--months-ahead', '3'])
+        
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_partition.call_args.kwargs, {'months_ahead': 3})
+        self.assertIn('partitioned by month', result.output)
+    
+    def test_export_cells_cannot_run_as_formulas(self):
+        """Test that exported text starting like a formula is prefixed so spreadsheets show it as text"""
+        self.assertEqual(_csv_cell('=HYPERLINK("http://evil")'), '\'=HYPERLINK("http://evil")')
+        self.assertEqual(_csv_cell('+1'), "'+1")
+        self.assertEqual(_csv_cell('-2+3'), "'-2+3")
+        self.assertEqual(_csv_cell('@SUM(A1)'), "'@SUM(A1)")
+        self.assertEqual(_csv_cell('Accessed data'), 'Accessed data')
+        self.assertEqual(_csv_cell(-5), -5)
+        self.assertIsNone(_csv_cell(None))
+    
     def test_gdpr_compliance(self):
         """Test GDPR compliance requirements"""
         # Test data minimization
@@ -316,5 +514,168 @@ class TestComplianceReporting(unittest.TestCase):
             self.assertIsInstance(retention, str)
             self.assertGreater(len(retention), 0)
 
+class TestAuditLogTimestamps(unittest.TestCase):
+    """Test that audit log timestamps are stamped by the database"""
+    
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def test_logged_entry_has_server_timestamp(self):
+        """Test that a logged entry carries its database timestamp without a reload"""
+        before = datetime.utcnow().replace(microsecond=0)
+        log_entry = AuditLog.log_profile_creation(1, 'Acme Corp', ['sec_data'])
+        
+        self.assertGreaterEqual(log_entry.created_at, before)
+        self.assertEqual(log_entry.to_dict()['created_at'], log_entry.created_at.isoformat())
+    
+    def test_queued_entry_keeps_action_time(self):
+        """Test that queued entries record when the action happened, not when they were written"""
+        action_time = datetime(2024, 1, 15, 9, 30)
+        writer = AuditLogWriter()
+        writer.app = self.app
+        writer._write_batch([{
+            **AuditLog._data_access_entry(1, ['sec_data'], 'api', '/api/profiles/companies'),
+            'created_at': action_time
+        }])
+        
+        self.assertEqual(db.session.query(AuditLog.created_at).scalar(), action_time)
+    
+    def test_entry_without_writer_uses_own_session(self):
+        """Test that writing outside the application leaves the caller's session alone"""
+        db.session.add(AuditLog(user_id=2, action_type='data_access', action_description='Pending'))
+        AuditLogWriter().enqueue(AuditLog._data_access_entry(1, ['sec_data'], 'api', '/api/profiles/companies'))
+        db.session.rollback()
+        
+        self.assertEqual(db.session.query(AuditLog.user_id).all(), [(1,)])
+    
+    def test_data_sources_are_indexed(self):
+        """Test that logged, queued and backfilled entries all get one source row per data source"""
+        logged = AuditLog.log_profile_creation(1, 'Acme Corp', ['sec_data', 'news_api'])
+        writer = AuditLogWriter()
+        writer.app = self.app
+        writer._write_batch([AuditLog._data_access_entry(1, ['sec_data', 'sec_data'], 'api', '/api/profiles')])
+        queued_id = db.session.query(func.max(AuditLog.id)).scalar()
+        
+        db.session.add(AuditLog(
+            user_id=1, action_type='data_access', action_description='Accessed data', data_sources_used=['linkedin']
+        ))
+        db.session.flush()
+        db.session.query(AuditLogSource).filter_by(source='linkedin').delete()
+        AuditLogSource.index_logs(db.session.connection())
+        db.session.commit()
+        
+        sources = sorted(db.session.query(AuditLogSource.audit_log_id, AuditLogSource.source))
+        self.assertEqual(sources, [
+            (logged.id, 'news_api'), (logged.id, 'sec_data'), (queued_id, 'sec_data'), (queued_id + 1, 'linkedin')
+        ])
+
+class TestComplianceReportRollup(unittest.TestCase):
+    """Test that stored daily rollups and live counts add up to the same report"""
+    
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def _log(self, created_at, sources, access_method='api'):
+        db.session.add(AuditLog(
+            user_id=1, action_type='data_access', action_description='Accessed data',
+            data_sources_used=sources, data_access_method=access_method, created_at=created_at
+        ))
+    
+    def test_rollup_matches_live_counts(self):
+        """Test that rolling up completed days leaves the summarized counts unchanged"""
+        now = datetime.utcnow()
+        today = now.date()
+        self._log(now - timedelta(days=2), ['sec_data', 'news_api'])
+        self._log(now - timedelta(days=2), ['sec_data'], access_method=None)
+        self._log(now - timedelta(days=1), ['linkedin'])
+        self._log(now - timedelta(days=45), ['sec_data'])
+        db.session.commit()
+        
+        start_day = today - timedelta(days=30)
+        live = ComplianceReport.summarize(ComplianceReport.usage_between(1, start_day, now))
+        
+        self.assertEqual(ComplianceReport.roll_up_day(today - timedelta(days=2)), 1)
+        ComplianceReport.roll_up_day(today - timedelta(days=1))
+        self.assertEqual(ComplianceReport.rolled_up_through(), today - timedelta(days=1))
+        
+        db.session.expire_all()
+        rolled_up = ComplianceReport.summarize(ComplianceReport.usage_between(1, start_day, now))
+        
+        self.assertEqual(rolled_up, live)
+        self.assertEqual(rolled_up[1], {'api': 2, 'null': 1})
+        self.assertEqual(rolled_up[2], {'sec_data': 2, 'news_api': 1, 'linkedin': 1})
+
+    def test_rollup_boundary_counts_quiet_days(self):
+        """Test that a day with no activity still moves the rollup boundary"""
+        today = datetime.utcnow().date()
+        
+        self.assertIsNone(ComplianceReport.rolled_up_through())
+        self.assertEqual(ComplianceReport.roll_up_day(today - timedelta(days=1)), 0)
+        self.assertEqual(ComplianceReport.rolled_up_through(), today - timedelta(days=1))
+
+class TestAuditLogEndpoint(unittest.TestCase):
+    """Test paging and error handling of the audit log endpoint"""
+    
+    def setUp(self):
+        from app import create_app
+        from flask_jwt_extended import create_access_token
+        self.app = create_app('testing')
+        self.context = self.app.app_context()
+        self.context.push()
+        db.session.add(User(email='a@example.com', username='a', password_hash='x', first_name='A', last_name='B'))
+        db.session.add_all(
+            AuditLog(user_id=1, action_type='data_access', action_description=f'Access {i}',
+                     data_sources_used=['sec_data'], created_at=datetime(2024, 1, 15, 9, i))
+            for i in range(3)
+        )
+        db.session.commit()
+        self.client = self.app.test_client()
+        self.headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def test_audit_logs_page_and_cursor(self):
+        """Test that a page carries per_page entries and a cursor to the rest"""
+        first = self.client.get('/api/compliance/audit-logs?per_page=2', headers=self.headers).get_json()
+        second = self.client.get(
+            f"/api/compliance/audit-logs?per_page=2&cursor={first['pagination']['next_cursor']}", headers=self.headers
+        ).get_json()
+        
+        self.assertEqual(len(first['audit_logs']), 2)
+        self.assertTrue(first['pagination']['has_next'])
+        self.assertEqual(len(second['audit_logs']), 1)
+        self.assertFalse(second['pagination']['has_next'])
+    
+    def test_audit_logs_database_error_is_500(self):
+        """Test that a failing page query answers 500 rather than a truncated 200"""
+        with patch('sqlalchemy.orm.Query.all', side_effect=OperationalError('SELECT', {}, Exception('gone'))):
+            response = self.client.get('/api/compliance/audit-logs', headers=self.headers)
+        
+        self.assertEqual(response.status_code, 500)
+        self.assertIn('error', response.get_json())
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+from flask import Flask
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.user import db
+from models import ConversationStarter
+
+class TestConversationStarter(unittest.TestCase):
+    """Test conversation starter scoring and bulk usage updates"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _starter(self, **fields):
+        return ConversationStarter(business_profile_id=1, user_id=1, topic='Succession', context='Owner is 64', **fields)
+
+    def test_priority_score_matches_in_sql(self):
+        """Test that sorting by priority score in the database agrees with the Python score"""
+        starters = [
+            self._starter(urgency='high', relevance_score=4, used_count=0),
+            self._starter(urgency='low', relevance_score=10, used_count=3, success_rating=5),
+            self._starter(urgency=None, relevance_score=None, used_count=2, success_rating=None),
+            self._starter(urgency='medium', relevance_score=7, used_count=1, success_rating=2)
+        ]
+        db.session.add_all(starters)
+        db.session.commit()
+
+        scores = dict(db.session.query(ConversationStarter.id, ConversationStarter.priority_score))
+        for starter in starters:
+            self.assertAlmostEqual(scores[starter.id], starter.get_priority_score())
+
+    def test_bulk_mark_used(self):
+        """Test that several starters are marked used in one statement and loaded ones see it"""
+        starters = [self._starter(used_count=0) for _ in range(3)]
+        db.session.add_all(starters)
+        db.session.commit()
+
+        updated = ConversationStarter.bulk_mark_used([starters[0].id, starters[1].id], success_rating=4)
+
+        self.assertEqual(updated, 2)
+        self.assertEqual([starter.used_count for starter in starters], [1, 1, 0])
+        self.assertEqual(starters[0].success_rating, 4)
+        self.assertIsNotNone(starters[1].last_used)
+
+    def test_cached_dict_is_reused_until_marked_used(self):
+        """Test that a starter is serialized once and re-serialized after a bulk update"""
+        starter = self._starter(used_count=0)
+        db.session.add(starter)
+        db.session.commit()
+
+        cached = starter.to_cached_dict()
+        self.assertIs(starter.to_cached_dict(), cached)
+
+        ConversationStarter.bulk_mark_used([starter.id])
+        self.assertEqual(starter.to_cached_dict()['usage']['used_count'], 1)
+
+        starter.add_tag('succession')
+        self.assertEqual(starter.to_cached_dict()['custom']['tags'], ['succession'])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -10,6 +10,7 @@ from data_collectors.sec_data import SECDataCollector
 from data_collectors.linkedin_data import LinkedInDataCollector
 from data_collectors.news_data import NewsDataCollector
 from data_collectors.industry_research import IndustryResearchCollector
+from data_collectors.company_research import CompanyResearchCollector
 
 class TestSECDataCollector(unittest.TestCase):
     """Test SEC data collector compliance and functionality"""
@@ -248,6 +249,49 @@ class TestIndustryResearchCollector(unittest.TestCase):
         for identifier in individual_identifiers:
             self.assertNotIn(identifier, result_str)
 
+class TestCompanyResearchCollector(unittest.TestCase):
+    """Test company research collection across sources"""
+    
+    def setUp(self):
+        self.collector = CompanyResearchCollector()
+    
+    def test_sources_collected_concurrently(self):
+        """Test that slow sources overlap and are merged in source order"""
+        import time
+        
+        def slow(result):
+            def collect(company_name, force_refresh=False):
+                time.sleep(0.2)
+                return result
+            return collect
+        
+        with patch.object(self.collector, '_collect_sec_data', slow({'is_public': True})), \
+             patch.object(self.collector, '_collect_website_data', slow({'website': 'https://example.com'})), \
+             patch.object(self.collector, '_collect_news_data', slow([{'title': 'Expansion'}])):
+            start_time = time.time()
+            company_data = self.collector.collect_company_data('Test Corp')
+            elapsed = time.time() - start_time
+        
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(company_data['data_sources'], [
+            'SEC', 'Company Website', 'LinkedIn', 'News Sources', 'Business Directory'
+        ])
+        self.assertEqual(company_data['website'], 'https://example.com')
+
+    def test_source_results_cached_per_company(self):
+        """Test that repeat lookups reuse a source's result unless a refresh is forced"""
+        with patch.object(self.collector, '_find_company_website', return_value=None), \
+             patch.object(self.collector.session, 'get') as mock_get:
+            mock_get.return_value.content = b'<div class="g"><h3>Expansion</h3><a href="/url?q=https://news.example.com&x"></a></div>'
+            
+            first = self.collector._collect_news_data('Cache Test Corp')
+            second = self.collector._collect_news_data('cache test corp')
+            self.collector._collect_news_data('Cache Test Corp', force_refresh=True)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(first[0]['url'], 'https://news.example.com')
+        self.assertEqual(mock_get.call_count, 2)
+
 class TestDataCollectorIntegration(unittest.TestCase):
     """Integration tests for data collectors"""
     
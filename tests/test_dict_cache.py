@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+from flask import Flask
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.user import db
+from models import BusinessProfile
+
+class TestCachedToDict(unittest.TestCase):
+    """Test that cached model dictionaries never outlive a change to the row"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+        self.profile = BusinessProfile(user_id=1, company_id=1)
+        db.session.add(self.profile)
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_repeated_calls_reuse_dictionary(self):
+        """Test that an unchanged profile is serialized once"""
+        self.assertIs(self.profile.to_cached_dict(), self.profile.to_cached_dict())
+
+    def test_to_dict_returns_independent_dictionaries(self):
+        """Test that a caller changing its to_dict() result can't affect later callers"""
+        self.profile.to_cached_dict()
+        data = self.profile.to_dict()
+        data['status'] = 'changed'
+
+        self.assertIsNot(data, self.profile.to_dict())
+        self.assertEqual(self.profile.to_dict()['status'], 'active')
+        self.assertEqual(self.profile.to_cached_dict()['status'], 'active')
+
+    def test_assignment_invalidates(self):
+        """Test that setting a column is reflected before the next flush"""
+        self.profile.to_cached_dict()
+        self.profile.status = 'archived'
+
+        self.assertEqual(self.profile.to_cached_dict()['status'], 'archived')
+
+    def test_flush_and_expire_invalidate(self):
+        """Test that flush-time values and reloads are picked up"""
+        profile = BusinessProfile(user_id=1, company_id=2)
+        db.session.add(profile)
+        self.assertIsNone(profile.id)
+        db.session.flush()
+
+        self.assertEqual(profile.to_cached_dict()['id'], profile.id)
+
+        cached = profile.to_cached_dict()
+        db.session.expire(profile)
+        self.assertIsNot(profile.to_cached_dict(), cached)
+
+    def test_bulk_append_invalidates_and_persists(self):
+        """Test that appended JSON items are saved in one commit and show up in the dictionary"""
+        self.profile.to_cached_dict()
+        self.profile.add_opportunities_bulk([
+            {'type': 'Tax Optimization', 'description': 'Review entity structure', 'priority': 'high'},
+            {'type': 'Estate Planning', 'description': 'Owner nearing retirement', 'priority': 'medium'}
+        ])
+        self.profile.add_opportunity('Risk Management', 'Key person coverage')
+
+        self.assertEqual(len(self.profile.to_cached_dict()['opportunities']['identified']), 3)
+
+        db.session.expire_all()
+        saved = db.session.get(BusinessProfile, self.profile.id).opportunities_identified
+        self.assertEqual([opportunity['type'] for opportunity in saved], [
+            'Tax Optimization', 'Estate Planning', 'Risk Management'
+        ])
+        self.assertTrue(all('created_at' in opportunity for opportunity in saved))
+
+    def test_priority_opportunities_follow_additions(self):
+        """Test that the filtered priority list is reused until an opportunity is added"""
+        self.profile.add_opportunity('Tax Optimization', 'Review entity structure', priority='high')
+        first = self.profile.get_priority_opportunities()
+        self.assertIs(self.profile.get_priority_opportunities(), first)
+
+        self.profile.add_opportunity('Risk Management', 'Key person coverage', priority='critical')
+        self.profile.add_opportunity('Estate Planning', 'Owner nearing retirement', priority='low')
+
+        self.assertEqual([opportunity['type'] for opportunity in self.profile.get_priority_opportunities()], [
+            'Tax Optimization', 'Risk Management'
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,210 @@
+import unittest
+import sys
+import os
+import json
+from datetime import datetime
+from collections import namedtuple
+from contextlib import contextmanager
+from flask import Flask
+from sqlalchemy import event
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.opportunities import _get_data_sources, _map_company_query, _find_entity, _PERSON_ALIASES
+from api.opportunities import _stream_opportunities, _keyset_page, _decode_cursor, _LIST_KEYSET, _COMPANY_KEYSET, _LIST_COLUMNS
+from models.user import db
+from models import FinancialOpportunity
+from config import Config
+from extensions import compress
+
+_ROW_FIELDS = [column.key for column in _LIST_COLUMNS]
+_Row = namedtuple('Row', _ROW_FIELDS)
+
+class TestReportHelpers(unittest.TestCase):
+    """Test the helpers used to build individual reports"""
+
+    def test_data_sources_all_available(self):
+        """Test that every available source is listed in order"""
+        sources = _get_data_sources(
+            {'name': 'Test Corp'},
+            {'cik': '0000320193'},
+            {'name': 'Test Corp'},
+            [{'title': 'Company News'}]
+        )
+
+        self.assertEqual(sources, [
+            'Company Research Database',
+            'SEC EDGAR Filings',
+            'LinkedIn Company Profiles',
+            'News and Media Sources'
+        ])
+
+    def test_data_sources_skip_errors_and_empty(self):
+        """Test that errored or empty sources are left out"""
+        sources = _get_data_sources(
+            {'error': 'Company not found'},
+            {'cik': '0000320193'},
+            None,
+            []
+        )
+
+        self.assertEqual(sources, ['SEC EDGAR Filings'])
+        self.assertEqual(_get_data_sources(None, None, None, []), [])
+
+class TestCompanyMapping(unittest.TestCase):
+    """Test mapping of search queries to known companies"""
+
+    def test_map_company_query(self):
+        """Test that tickers, misspellings and canonical names map to one company"""
+        self.assertEqual(_map_company_query('NVDA'), 'NVIDIA Corporation')
+        self.assertEqual(_map_company_query('micrsoft'), 'Microsoft Corporation')
+        self.assertEqual(_map_company_query('Alphabet Inc.'), 'Alphabet Inc.')
+        self.assertEqual(_map_company_query('Unknown Widgets'), 'Unknown Widgets')
+
+    def test_find_entity_by_person(self):
+        """Test that executive names resolve to their company"""
+        entity = _find_entity('Tim Cook', _PERSON_ALIASES)
+
+        self.assertEqual(entity['name'], 'Apple Inc.')
+        self.assertEqual(entity['executive']['name'], 'Tim Cook')
+        self.assertIsNone(_find_entity('Unknown Person', _PERSON_ALIASES))
+
+class TestOpportunityStreaming(unittest.TestCase):
+    """Test streaming and keyset pagination of opportunity lists"""
+
+    def _row(self, opportunity_id, title, created_at):
+        values = dict.fromkeys(_ROW_FIELDS)
+        values.update(id=opportunity_id, title=title, created_at=created_at,
+                      updated_at=created_at, identified_date=created_at)
+        return _Row(**values)
+
+    def test_stream_opportunities_full_page(self):
+        """Test that a full page streams its rows and a cursor for the last one"""
+        rows = [
+            self._row(2, 'Tax Optimization', datetime(2024, 5, 2, 9, 30)),
+            self._row(1, 'Succession Plan', datetime(2024, 5, 1, 8, 0))
+        ]
+
+        app = Flask(__name__)
+        with app.test_request_context():
+            response = _stream_opportunities(rows, _LIST_KEYSET, 2)
+            body = response.get_data()
+
+        self.assertEqual(response.mimetype, 'application/json')
+        data = json.loads(body)
+        self.assertEqual([(opp['id'], opp['title']) for opp in data['opportunities']],
+                         [(2, 'Tax Optimization'), (1, 'Succession Plan')])
+        self.assertEqual(data['opportunities'][1]['created_at'], '2024-05-01T08:00:00')
+        self.assertEqual(data['next_cursor'], '2024-05-01T08:00:00,1')
+
+    def test_stream_opportunities_last_page(self):
+        """Test that a short or empty page has no next cursor"""
+        app = Flask(__name__)
+        with app.test_request_context():
+            body = _stream_opportunities([], _LIST_KEYSET, 50).get_data()
+
+        self.assertEqual(json.loads(body), {'opportunities': [], 'next_cursor': None})
+
+    def test_stream_opportunities_not_buffered_by_compression(self):
+        """Test that a client accepting br still gets the page as a stream"""
+        rows = [self._row(i, 'Tax Optimization', datetime(2024, 5, 1, 8, 0)) for i in range(50, 0, -1)]
+
+        app = Flask(__name__)
+        app.config.from_object(Config)
+        compress.init_app(app)
+        app.add_url_rule('/opportunities', 'opportunities', lambda: _stream_opportunities(rows, _LIST_KEYSET, 50))
+
+        response = app.test_client().get('/opportunities', headers={'Accept-Encoding': 'br'})
+
+        self.assertTrue(response.is_streamed)
+        self.assertIsNone(response.content_encoding)
+        self.assertEqual(len(json.loads(response.get_data())['opportunities']), 50)
+
+    def test_decode_cursor(self):
+        """Test that cursors round-trip and malformed ones are rejected"""
+        self.assertEqual(
+            _decode_cursor('high,2024-05-01T08:00:00,7', _COMPANY_KEYSET),
+            ['high', datetime(2024, 5, 1, 8, 0), 7]
+        )
+        with self.assertRaises(ValueError):
+            _decode_cursor('2024-05-01T08:00:00', _LIST_KEYSET)
+        with self.assertRaises(ValueError):
+            _decode_cursor('yesterday,7', _LIST_KEYSET)
+
+@contextmanager
+def count_queries(engine):
+    """Collect every SQL statement executed on the engine inside the block"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+class TestOpportunityQueryBudget(unittest.TestCase):
+    """Pin the number of SQL statements the opportunity list path may issue"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.test_request_context()
+        self.context.push()
+        db.create_all()
+
+        created_at = datetime(2024, 5, 1, 8, 0)
+        db.session.add_all([
+            FinancialOpportunity(
+                business_profile_id=1,
+                user_id=1,
+                company_id=1,
+                opportunity_type='Tax Optimization',
+                title=f'Opportunity {index}',
+                priority='high' if index % 2 else 'medium',
+                created_at=created_at,
+                updated_at=created_at,
+                identified_date=created_at
+            )
+            for index in range(25)
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_list_page_is_one_query(self):
+        """Test that serializing a page costs one SELECT regardless of its size"""
+        query = db.session.query(*_LIST_COLUMNS).filter_by(company_id=1)
+
+        with count_queries(db.engine) as statements:
+            body = _stream_opportunities(_keyset_page(query, _COMPANY_KEYSET, None, 20), _COMPANY_KEYSET, 20).get_data()
+
+        self.assertEqual(len(json.loads(body)['opportunities']), 20)
+        self.assertLessEqual(len(statements), 1)
+
+    def test_next_page_is_one_query(self):
+        """Test that following a cursor costs one SELECT and returns the remaining rows"""
+        query = db.session.query(*_LIST_COLUMNS).filter_by(company_id=1)
+        first_page = json.loads(
+            _stream_opportunities(_keyset_page(query, _COMPANY_KEYSET, None, 20), _COMPANY_KEYSET, 20).get_data()
+        )
+
+        with count_queries(db.engine) as statements:
+            body = _stream_opportunities(
+                _keyset_page(query, _COMPANY_KEYSET, first_page['next_cursor'], 20), _COMPANY_KEYSET, 20
+            ).get_data()
+
+        data = json.loads(body)
+        self.assertEqual(len(data['opportunities']), 5)
+        self.assertIsNone(data['next_cursor'])
+        self.assertLessEqual(len(statements), 1)
+
+if __name__ == '__main__':
+    unittest.main()
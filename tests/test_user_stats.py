@@ -0,0 +1,109 @@
+import unittest
+import sys
+import os
+from flask import Flask
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.user import db
+from models import BusinessProfile, FinancialOpportunity, ConversationStarter, UserStats
+from api.opportunities import _add_opportunities
+
+class TestUserStatsRollup(unittest.TestCase):
+    """Test that the dashboard counters follow profile, opportunity and starter writes"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _stats(self):
+        db.session.expire_all()
+        return db.session.get(UserStats, 1).to_dict()
+
+    def _opportunity(self, priority):
+        return FinancialOpportunity(
+            business_profile_id=1, user_id=1, opportunity_type='Tax Optimization', title='Review', priority=priority
+        )
+
+    def test_inserts_increment_counters(self):
+        """Test that new rows are counted in the same transaction"""
+        db.session.add_all([
+            BusinessProfile(user_id=1, company_id=1),
+            BusinessProfile(user_id=1, company_id=2, status='archived'),
+            self._opportunity('critical'),
+            self._opportunity('low'),
+            ConversationStarter(business_profile_id=1, user_id=1, topic='Succession', context='Owner is 64')
+        ])
+        db.session.commit()
+
+        self.assertEqual(self._stats(), {
+            'total_profiles': 2,
+            'active_profiles': 1,
+            'total_opportunities': 2,
+            'high_priority_opportunities': 1,
+            'total_conversation_starters': 1
+        })
+
+    def test_updates_and_deletes_adjust_counters(self):
+        """Test that status, priority changes and deletes move the counters"""
+        profile = BusinessProfile(user_id=1, company_id=1)
+        opportunity = self._opportunity('medium')
+        db.session.add_all([profile, opportunity])
+        db.session.commit()
+
+        profile.status = 'archived'
+        opportunity.priority = 'high'
+        db.session.commit()
+
+        stats = self._stats()
+        self.assertEqual(stats['active_profiles'], 0)
+        self.assertEqual(stats['high_priority_opportunities'], 1)
+
+        db.session.delete(opportunity)
+        db.session.commit()
+
+        stats = self._stats()
+        self.assertEqual(stats['total_opportunities'], 0)
+        self.assertEqual(stats['high_priority_opportunities'], 0)
+
+    def test_missing_row_is_rebuilt_from_source_tables(self):
+        """Test that rows written before the rollup existed are counted on first use"""
+        db.session.add_all([BusinessProfile(user_id=1, company_id=1), BusinessProfile(user_id=1, company_id=2)])
+        db.session.commit()
+        db.session.query(UserStats).delete()
+        db.session.commit()
+
+        db.session.add(BusinessProfile(user_id=1, company_id=3))
+        db.session.commit()
+
+        self.assertEqual(self._stats()['total_profiles'], 3)
+        self.assertEqual(self._stats()['active_profiles'], 3)
+
+    def test_generated_opportunities_are_counted(self):
+        """Test that opportunities added by the generate endpoint move the counters"""
+        profile = BusinessProfile(user_id=1, company_id=1)
+        db.session.add(profile)
+        db.session.commit()
+
+        _add_opportunities(profile, [
+            {'type': 'Tax Optimization', 'title': 'Review entity structure', 'description': 'S-corp', 'priority': 'high'},
+            {'type': 'Retirement Planning', 'title': 'Add a 401(k)', 'description': 'No plan', 'priority': 'low'}
+        ])
+        db.session.commit()
+
+        stats = self._stats()
+        self.assertEqual(stats['total_opportunities'], 2)
+        self.assertEqual(stats['high_priority_opportunities'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file